@@ -0,0 +1,40 @@
+"""Add server default for deal_consents.agreed_at
+
+Revision ID: 035_consent_agreed_at_default
+Revises: 034_add_deal_invoices
+Create Date: 2026-10-17 10:00:00.000000
+
+agreed_at is now set by the database on INSERT (DEFAULT now()),
+so the API no longer builds the timestamp in Python.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '035_consent_agreed_at_default'
+down_revision: Union[str, None] = '034_add_deal_invoices'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'deal_consents',
+        'agreed_at',
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=False,
+        server_default=sa.text('now()'),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'deal_consents',
+        'agreed_at',
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=False,
+        server_default=None,
+    )
@@ -0,0 +1,49 @@
+"""Allow at most one pending split adjustment per deal
+
+Revision ID: 037_split_adjustments_pending_uq
+Revises: 035_consent_agreed_at_default
+Create Date: 2026-10-17 12:00:00.000000
+
+Partial unique index on split_adjustments(deal_id) WHERE status = 'pending'.
+Lets request_split_adjustment use INSERT ... ON CONFLICT DO NOTHING instead
+of a racy SELECT-then-INSERT.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '037_split_adjustments_pending_uq'
+down_revision: Union[str, None] = '035_consent_agreed_at_default'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Expire older duplicates left by the previous check-then-insert race,
+    # keeping the most recent pending adjustment per deal
+    op.execute("""
+        UPDATE split_adjustments sa
+        SET status = 'expired', resolved_at = now()
+        WHERE sa.status = 'pending'
+          AND EXISTS (
+              SELECT 1 FROM split_adjustments newer
+              WHERE newer.deal_id = sa.deal_id
+                AND newer.status = 'pending'
+                AND (newer.created_at, newer.id) > (sa.created_at, sa.id)
+          )
+    """)
+
+    op.create_index(
+        'uq_split_adjustments_deal_pending',
+        'split_adjustments',
+        ['deal_id'],
+        unique=True,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_split_adjustments_deal_pending', 'split_adjustments')
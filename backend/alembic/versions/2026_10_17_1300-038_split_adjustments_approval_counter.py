@@ -0,0 +1,51 @@
+"""Add approved_user_ids / approvals_count to split_adjustments
+
+Revision ID: 038_split_adjustments_approval_counter
+Revises: 037_split_adjustments_pending_uq
+Create Date: 2026-10-17 13:00:00.000000
+
+Denormalizes the approvals JSONB list so the approve UPDATE can check
+"already approved" with = ANY(...) and completion with an integer compare.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '038_split_adjustments_approval_counter'
+down_revision: Union[str, None] = '037_split_adjustments_pending_uq'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'split_adjustments',
+        sa.Column('approved_user_ids', postgresql.ARRAY(sa.Integer()), server_default='{}', nullable=False),
+    )
+    op.add_column(
+        'split_adjustments',
+        sa.Column('approvals_count', sa.Integer(), server_default='0', nullable=False),
+    )
+
+    # Backfill from existing approvals
+    op.execute("""
+        UPDATE split_adjustments
+        SET approved_user_ids = ARRAY(
+                SELECT DISTINCT (a->>'user_id')::int
+                FROM jsonb_array_elements(approvals) a
+            ),
+            approvals_count = (
+                SELECT count(DISTINCT a->>'user_id')
+                FROM jsonb_array_elements(approvals) a
+            )
+        WHERE approvals IS NOT NULL AND jsonb_array_length(approvals) > 0
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('split_adjustments', 'approvals_count')
+    op.drop_column('split_adjustments', 'approved_user_ids')
@@ -0,0 +1,32 @@
+"""Add (deal_id, created_at DESC) index on split_adjustments
+
+Revision ID: 039_split_adjustments_deal_created_idx
+Revises: 038_split_adjustments_approval_counter
+Create Date: 2026-10-17 14:00:00.000000
+
+Matches list_split_adjustments (WHERE deal_id = ? ORDER BY created_at DESC)
+so the listing is an index range scan without a sort step.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '039_split_adjustments_deal_created_idx'
+down_revision: Union[str, None] = '038_split_adjustments_approval_counter'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_split_adjustments_deal_created',
+        'split_adjustments',
+        ['deal_id', sa.text('created_at DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_split_adjustments_deal_created', 'split_adjustments')
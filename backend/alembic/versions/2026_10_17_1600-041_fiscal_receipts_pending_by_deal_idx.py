@@ -0,0 +1,34 @@
+"""Add partial (deal_id, created_at DESC) index for pending fiscal receipts
+
+Revision ID: 041_fiscal_receipts_pending_by_deal_idx
+Revises: 039_split_adjustments_deal_created_idx
+Create Date: 2026-10-17 16:00:00.000000
+
+Serves the T-Bank Checks webhook fallback lookup (latest pending receipt of
+a deal) as an index range scan with no sort. external_id already has
+ix_fiscal_receipts_external_id from 025.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '041_fiscal_receipts_pending_by_deal_idx'
+down_revision: Union[str, None] = '039_split_adjustments_deal_created_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_fiscal_receipts_pending_by_deal',
+        'fiscal_receipts',
+        ['deal_id', sa.text('created_at DESC')],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_fiscal_receipts_pending_by_deal', 'fiscal_receipts')
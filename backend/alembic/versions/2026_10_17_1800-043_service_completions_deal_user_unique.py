@@ -0,0 +1,39 @@
+"""Make service completions unique per (deal_id, confirmed_by_user_id)
+
+Revision ID: 043_service_completions_deal_user_unique
+Revises: 041_fiscal_receipts_pending_by_deal_idx
+Create Date: 2026-10-17 18:00:00.000000
+
+confirm_service_completion inserts with ON CONFLICT DO NOTHING against this
+constraint instead of selecting for an existing confirmation first. Any
+duplicates left by concurrent confirmations are collapsed to the earliest.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '043_service_completions_deal_user_unique'
+down_revision: Union[str, None] = '041_fiscal_receipts_pending_by_deal_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        DELETE FROM service_completions sc
+        USING service_completions earlier
+        WHERE sc.deal_id = earlier.deal_id
+          AND sc.confirmed_by_user_id = earlier.confirmed_by_user_id
+          AND (sc.confirmed_at, sc.id) > (earlier.confirmed_at, earlier.id)
+    """)
+    op.create_unique_constraint(
+        'uq_service_completions_deal_user',
+        'service_completions',
+        ['deal_id', 'confirmed_by_user_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_service_completions_deal_user', 'service_completions', type_='unique')
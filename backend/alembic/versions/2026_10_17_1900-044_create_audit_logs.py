@@ -0,0 +1,47 @@
+"""Create audit_logs table
+
+Revision ID: 044_create_audit_logs
+Revises: 043_service_completions_deal_user_unique
+Create Date: 2026-10-17 19:00:00.000000
+
+AuditLog (app/models/document.py) had no migration. send-payment-link now
+records each SMS delivery outcome there.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = '044_create_audit_logs'
+down_revision: Union[str, None] = '043_service_completions_deal_user_unique'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'audit_logs',
+        sa.Column('id', UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+        sa.Column('created_at', sa.DateTime, server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime, server_default=sa.text('now()'), nullable=False),
+        sa.Column('entity_type', sa.String(50), nullable=False),
+        sa.Column('entity_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('action', sa.String(100), nullable=False),
+        sa.Column('actor_user_id', sa.Integer, sa.ForeignKey('users.id'), nullable=True),
+        sa.Column('meta', JSONB, nullable=True),
+        sa.Column('ip_address', sa.String(45), nullable=True),
+        sa.Column('user_agent', sa.Text, nullable=True),
+    )
+    op.create_index('ix_audit_logs_id', 'audit_logs', ['id'])
+    op.create_index('ix_audit_logs_entity_type', 'audit_logs', ['entity_type'])
+    op.create_index('ix_audit_logs_entity_id', 'audit_logs', ['entity_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_logs_entity_id', 'audit_logs')
+    op.drop_index('ix_audit_logs_entity_type', 'audit_logs')
+    op.drop_index('ix_audit_logs_id', 'audit_logs')
+    op.drop_table('audit_logs')
@@ -1,11 +1,13 @@
 """API dependencies"""
 
-from typing import Optional
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import NoReturn, Optional
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import decode_token, get_token_from_request
@@ -13,6 +15,9 @@ from app.db.session import get_db
 from app.models.user import User
 from app.models.deal import Deal
 from app.models.organization import OrganizationMember
+from app.services.bank_split.deal_service import BankSplitDealService
+from app.services.bank_split.milestone_service import MilestoneService
+from app.services.deal.service import DealService
 from app.services.user.service import UserService
 
 security = HTTPBearer(auto_error=False)  # Don't auto-error, we check cookies too
@@ -122,10 +127,118 @@ def require_deal_access(deal: Deal, user: User) -> None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied to this deal")
 
 
+_OWNER_ONLY_DETAIL = "Only deal creator can perform this action"
+
+
 def require_deal_owner(deal: Deal, user: User) -> None:
     """Raise 403 if user is not deal creator"""
     if deal.created_by_user_id != user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only deal creator can perform this action")
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=_OWNER_ONLY_DETAIL)
+
+
+def deal_participant_filter(user_id: int):
+    """SQL condition: user is deal creator or agent (mirrors check_deal_access)"""
+    return or_(Deal.created_by_user_id == user_id, Deal.agent_user_id == user_id)
+
+
+async def raise_deal_not_found_or_forbidden(
+    db: AsyncSession, deal_id: UUID, detail: str = "Access denied"
+) -> NoReturn:
+    """Called after an access-filtered query returned nothing: 404 if deal is missing, else 403"""
+    stmt = select(Deal.id).where(Deal.id == deal_id, Deal.deleted_at.is_(None))
+    if (await db.execute(stmt)).first() is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+
+
+async def fetch_deal_with_access(db: AsyncSession, deal_id: UUID, user_id: int) -> Deal:
+    """Load deal and check participant access in a single query.
+
+    Raises 404 if deal not found, 403 if user is not deal creator or agent.
+    """
+    stmt = select(Deal).where(
+        Deal.id == deal_id,
+        Deal.deleted_at.is_(None),
+        deal_participant_filter(user_id),
+    )
+    deal = (await db.execute(stmt)).scalar_one_or_none()
+    if deal is None:
+        await raise_deal_not_found_or_forbidden(db, deal_id)
+    return deal
+
+
+@dataclass(frozen=True)
+class DealAuthContext:
+    """Deal columns needed for participant-level authorization"""
+    id: UUID
+    status: str
+    created_by_user_id: int
+    agent_user_id: Optional[int]
+    commission_agent: Optional[Decimal]
+
+
+async def require_deal_participant(
+    deal_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> DealAuthContext:
+    """Check that current user is deal creator or agent with a narrow projection.
+
+    Raises 404 if deal not found, 403 if user is not a participant.
+    """
+    stmt = select(
+        Deal.id,
+        Deal.status,
+        Deal.created_by_user_id,
+        Deal.agent_user_id,
+        Deal.commission_agent,
+    ).where(
+        Deal.id == deal_id,
+        Deal.deleted_at.is_(None),
+        deal_participant_filter(current_user.id),
+    )
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        await raise_deal_not_found_or_forbidden(db, deal_id)
+    return DealAuthContext(**row._asdict())
+
+
+def get_milestone_service(db: AsyncSession = Depends(get_db)) -> MilestoneService:
+    """Request-scoped MilestoneService (shared via the dependency cache)"""
+    return MilestoneService(db)
+
+
+async def get_deal_for_owner(
+    deal_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Deal:
+    """Load bank-split deal (with invoices) and require current user to be its creator.
+
+    The creator check is part of the query. Raises 404 if deal not found,
+    403 if user is not deal creator.
+    """
+    deal = await BankSplitDealService(db).get_deal_for_user(
+        deal_id, current_user.id, as_creator=True, load=("invoices",)
+    )
+    if deal is None:
+        await raise_deal_not_found_or_forbidden(db, deal_id, _OWNER_ONLY_DETAIL)
+    return deal
+
+
+async def get_owned_deal(
+    deal_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Deal:
+    """Load deal (with parties and terms) only if current user is its creator.
+
+    Raises 404 if deal not found, 403 if user is not deal creator.
+    """
+    deal = await DealService(db).get_by_id(deal_id, created_by_user_id=current_user.id)
+    if deal is None:
+        await raise_deal_not_found_or_forbidden(db, deal_id, _OWNER_ONLY_DETAIL)
+    return deal
 
 
 async def check_org_membership(org_id: UUID, user: User, db: AsyncSession) -> Optional[OrganizationMember]:
@@ -15,6 +15,7 @@ from app.models.document import Document, SigningToken, Signature
 from app.models.deal import Deal, DealStatus
 from app.services.signature.service import SignatureService
 from app.services.bank_split.deal_service import BankSplitDealService
+from app.services.dispute import DisputeService
 from app.core.config import settings
 from app.core.audit import log_audit_event, AuditEvent
 
@@ -522,8 +523,6 @@ async def create_public_dispute(
     user_agent = request.headers.get("user-agent")
 
     # Create dispute using DisputeService
-    from app.services.dispute import DisputeService
-
     dispute_service = DisputeService(db)
 
     # Use a special user_id for public disputes (client)
@@ -17,6 +17,7 @@ from app.models.deal import Deal
 from app.models.dispute import Dispute
 from app.models.bank_split import DealSplitRecipient
 from app.services.analytics import AnalyticsService, ExportService, ExportFormat
+from app.services.bank_split.webhook_service import WebhookService
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -633,8 +634,6 @@ async def list_dlq_entries(
     """
     require_admin(current_user)
 
-    from app.services.bank_split.webhook_service import WebhookService
-
     webhook_service = WebhookService(db)
     entries, total = await webhook_service.get_dlq_entries(
         resolved=resolved,
@@ -673,8 +672,6 @@ async def get_dlq_entry(
     """
     require_admin(current_user)
 
-    from app.services.bank_split.webhook_service import WebhookService
-
     webhook_service = WebhookService(db)
     entry = await webhook_service.get_dlq_entry(dlq_id)
 
@@ -712,8 +709,6 @@ async def retry_dlq_entry(
     """
     require_admin(current_user)
 
-    from app.services.bank_split.webhook_service import WebhookService
-
     webhook_service = WebhookService(db)
 
     try:
@@ -747,8 +742,6 @@ async def resolve_dlq_entry(
     """
     require_admin(current_user)
 
-    from app.services.bank_split.webhook_service import WebhookService
-
     webhook_service = WebhookService(db)
 
     try:
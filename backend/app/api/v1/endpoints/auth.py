@@ -288,7 +288,7 @@ async def register_agency(request: AgencyRegisterRequest, http_request: Request,
 # ==========================================
 
 from datetime import datetime
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, or_
 from app.models.organization import PendingEmployee, EmployeeInviteStatus, OrganizationMember, Organization
 from app.schemas.organization import EmployeeInvitePublicInfo, EmployeeRegisterRequest
 from app.models.user import User, UserRole
@@ -369,7 +369,6 @@ async def register_employee(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Приглашение уже использовано")
 
     # Check if user already exists with this phone
-    from sqlalchemy import or_
     stmt = select(User).where(
         or_(
             User.phone == invitation.phone,
@@ -1,17 +1,48 @@
 """Bank Split API endpoints"""
 
+import asyncio
+import hashlib
 import logging
+from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NoReturn, Optional, Type
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, status, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import and_, case, func, literal, not_, or_, select, update
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
+from app.api.deps import (
+    DealAuthContext,
+    get_current_user,
+    get_milestone_service,
+    require_deal_participant,
+    get_deal_for_owner,
+    deal_participant_filter,
+    fetch_deal_with_access,
+    raise_deal_not_found_or_forbidden,
+)
+from app.api.routing import ORJSONRoute
 from app.core.config import settings
+from app.core.encryption import (
+    encrypt_passport,
+    encrypt_passport_issued_by,
+    encrypt_name,
+    decrypt_name,
+    decrypt_passport,
+    decrypt_passport_issued_by,
+    hash_passport,
+)
 from app.core.feature_flags import is_instant_split_enabled
-from app.db.session import get_db
+from app.core.security import utc_now
+from app.db.session import get_db, async_session_maker
+from app.models.deal import Deal
 from app.models.user import User
 from app.schemas.bank_split import (
     BankSplitDealCreate,
@@ -21,6 +52,7 @@ from app.schemas.bank_split import (
     CreateInvoiceRequest,
     CreateInvoiceResponse,
     RegeneratePaymentLinkResponse,
+    TBankChecksWebhookPayload,
     TBankWebhookPayload,
     WebhookResponse,
     DealStatusTransition,
@@ -36,32 +68,136 @@ from app.schemas.bank_split import (
     InvoiceListResponse,
     InvoiceListItem,
     PaymentSummaryResponse,
+    PaymentInfoResponse,
+    # Milestone schemas
+    CreateMilestonesRequest,
+    MilestoneResponse,
+    MilestoneListResponse,
+    MilestoneReleaseRequest,
+    MilestoneReleaseResponse,
+    MilestoneConfirmRequest,
+    MilestoneConfirmResponse,
+    # Client passport schemas
+    ClientPassportUpdate,
+    ClientPassportResponse,
+    # Contract schemas
+    ContractResponse,
+    ContractListResponse,
+)
+from app.schemas.split_adjustment import (
+    SplitAdjustmentCreate,
+    SplitAdjustmentReject,
+    SplitAdjustmentApproveResponse,
+    SplitAdjustmentRejectResponse,
+    SplitAdjustmentListResponse,
 )
 from app.services.bank_split import (
     BankSplitDealService,
     SplitService,
     InvoiceService,
 )
+from app.services.bank_split.completion_service import ServiceCompletionService
 from app.services.bank_split.deal_invoice_service import DealInvoiceService
 from app.services.bank_split.deal_service import CreateBankSplitDealInput
+from app.services.bank_split.milestone_service import (
+    MilestoneService,
+    milestone_summary_cache,
+    MilestoneConfig,
+    DEFAULT_MILESTONE_CONFIGS,
+)
+from app.services.bank_split.payment_info_cache import payment_info_cache
+from app.services.bank_split.webhook_service import (
+    verify_webhook_signature,
+    webhook_idempotency_cache,
+    WebhookService,
+)
+from app.services.contract import ContractGenerationService
+from app.services.inn import INNValidationService
+from app.services.notification.service import notification_service
+from app.services.sms.provider import get_sms_provider
 from app.integrations.tbank.webhooks import TBankWebhookHandler
-from app.models.bank_split import BankEvent, PayoutStatus
+from app.models.bank_split import BankEvent, DealSplitRecipient, PayoutStatus, ReleaseTrigger
+from app.models.consent import ConsentType, DealConsent, CONSENT_TEXTS
+from app.models.document import AuditLog, TemplateType
+from app.models.fiscalization import FiscalReceipt, FiscalReceiptStatus
+from app.models.split_adjustment import SplitAdjustment
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
+
+# Required consents for bank-split deals (T-Bank nominal account model)
+_REQUIRED_BANK_SPLIT_CONSENTS = (
+    ConsentType.PLATFORM_FEE_DEDUCTION.value,
+    ConsentType.DATA_PROCESSING.value,
+    ConsentType.TERMS_OF_SERVICE.value,
+    ConsentType.BANK_PAYMENT_PROCESSING.value,
+    ConsentType.SERVICE_CONFIRMATION_REQUIRED.value,
+    ConsentType.HOLD_PERIOD_ACCEPTANCE.value,
+)
+
+# Consent type values: ordered list for error messages, frozenset for lookups
+_CONSENT_TYPE_VALUES = [t.value for t in ConsentType]
+_VALID_CONSENT_TYPES = frozenset(_CONSENT_TYPE_VALUES)
+
+# send_payment_link SMS text and masked recipient for the response
+_PAYMENT_LINK_SMS_TEMPLATE = "Housler: ссылка для оплаты комиссии по сделке {address}... - {url}"
+_MASKED_PHONE_TEMPLATE = "+7 (***) ***-**-{last2}"
+
+# Contract type lookup built once at import (no enum call / ValueError per request)
+_TEMPLATE_TYPES = MappingProxyType({t.value: t for t in TemplateType})
+
+
+def _json_response(payload, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Encode a response payload directly, skipping FastAPI's jsonable_encoder.
+
+    Pydantic models are serialized in a single pydantic-core pass
+    (model_dump_json). Plain payloads go through orjson; models nested in
+    them must be dumped with model_dump(mode="json") so the output matches
+    what FastAPI renders for a response_model (e.g. Decimal as string).
+    """
+    if isinstance(payload, BaseModel):
+        content = payload.model_dump_json()
+    else:
+        content = orjson.dumps(payload)
+    return Response(
+        content=content,
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+@lru_cache(maxsize=None)
+def _response_fields(model: Type[BaseModel], overridden: frozenset) -> tuple[str, ...]:
+    """Field names a response model reads from the ORM row, resolved once per call shape"""
+    return tuple(name for name in model.model_fields if name not in overridden)
+
+
+def _construct_response(model: Type[BaseModel], obj, **values) -> BaseModel:
+    """Build a response model from an ORM row without re-validating DB values"""
+    fields = {name: getattr(obj, name) for name in _response_fields(model, frozenset(values))}
+    return model.model_construct(**fields, **values)
+
+
+@lru_cache(maxsize=4096)
+def _platform_fee(commission_agent: str, fee_percent_setting: float) -> tuple[Decimal, Decimal, Decimal]:
+    """Fee values per (commission, fee setting); keyed on str so 100 and 100.00 stay distinct"""
+    commission = Decimal(commission_agent)
+    fee_percent = Decimal(str(fee_percent_setting))
+    fee_amount = (commission * fee_percent / Decimal("100")).quantize(Decimal("0.01"))
+    return fee_percent, fee_amount, commission + fee_amount
 
 
 def compute_platform_fee(commission_agent: Decimal) -> tuple[Decimal, Decimal, Decimal]:
     """
     Compute platform fee values.
 
+    Results are memoized per commission amount and PLATFORM_FEE_PERCENT.
+
     Returns:
         tuple: (platform_fee_percent, platform_fee_amount, total_client_payment)
     """
-    fee_percent = Decimal(str(settings.PLATFORM_FEE_PERCENT))
-    fee_amount = (commission_agent * fee_percent / Decimal("100")).quantize(Decimal("0.01"))
-    total_payment = commission_agent + fee_amount
-    return fee_percent, fee_amount, total_payment
+    return _platform_fee(str(commission_agent), settings.PLATFORM_FEE_PERCENT)
 
 
 # ============================================
@@ -69,6 +205,19 @@ def compute_platform_fee(commission_agent: Decimal) -> tuple[Decimal, Decimal, D
 # ============================================
 
 
+def _deal_response(deal: Deal, recipients) -> BankSplitDealResponse:
+    """BankSplitDealResponse built from ORM rows without re-validation"""
+    fee_percent, fee_amount, total_payment = compute_platform_fee(deal.commission_agent)
+    return _construct_response(
+        BankSplitDealResponse,
+        deal,
+        platform_fee_percent=fee_percent,
+        platform_fee_amount=fee_amount,
+        total_client_payment=total_payment,
+        recipients=[_construct_response(SplitRecipientResponse, r) for r in recipients],
+    )
+
+
 @router.post("", response_model=BankSplitDealResponse, status_code=status.HTTP_201_CREATED)
 async def create_bank_split_deal(
     deal_in: BankSplitDealCreate,
@@ -107,49 +256,9 @@ async def create_bank_split_deal(
         await db.commit()
 
         # Build response with recipients
-        recipients = [
-            SplitRecipientResponse(
-                id=r.id,
-                deal_id=r.deal_id,
-                role=r.role,
-                split_type=r.split_type,
-                split_value=r.split_value,
-                user_id=r.user_id,
-                organization_id=r.organization_id,
-                calculated_amount=r.calculated_amount,
-                payout_status=r.payout_status,
-                paid_at=r.paid_at,
-                created_at=r.created_at,
-            )
-            for r in result.recipients
-        ]
-
-        # Compute platform fee
-        fee_percent, fee_amount, total_payment = compute_platform_fee(result.deal.commission_agent)
-
-        return BankSplitDealResponse(
-            id=result.deal.id,
-            type=result.deal.type,
-            status=result.deal.status,
-            payment_model=result.deal.payment_model,
-            property_address=result.deal.property_address,
-            price=result.deal.price,
-            commission_agent=result.deal.commission_agent,
-            platform_fee_percent=fee_percent,
-            platform_fee_amount=fee_amount,
-            total_client_payment=total_payment,
-            client_name=result.deal.client_name,
-            client_phone=result.deal.client_phone,
-            payer_email=result.deal.payer_email,
-            external_provider=result.deal.external_provider,
-            external_deal_id=result.deal.external_deal_id,
-            payment_link_url=result.deal.payment_link_url,
-            payment_qr_payload=result.deal.payment_qr_payload,
-            expires_at=result.deal.expires_at,
-            hold_expires_at=result.deal.hold_expires_at,
-            created_at=result.deal.created_at,
-            updated_at=result.deal.updated_at,
-            recipients=recipients,
+        return _json_response(
+            _deal_response(result.deal, result.recipients),
+            status_code=status.HTTP_201_CREATED,
         )
 
     except ValueError as e:
@@ -164,63 +273,14 @@ async def get_bank_split_deal(
 ):
     """Get bank-split deal by ID"""
     service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
+    deal = await service.get_deal_for_user(deal_id, current_user.id, load=("split_recipients",))
 
     if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    # Check access
-    if deal.created_by_user_id != current_user.id and deal.agent_user_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+        await raise_deal_not_found_or_forbidden(db, deal_id)
 
-    # Get recipients
-    split_service = SplitService(db)
-    recipients_db = await split_service.get_deal_recipients(deal_id)
-
-    recipients = [
-        SplitRecipientResponse(
-            id=r.id,
-            deal_id=r.deal_id,
-            role=r.role,
-            split_type=r.split_type,
-            split_value=r.split_value,
-            user_id=r.user_id,
-            organization_id=r.organization_id,
-            calculated_amount=r.calculated_amount,
-            payout_status=r.payout_status,
-            paid_at=r.paid_at,
-            created_at=r.created_at,
-        )
-        for r in recipients_db
-    ]
-
-    # Compute platform fee
-    fee_percent, fee_amount, total_payment = compute_platform_fee(deal.commission_agent)
+    recipients_db = sorted(deal.split_recipients, key=lambda r: r.created_at)
 
-    return BankSplitDealResponse(
-        id=deal.id,
-        type=deal.type,
-        status=deal.status,
-        payment_model=deal.payment_model,
-        property_address=deal.property_address,
-        price=deal.price,
-        commission_agent=deal.commission_agent,
-        platform_fee_percent=fee_percent,
-        platform_fee_amount=fee_amount,
-        total_client_payment=total_payment,
-        client_name=deal.client_name,
-        client_phone=deal.client_phone,
-        payer_email=deal.payer_email,
-        external_provider=deal.external_provider,
-        external_deal_id=deal.external_deal_id,
-        payment_link_url=deal.payment_link_url,
-        payment_qr_payload=deal.payment_qr_payload,
-        expires_at=deal.expires_at,
-        hold_expires_at=deal.hold_expires_at,
-        created_at=deal.created_at,
-        updated_at=deal.updated_at,
-        recipients=recipients,
-    )
+    return _json_response(_deal_response(deal, recipients_db))
 
 
 # ============================================
@@ -236,13 +296,10 @@ async def submit_for_signing(
 ):
     """Submit deal for client signature"""
     service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
+    deal = await service.get_deal_for_user(deal_id, current_user.id, as_creator=True)
 
     if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    if deal.created_by_user_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only deal creator can submit")
+        await raise_deal_not_found_or_forbidden(db, deal_id, "Only deal creator can submit")
 
     old_status = deal.status
 
@@ -250,12 +307,12 @@ async def submit_for_signing(
         deal = await service.submit_for_signing(deal)
         await db.commit()
 
-        return DealStatusResponse(
+        return _json_response(DealStatusResponse.model_construct(
             deal_id=deal.id,
             old_status=old_status,
             new_status=deal.status,
             timestamp=deal.updated_at,
-        )
+        ))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -279,12 +336,12 @@ async def mark_signed(
         deal = await service.mark_signed(deal)
         await db.commit()
 
-        return DealStatusResponse(
+        return _json_response(DealStatusResponse.model_construct(
             deal_id=deal.id,
             old_status=old_status,
             new_status=deal.status,
             timestamp=deal.updated_at,
-        )
+        ))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -302,13 +359,10 @@ async def create_invoice(
     This creates a nominal account deal in T-Bank with the split recipients.
     """
     service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
+    deal = await service.get_deal_for_user(deal_id, current_user.id, as_creator=True)
 
     if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    if deal.created_by_user_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only deal creator can create invoice")
+        await raise_deal_not_found_or_forbidden(db, deal_id, "Only deal creator can create invoice")
 
     return_url = request.return_url if request else None
 
@@ -316,13 +370,13 @@ async def create_invoice(
         result = await service.create_invoice(deal, return_url=return_url)
         await db.commit()
 
-        return CreateInvoiceResponse(
+        return _json_response(CreateInvoiceResponse.model_construct(
             deal_id=result.deal.id,
             external_deal_id=result.deal.external_deal_id,
             payment_url=result.deal.payment_link_url,
             qr_code=result.deal.payment_qr_payload,
             expires_at=result.deal.expires_at,
-        )
+        ))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -349,10 +403,10 @@ async def regenerate_payment_link(
         new_url = await invoice_service.regenerate_payment_link(deal)
         await db.commit()
 
-        return RegeneratePaymentLinkResponse(
+        return _json_response(RegeneratePaymentLinkResponse.model_construct(
             payment_url=new_url,
             expires_at=deal.expires_at,
-        )
+        ))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -364,8 +418,8 @@ async def regenerate_payment_link(
 
 @router.post("/{deal_id}/invoices", response_model=PartialInvoiceResponse, status_code=status.HTTP_201_CREATED)
 async def create_partial_invoice(
-    deal_id: UUID,
     request: CreatePartialInvoiceRequest,
+    deal: Deal = Depends(get_deal_for_owner),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -381,17 +435,8 @@ async def create_partial_invoice(
     - Amount must be <= remaining commission (total - already invoiced)
     - Deal must be in signed status or partially paid
     """
-    deal_service = BankSplitDealService(db)
     invoice_service = DealInvoiceService(db)
 
-    deal = await deal_service.get_deal(deal_id)
-
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    if deal.created_by_user_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only deal creator can create invoices")
-
     try:
         invoice, summary = await invoice_service.create_invoice(
             deal=deal,
@@ -400,6 +445,8 @@ async def create_partial_invoice(
             description=request.description,
             return_url=request.return_url,
             milestone_id=request.milestone_id,
+            # Preloaded by get_deal_for_owner - no summary re-query inside create_invoice
+            existing_invoices=deal.invoices,
         )
         await db.commit()
 
@@ -424,14 +471,16 @@ async def create_partial_invoice(
 @router.get("/{deal_id}/invoices", response_model=InvoiceListResponse)
 async def list_invoices(
     deal_id: UUID,
+    limit: int = Query(50, ge=1, le=200, description="Invoices per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from previous page"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Get list of all invoices for a deal.
+    Get list of invoices for a deal (paginated).
 
-    Returns invoices sorted by creation date (newest first)
-    and summary of total/paid/remaining amounts.
+    Returns invoices sorted by creation date (newest first),
+    next_cursor for the following page and summary of total/paid/remaining amounts.
     """
     deal_service = BankSplitDealService(db)
     invoice_service = DealInvoiceService(db)
@@ -441,7 +490,10 @@ async def list_invoices(
     if not deal:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
 
-    invoices = await invoice_service.get_deal_invoices(deal_id)
+    try:
+        invoices, next_cursor = await invoice_service.get_deal_invoices(deal_id, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     summary = await invoice_service.get_invoice_summary(deal)
 
     invoice_items = [
@@ -462,6 +514,7 @@ async def list_invoices(
     return InvoiceListResponse(
         deal_id=deal_id,
         invoices=invoice_items,
+        next_cursor=next_cursor,
         total_commission=summary.total_commission,
         total_invoiced=summary.total_invoiced,
         total_paid=summary.total_paid,
@@ -518,29 +571,20 @@ async def get_payment_summary(
 
 @router.post("/{deal_id}/invoices/{invoice_id}/regenerate-link", response_model=PartialInvoiceResponse)
 async def regenerate_invoice_payment_link(
-    deal_id: UUID,
     invoice_id: UUID,
-    current_user: User = Depends(get_current_user),
+    deal: Deal = Depends(get_deal_for_owner),
     db: AsyncSession = Depends(get_db),
 ):
     """Regenerate payment link for specific invoice"""
-    deal_service = BankSplitDealService(db)
     invoice_service = DealInvoiceService(db)
 
-    deal = await deal_service.get_deal(deal_id)
-
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    if deal.created_by_user_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only deal creator can regenerate links")
-
     try:
         new_url = await invoice_service.regenerate_payment_link(invoice_id)
         await db.commit()
 
         invoice = await invoice_service.get_invoice(invoice_id)
-        summary = await invoice_service.get_invoice_summary(deal)
+        # Link regeneration doesn't change amounts - summarize preloaded invoices
+        summary = invoice_service.summarize_invoices(deal, deal.invoices)
 
         return PartialInvoiceResponse(
             invoice_id=invoice.id,
@@ -562,24 +606,14 @@ async def regenerate_invoice_payment_link(
 
 @router.delete("/{deal_id}/invoices/{invoice_id}")
 async def cancel_invoice(
-    deal_id: UUID,
     invoice_id: UUID,
     reason: Optional[str] = Query(None, description="Cancellation reason"),
-    current_user: User = Depends(get_current_user),
+    deal: Deal = Depends(get_deal_for_owner),
     db: AsyncSession = Depends(get_db),
 ):
     """Cancel an unpaid invoice"""
-    deal_service = BankSplitDealService(db)
     invoice_service = DealInvoiceService(db)
 
-    deal = await deal_service.get_deal(deal_id)
-
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    if deal.created_by_user_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only deal creator can cancel invoices")
-
     try:
         await invoice_service.cancel_invoice(invoice_id, reason)
         await db.commit()
@@ -589,29 +623,52 @@ async def cancel_invoice(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.post("/{deal_id}/send-payment-link", response_model=SendPaymentLinkResponse)
+async def _send_payment_link_sms(deal_id: UUID, actor_user_id: int, phone: str, message: str):
+    """
+    Deliver the payment link SMS after the response (background task).
+
+    The outcome is recorded in audit_logs (sms_payment_link_sent/failed) so a
+    failed delivery can be surfaced to the agent.
+    """
+    try:
+        success = await get_sms_provider().send(phone, message)
+    except Exception as e:
+        logger.error(f"Payment link SMS provider error for deal {deal_id}: {e}")
+        success = False
+    if not success:
+        logger.error(f"Failed to send payment link SMS for deal {deal_id}")
+
+    try:
+        async with async_session_maker() as db:
+            db.add(AuditLog(
+                entity_type="deal",
+                entity_id=deal_id,
+                action="sms_payment_link_sent" if success else "sms_payment_link_failed",
+                actor_user_id=actor_user_id,
+                meta={"method": "sms"},
+            ))
+            await db.commit()
+    except Exception as e:
+        logger.error(f"Failed to record payment link SMS status for deal {deal_id}: {e}")
+
+
+@router.post(
+    "/{deal_id}/send-payment-link",
+    response_model=SendPaymentLinkResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def send_payment_link(
-    deal_id: UUID,
+    background_tasks: BackgroundTasks,
     request: SendPaymentLinkRequest = None,
+    deal: Deal = Depends(get_deal_for_owner),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
 ):
     """
     Send payment link to client via SMS or Email.
 
-    This sends the payment URL to the client's phone or email.
+    The SMS is queued and delivered after the response is returned
+    (202, status="queued"); the delivery outcome is recorded in audit_logs.
     """
-    from app.services.sms.provider import get_sms_provider
-
-    service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
-
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    if deal.created_by_user_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only deal creator can send payment link")
-
     if not deal.payment_link_url:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -628,28 +685,27 @@ async def send_payment_link(
             )
 
         # Format message
-        payment_page_url = f"{settings.FRONTEND_URL}/pay/{deal.id}"
-        message = f"Housler: ссылка для оплаты комиссии по сделке {deal.property_address[:30]}... - {payment_page_url}"
-
-        # Send SMS
-        sms_provider = get_sms_provider()
-        success = await sms_provider.send(deal.client_phone, message)
+        message = _PAYMENT_LINK_SMS_TEMPLATE.format(
+            address=deal.property_address[:30],
+            url=f"{settings.FRONTEND_URL}/pay/{deal.id}",
+        )
 
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to send SMS"
-            )
+        # Send SMS after the response; the provider call can take seconds
+        background_tasks.add_task(
+            _send_payment_link_sms, deal.id, current_user.id, deal.client_phone, message
+        )
 
-        # Mask phone for response
-        phone = deal.client_phone
-        masked = f"+7 (***) ***-**-{phone[-2:]}" if len(phone) >= 2 else "***"
+        # Mask phone for response; reveal the last 2 digits only of a full
+        # number, so short or malformed values are never echoed back whole
+        digits = "".join(filter(str.isdigit, deal.client_phone))
+        masked = _MASKED_PHONE_TEMPLATE.format(last2=digits[-2:]) if len(digits) >= 10 else "***"
 
         return SendPaymentLinkResponse(
             success=True,
             method="sms",
             recipient=masked,
-            message="SMS со ссылкой на оплату отправлено клиенту"
+            message="SMS со ссылкой на оплату поставлено в очередь на отправку",
+            status="queued",
         )
 
     elif method == "email":
@@ -668,20 +724,12 @@ async def send_payment_link(
 
 @router.post("/{deal_id}/cancel", response_model=DealStatusResponse)
 async def cancel_deal(
-    deal_id: UUID,
     transition: DealStatusTransition = None,
-    current_user: User = Depends(get_current_user),
+    deal: Deal = Depends(get_deal_for_owner),
     db: AsyncSession = Depends(get_db),
 ):
     """Cancel bank-split deal"""
     service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
-
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    if deal.created_by_user_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only deal creator can cancel")
 
     old_status = deal.status
     reason = transition.reason if transition else None
@@ -690,12 +738,12 @@ async def cancel_deal(
         deal = await service.cancel_deal(deal, reason=reason)
         await db.commit()
 
-        return DealStatusResponse(
+        return _json_response(DealStatusResponse.model_construct(
             deal_id=deal.id,
             old_status=old_status,
             new_status=deal.status,
             timestamp=deal.updated_at,
-        )
+        ))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -726,12 +774,12 @@ async def release_deal(
         deal = await service.release_from_hold(deal)
         await db.commit()
 
-        return DealStatusResponse(
+        return _json_response(DealStatusResponse.model_construct(
             deal_id=deal.id,
             old_status=old_status,
             new_status=deal.status,
             timestamp=deal.updated_at,
-        )
+        ))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -762,77 +810,62 @@ async def give_consent(
     - service_confirmation_required: Agree that service must be confirmed before payout
     - hold_period_acceptance: Accept hold period before payout
     """
-    from datetime import datetime
-    from app.models.consent import DealConsent, ConsentType
-
     service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
+    # Only deal participants (creator or agent) may give consent
+    deal = await service.get_deal_for_user(deal_id, current_user.id, load=())
 
     if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
+        await raise_deal_not_found_or_forbidden(db, deal_id)
 
     # Validate consent type
-    valid_types = [t.value for t in ConsentType]
-    if consent_in.consent_type not in valid_types:
+    if consent_in.consent_type not in _VALID_CONSENT_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid consent type. Must be one of: {valid_types}"
+            detail=f"Invalid consent type. Must be one of: {_CONSENT_TYPE_VALUES}"
         )
 
-    # Check if user is involved in deal
-    is_participant = (
-        deal.created_by_user_id == current_user.id or
-        deal.agent_user_id == current_user.id
-    )
-    if not is_participant:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+    # Get client info from request
+    client_ip = request.client.host if request.client else None
+    user_agent = request.headers.get("user-agent")
 
-    # Check if consent already exists
-    from sqlalchemy import select
-    existing = await db.execute(
-        select(DealConsent).where(
-            DealConsent.deal_id == deal_id,
-            DealConsent.user_id == current_user.id,
-            DealConsent.consent_type == consent_in.consent_type,
-            DealConsent.revoked_at.is_(None)
+    # Create consent record. uq_deal_consents_active turns a duplicate active
+    # consent into an empty RETURNING, so no existence probe is needed; the
+    # server-generated columns come back as a plain row (no ORM hydration).
+    result = await db.execute(
+        pg_insert(DealConsent)
+        .values(
+            deal_id=deal_id,
+            user_id=current_user.id,
+            consent_type=consent_in.consent_type,
+            consent_version=consent_in.consent_version,
+            ip_address=client_ip,
+            user_agent=user_agent,
+            document_url=consent_in.document_url,
+        )
+        .on_conflict_do_nothing(
+            index_elements=[DealConsent.deal_id, DealConsent.user_id, DealConsent.consent_type],
+            index_where=DealConsent.revoked_at.is_(None),
         )
+        .returning(DealConsent.id, DealConsent.consent_version, DealConsent.agreed_at)
     )
-    if existing.scalar_one_or_none():
+    row = result.first()
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Consent already given for this type"
         )
+    await db.commit()
 
-    # Get client info from request
-    client_ip = request.client.host if request.client else None
-    user_agent = request.headers.get("user-agent")
-
-    # Create consent record
-    consent = DealConsent(
+    return _json_response(ConsentResponse.model_construct(
+        id=row.id,
         deal_id=deal_id,
         user_id=current_user.id,
         consent_type=consent_in.consent_type,
-        consent_version=consent_in.consent_version,
-        agreed_at=datetime.utcnow(),
-        ip_address=client_ip,
-        user_agent=user_agent,
+        consent_version=row.consent_version,
+        agreed_at=row.agreed_at,
         document_url=consent_in.document_url,
-    )
-
-    db.add(consent)
-    await db.commit()
-    await db.refresh(consent)
-
-    return ConsentResponse(
-        id=consent.id,
-        deal_id=consent.deal_id,
-        user_id=consent.user_id,
-        consent_type=consent.consent_type,
-        consent_version=consent.consent_version,
-        agreed_at=consent.agreed_at,
-        document_url=consent.document_url,
-        revoked_at=consent.revoked_at,
-    )
+        revoked_at=None,
+    ), status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/{deal_id}/consents", response_model=ConsentCheckResponse)
@@ -844,53 +877,28 @@ async def check_consents(
     """
     Check which consents are required and which have been given.
     """
-    from sqlalchemy import select
-    from app.models.consent import DealConsent, ConsentType
-
     service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
+    deal = await service.get_deal_for_user(deal_id, current_user.id, load=("consents",))
 
     if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    # Check access
-    is_participant = (
-        deal.created_by_user_id == current_user.id or
-        deal.agent_user_id == current_user.id
-    )
-    if not is_participant:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
-
-    # Required consents for bank-split deals (T-Bank nominal account model)
-    required = [
-        ConsentType.PLATFORM_FEE_DEDUCTION.value,
-        ConsentType.DATA_PROCESSING.value,
-        ConsentType.TERMS_OF_SERVICE.value,
-        ConsentType.BANK_PAYMENT_PROCESSING.value,
-        ConsentType.SERVICE_CONFIRMATION_REQUIRED.value,
-        ConsentType.HOLD_PERIOD_ACCEPTANCE.value,
-    ]
+        await raise_deal_not_found_or_forbidden(db, deal_id)
 
-    # Get user's consents
-    result = await db.execute(
-        select(DealConsent).where(
-            DealConsent.deal_id == deal_id,
-            DealConsent.user_id == current_user.id,
-            DealConsent.revoked_at.is_(None)
-        )
-    )
-    user_consents = result.scalars().all()
-    given = [c.consent_type for c in user_consents]
+    # User's active consents, from the eager-loaded deal consents
+    given_set = {
+        c.consent_type
+        for c in deal.consents
+        if c.user_id == current_user.id and c.revoked_at is None
+    }
 
-    missing = [r for r in required if r not in given]
+    missing = [r for r in _REQUIRED_BANK_SPLIT_CONSENTS if r not in given_set]
 
-    return ConsentCheckResponse(
+    return _json_response(ConsentCheckResponse.model_construct(
         deal_id=deal_id,
-        required_consents=required,
-        given_consents=given,
+        required_consents=list(_REQUIRED_BANK_SPLIT_CONSENTS),
+        given_consents=list(given_set),
         missing_consents=missing,
         all_consents_given=len(missing) == 0,
-    )
+    ))
 
 
 @router.get("/consent-texts")
@@ -903,8 +911,6 @@ async def get_consent_texts():
 
     This is a PUBLIC endpoint - no authentication required.
     """
-    from app.models.consent import CONSENT_TEXTS, ConsentType
-
     # Return all non-deprecated consents
     result = {}
     for consent_type, data in CONSENT_TEXTS.items():
@@ -915,19 +921,10 @@ async def get_consent_texts():
                 "version": data["version"],
             }
 
-    # Also return list of required consents for bank-split
-    required_types = [
-        ConsentType.PLATFORM_FEE_DEDUCTION.value,
-        ConsentType.DATA_PROCESSING.value,
-        ConsentType.TERMS_OF_SERVICE.value,
-        ConsentType.BANK_PAYMENT_PROCESSING.value,
-        ConsentType.SERVICE_CONFIRMATION_REQUIRED.value,
-        ConsentType.HOLD_PERIOD_ACCEPTANCE.value,
-    ]
-
     return {
         "consents": result,
-        "required_for_bank_split": required_types,
+        # Also return list of required consents for bank-split
+        "required_for_bank_split": list(_REQUIRED_BANK_SPLIT_CONSENTS),
     }
 
 
@@ -960,9 +957,6 @@ async def confirm_completion(
     - Cannot confirm if open dispute exists
     - Cannot confirm if already confirmed by this user
     """
-    from app.services.bank_split.completion_service import ServiceCompletionService
-    from app.services.notification.service import notification_service
-
     service = BankSplitDealService(db)
     deal = await service.get_deal(deal_id)
 
@@ -989,9 +983,15 @@ async def confirm_completion(
 
         # Send notifications
         try:
+            # Both agent notifications need the agent row: load it at most
+            # once, and not at all when the confirming user is the agent
+            is_agent = current_user.id == deal.agent_user_id
+            agent = None
+            if not is_agent or result.release_triggered:
+                agent = current_user if is_agent else await service._get_user(deal.agent_user_id)
+
             # Notify agent about confirmation (if someone else confirmed)
-            if current_user.id != deal.agent_user_id:
-                agent = await service._get_user(deal.agent_user_id)
+            if not is_agent:
                 if agent and agent.phone:
                     await notification_service.send_service_confirmed(
                         phone=agent.phone,
@@ -1000,7 +1000,7 @@ async def confirm_completion(
                     )
 
             # Notify client about confirmation
-            if deal.client_phone and current_user.id == deal.agent_user_id:
+            if deal.client_phone and is_agent:
                 await notification_service.send_service_confirmed(
                     phone=deal.client_phone,
                     address=deal.property_address,
@@ -1009,7 +1009,6 @@ async def confirm_completion(
 
             # If release was triggered, notify about payout
             if result.release_triggered:
-                agent = await service._get_user(deal.agent_user_id)
                 if agent:
                     await notification_service.notify_hold_released(
                         phone=agent.phone,
@@ -1023,40 +1022,40 @@ async def confirm_completion(
 
         # UC-3.2: Client confirmation flow
         if result.awaiting_client_confirmation:
-            return {
+            return _json_response({
                 "message": "Все агенты подтвердили. Ожидается подтверждение клиента.",
                 "deal_status": deal.status,
                 "all_confirmed": result.all_confirmed,
                 "awaiting_client_confirmation": True,
                 "act_document_id": str(result.act_document.id) if result.act_document else None,
                 "signing_url": result.signing_url,
-                "client_confirmation_deadline": deal.client_confirmation_deadline.isoformat() if deal.client_confirmation_deadline else None,
-            }
+                "client_confirmation_deadline": deal.client_confirmation_deadline,
+            }, status_code=status.HTTP_201_CREATED)
 
         if result.release_triggered:
-            return {
+            return _json_response({
                 "message": "Service confirmed. All parties confirmed - funds released.",
                 "deal_status": deal.status,
                 "all_confirmed": result.all_confirmed,
                 "release_triggered": True,
-            }
+            }, status_code=status.HTTP_201_CREATED)
 
         if result.all_confirmed:
-            return {
+            return _json_response({
                 "message": "Service confirmed. All parties confirmed - release scheduled.",
                 "deal_status": deal.status,
                 "all_confirmed": True,
                 "release_triggered": False,
-                "auto_release_at": deal.auto_release_at.isoformat() if deal.auto_release_at else None,
-            }
+                "auto_release_at": deal.auto_release_at,
+            }, status_code=status.HTTP_201_CREATED)
 
-        return {
+        return _json_response({
             "message": "Service completion confirmed",
             "deal_status": deal.status,
             "all_confirmed": False,
             "confirmations": result.confirmations_count,
             "required": result.required_count,
-        }
+        }, status_code=status.HTTP_201_CREATED)
 
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -1069,10 +1068,8 @@ async def get_completion_status(
     db: AsyncSession = Depends(get_db),
 ):
     """Get service completion status for a deal"""
-    from app.services.bank_split.completion_service import ServiceCompletionService
-
     service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
+    deal = await service.get_deal(deal_id, load=())
 
     if not deal:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
@@ -1084,18 +1081,17 @@ async def get_completion_status(
     if not can_view:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
-    # Get required confirmers and existing confirmations
+    # Required confirmers come from the deal row; confirmations and the
+    # open-dispute flag arrive together, already aggregated by the DB
     required = await completion_service.get_required_confirmers(deal)
-    completions = await completion_service.get_existing_confirmations(deal_id)
+    completions, has_open_dispute = await completion_service.get_completion_snapshot(deal_id)
 
-    confirmed_user_ids = {c.confirmed_by_user_id for c in completions}
+    confirmed_user_ids = {c["user_id"] for c in completions}
     pending_user_ids = required - confirmed_user_ids
 
-    # Check for open disputes
-    open_dispute = await completion_service.check_open_disputes(deal_id)
-
-    return {
-        "deal_id": str(deal_id),
+    # orjson writes the UUIDs natively, no str() per field
+    return _json_response({
+        "deal_id": deal_id,
         "deal_status": deal.status,
         "required_count": len(required),
         "confirmed_count": len(confirmed_user_ids),
@@ -1103,19 +1099,23 @@ async def get_completion_status(
         "all_confirmed": len(pending_user_ids) == 0,
         "current_user_confirmed": current_user.id in confirmed_user_ids,
         "current_user_can_confirm": can_view and current_user.id not in confirmed_user_ids,
-        "has_open_dispute": open_dispute is not None,
-        "auto_release_at": deal.auto_release_at.isoformat() if deal.auto_release_at else None,
+        "has_open_dispute": has_open_dispute,
+        "auto_release_at": deal.auto_release_at,
         "confirmations": [
             {
-                "user_id": c.confirmed_by_user_id,
-                "confirmed_at": c.confirmed_at.isoformat(),
-                "notes": c.notes,
-                "triggers_release": c.triggers_release,
-                "release_triggered_at": c.release_triggered_at.isoformat() if c.release_triggered_at else None,
+                "user_id": c["user_id"],
+                # PostgreSQL's JSON timestamps, re-rendered by orjson in isoformat
+                "confirmed_at": datetime.fromisoformat(c["confirmed_at"]),
+                "notes": c["notes"],
+                "triggers_release": c["triggers_release"],
+                "release_triggered_at": (
+                    datetime.fromisoformat(c["release_triggered_at"])
+                    if c["release_triggered_at"] else None
+                ),
             }
             for c in completions
         ]
-    }
+    })
 
 
 # ============================================
@@ -1126,7 +1126,7 @@ async def get_completion_status(
 @router.post("/{deal_id}/adjust-split", status_code=status.HTTP_201_CREATED)
 async def request_split_adjustment(
     deal_id: UUID,
-    request: Request,
+    adjustment_in: SplitAdjustmentCreate,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -1135,27 +1135,13 @@ async def request_split_adjustment(
 
     All other recipients must approve before the adjustment takes effect.
     """
-    from datetime import datetime, timedelta
-    from sqlalchemy import select
-    from app.models.split_adjustment import SplitAdjustment
-    from app.schemas.split_adjustment import SplitAdjustmentCreate
-
-    body = await request.json()
-    adjustment_in = SplitAdjustmentCreate(**body)
-
     service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
+    deal = await service.get_deal_for_user(deal_id, current_user.id, load=())
 
     if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    # Check if user is participant
-    is_participant = (
-        deal.created_by_user_id == current_user.id or
-        deal.agent_user_id == current_user.id
-    )
-    if not is_participant:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only deal participants can request adjustments")
+        await raise_deal_not_found_or_forbidden(
+            db, deal_id, "Only deal participants can request adjustments"
+        )
 
     # Check deal status - adjustments only in certain states
     if deal.status not in ("draft", "awaiting_signatures", "signed"):
@@ -1164,30 +1150,20 @@ async def request_split_adjustment(
             detail="Split adjustments can only be requested before payment"
         )
 
-    # Check for pending adjustments
-    existing = await db.execute(
-        select(SplitAdjustment).where(
-            SplitAdjustment.deal_id == deal_id,
-            SplitAdjustment.status == "pending"
-        )
-    )
-    if existing.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="There is already a pending adjustment for this deal"
-        )
-
-    # Get current split
-    split_service = SplitService(db)
-    recipients = await split_service.get_deal_recipients(deal_id)
-
-    old_split = {str(r.user_id): float(r.split_percent) for r in recipients if r.user_id}
+    # Current split - only the two columns needed, not full recipient rows
+    recipients = (await db.execute(
+        select(DealSplitRecipient.user_id, DealSplitRecipient.split_value)
+        .where(DealSplitRecipient.deal_id == deal_id, DealSplitRecipient.user_id.isnot(None))
+        .order_by(DealSplitRecipient.created_at)
+    )).all()
 
     # Required approvers = all recipients except the requester
-    required_approvers = [
-        r.user_id for r in recipients
-        if r.user_id and r.user_id != current_user.id
-    ]
+    old_split = {}
+    required_approvers = []
+    for user_id, split_value in recipients:
+        old_split[str(user_id)] = float(split_value)
+        if user_id != current_user.id:
+            required_approvers.append(user_id)
 
     if not required_approvers:
         raise HTTPException(
@@ -1198,99 +1174,120 @@ async def request_split_adjustment(
     # Convert new_split keys to strings for JSON storage
     new_split = {str(k): float(v) for k, v in adjustment_in.new_split.items()}
 
-    adjustment = SplitAdjustment(
-        deal_id=deal_id,
-        requested_by_user_id=current_user.id,
-        old_split=old_split,
-        new_split=new_split,
-        reason=adjustment_in.reason,
-        status="pending",
-        required_approvers=required_approvers,
-        approvals=[],
-        rejections=[],
-        expires_at=datetime.utcnow() + timedelta(days=7),
+    # One pending adjustment per deal is enforced by the partial unique
+    # index uq_split_adjustments_deal_pending; a conflict inserts nothing
+    stmt = (
+        pg_insert(SplitAdjustment)
+        .values(
+            deal_id=deal_id,
+            requested_by_user_id=current_user.id,
+            old_split=old_split,
+            new_split=new_split,
+            reason=adjustment_in.reason,
+            status="pending",
+            required_approvers=required_approvers,
+            approvals=[],
+            rejections=[],
+            expires_at=utc_now() + timedelta(days=7),
+        )
+        .on_conflict_do_nothing(
+            index_elements=[SplitAdjustment.deal_id],
+            index_where=SplitAdjustment.status == "pending",
+        )
+        .returning(SplitAdjustment.id, SplitAdjustment.expires_at)
     )
+    created = (await db.execute(stmt)).one_or_none()
+
+    if created is None:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="There is already a pending adjustment for this deal"
+        )
 
-    db.add(adjustment)
     await db.commit()
-    await db.refresh(adjustment)
 
-    return {
-        "id": str(adjustment.id),
+    return _json_response({
+        "id": str(created.id),
         "deal_id": str(deal_id),
         "status": "pending",
         "required_approvers": required_approvers,
-        "expires_at": adjustment.expires_at.isoformat()
-    }
+        "expires_at": created.expires_at
+    }, status_code=status.HTTP_201_CREATED)
+
+
+async def _list_response(
+    db: AsyncSession,
+    stmt,
+    list_model: Type[BaseModel],
+    columns_only: bool = False,
+    **extra,
+) -> Optional[Response]:
+    """
+    Render a list query as {"items": [...], "total": N, **extra}.
+
+    Runs on the request session (no second pooled connection) and validates
+    and encodes the whole list in one pydantic-core pass. Returns None when
+    the query has no rows, so the caller can run its 404/403 checks first.
+    columns_only reads plain rows of a column projection instead of ORM
+    entities.
+    """
+    result = await db.execute(stmt)
+    rows = result.all() if columns_only else result.scalars().all()
+    if not rows:
+        return None
+
+    return _json_response(list_model.model_validate(
+        {"items": rows, "total": len(rows), **extra},
+        from_attributes=True,
+    ))
 
 
-@router.get("/{deal_id}/adjustments")
+@router.get("/{deal_id}/adjustments", response_model=SplitAdjustmentListResponse)
 async def list_split_adjustments(
     deal_id: UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """List all split adjustments for a deal"""
-    from sqlalchemy import select
-    from app.models.split_adjustment import SplitAdjustment
+    # Access check folded into the list query
+    response = await _list_response(
+        db,
+        select(SplitAdjustment)
+        .join(Deal, Deal.id == SplitAdjustment.deal_id)
+        .where(
+            SplitAdjustment.deal_id == deal_id,
+            Deal.deleted_at.is_(None),
+            deal_participant_filter(current_user.id),
+        )
+        .order_by(SplitAdjustment.created_at.desc()),
+        SplitAdjustmentListResponse,
+    )
 
-    service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
+    if response is None:
+        # Empty result: distinguish "no adjustments" from 404/403
+        await fetch_deal_with_access(db, deal_id, current_user.id)
+        return SplitAdjustmentListResponse(items=[], total=0)
 
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
+    return response
 
-    # Check access
-    is_participant = (
-        deal.created_by_user_id == current_user.id or
-        deal.agent_user_id == current_user.id
-    )
-    if not is_participant:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
+async def _raise_vote_rejected(db: AsyncSession, adjustment_id: UUID, user_id: int, action: str) -> NoReturn:
+    """
+    Explain why an atomic approve/reject UPDATE matched no row.
+
+    Only runs on the failure path; re-reads the adjustment and raises the
+    same errors the endpoints returned before votes became a single UPDATE.
+    """
+    # Row lock: this path may mark the adjustment expired, and must not
+    # overwrite a status set by a concurrent vote
     result = await db.execute(
         select(SplitAdjustment)
-        .where(SplitAdjustment.deal_id == deal_id)
-        .order_by(SplitAdjustment.created_at.desc())
+        .where(SplitAdjustment.id == adjustment_id)
+        .with_for_update()
     )
-    adjustments = result.scalars().all()
-
-    return {
-        "items": [
-            {
-                "id": str(a.id),
-                "requested_by_user_id": a.requested_by_user_id,
-                "old_split": a.old_split,
-                "new_split": a.new_split,
-                "reason": a.reason,
-                "status": a.status,
-                "required_approvers": a.required_approvers,
-                "approvals": a.approvals,
-                "rejections": a.rejections,
-                "expires_at": a.expires_at.isoformat() if a.expires_at else None,
-                "created_at": a.created_at.isoformat(),
-            }
-            for a in adjustments
-        ],
-        "total": len(adjustments)
-    }
-
-
-@router.post("/adjustments/{adjustment_id}/approve", status_code=status.HTTP_200_OK)
-async def approve_split_adjustment(
-    adjustment_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-):
-    """Approve a split adjustment request"""
-    from datetime import datetime
-    from sqlalchemy import select
-    from app.models.split_adjustment import SplitAdjustment
-
-    result = await db.execute(
-        select(SplitAdjustment).where(SplitAdjustment.id == adjustment_id)
-    )
-    adjustment = result.scalar_one_or_none()
+    adjustment = result.scalar_one_or_none()
+    now = utc_now()
 
     if not adjustment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Adjustment not found")
@@ -1301,137 +1298,210 @@ async def approve_split_adjustment(
             detail=f"Adjustment is already {adjustment.status}"
         )
 
-    # Check expiry
-    if adjustment.expires_at and datetime.utcnow() > adjustment.expires_at:
+    # Check expiry (approvals only)
+    if action == "approve" and adjustment.expires_at and now > adjustment.expires_at:
         adjustment.status = "expired"
-        adjustment.resolved_at = datetime.utcnow()
+        adjustment.resolved_at = now
         await db.commit()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Adjustment has expired"
         )
 
-    # Check if user is a required approver
-    if current_user.id not in adjustment.required_approvers:
+    if user_id not in adjustment.required_approvers:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not a required approver for this adjustment"
         )
 
-    # Check if already approved/rejected by this user
-    existing_approval_ids = [a.get("user_id") for a in (adjustment.approvals or [])]
-    existing_rejection_ids = [r.get("user_id") for r in (adjustment.rejections or [])]
+    approved = user_id in adjustment.approved_user_ids
+    rejected = user_id in {r.get("user_id") for r in (adjustment.rejections or [])}
 
-    if current_user.id in existing_approval_ids:
+    if action == "approve" and approved:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="You have already approved this adjustment"
         )
-
-    if current_user.id in existing_rejection_ids:
+    if action == "approve" and rejected:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="You have already rejected this adjustment"
         )
+    if approved or rejected:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="You have already voted on this adjustment"
+        )
 
-    # Add approval
-    approvals = list(adjustment.approvals or [])
-    approvals.append({
-        "user_id": current_user.id,
-        "approved_at": datetime.utcnow().isoformat()
-    })
-    adjustment.approvals = approvals
+    # Row changed between the UPDATE and this read
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Adjustment was modified concurrently, please retry"
+    )
 
-    # Check if all required approvers have approved
-    approved_ids = {a.get("user_id") for a in approvals}
-    all_approved = set(adjustment.required_approvers).issubset(approved_ids)
 
-    if all_approved:
-        # Apply the adjustment
-        adjustment.status = "approved"
-        adjustment.resolved_at = datetime.utcnow()
+def _not_voted_filter(user_id: int):
+    """WHERE clause: user has neither approved nor rejected the adjustment"""
+    return and_(
+        not_(SplitAdjustment.approved_user_ids.any(user_id)),
+        not_(
+            func.coalesce(SplitAdjustment.rejections, literal([], JSONB))
+            .contains([{"user_id": user_id}])
+        ),
+    )
 
-        # Update the actual split recipients
-        split_service = SplitService(db)
-        await split_service.apply_split_adjustment(adjustment.deal_id, adjustment.new_split)
 
-    await db.commit()
+async def _apply_split_adjustment_task(adjustment_id: UUID, deal_id: UUID, new_split: dict):
+    """
+    Apply an approved split adjustment in its own session (background task).
 
-    return {
-        "adjustment_id": str(adjustment_id),
-        "status": adjustment.status,
-        "all_approved": all_approved,
-        "approvals_count": len(approvals),
-        "required_count": len(adjustment.required_approvers)
-    }
+    On failure the adjustment is moved to apply_failed, so an approved
+    adjustment with unchanged recipients is never left unrecorded.
+    """
+    try:
+        async with async_session_maker() as db:
+            await SplitService(db).apply_split_adjustment(deal_id, new_split)
+            await db.commit()
+    except Exception as e:
+        logger.error(f"Failed to apply split adjustment for deal {deal_id}: {e}")
+        try:
+            async with async_session_maker() as db:
+                await SplitService(db).mark_adjustment_apply_failed(adjustment_id, str(e))
+                await db.commit()
+        except Exception as mark_error:
+            logger.error(f"Failed to record apply failure of split adjustment {adjustment_id}: {mark_error}")
 
 
-@router.post("/adjustments/{adjustment_id}/reject", status_code=status.HTTP_200_OK)
-async def reject_split_adjustment(
+@router.post(
+    "/adjustments/{adjustment_id}/approve",
+    response_model=SplitAdjustmentApproveResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def approve_split_adjustment(
     adjustment_id: UUID,
-    request: Request,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Reject a split adjustment request"""
-    from datetime import datetime
-    from sqlalchemy import select
-    from app.models.split_adjustment import SplitAdjustment
-    from app.schemas.split_adjustment import SplitAdjustmentReject
-
-    body = await request.json()
-    rejection = SplitAdjustmentReject(**body)
+    """Approve a split adjustment request"""
+    now = utc_now()
+    entry = [{"user_id": current_user.id, "approved_at": now.isoformat()}]
+
+    # Only distinct required approvers can vote, so the counter alone tells
+    # whether this vote completes the approvals (SET sees pre-update values)
+    last_vote = (
+        SplitAdjustment.approvals_count + 1
+        >= func.jsonb_array_length(SplitAdjustment.required_approvers)
+    )
 
+    # Append the approval atomically: all eligibility checks live in the
+    # WHERE clause, so concurrent approvals cannot overwrite each other
     result = await db.execute(
-        select(SplitAdjustment).where(SplitAdjustment.id == adjustment_id)
+        update(SplitAdjustment)
+        .where(
+            SplitAdjustment.id == adjustment_id,
+            SplitAdjustment.status == "pending",
+            or_(SplitAdjustment.expires_at.is_(None), SplitAdjustment.expires_at >= now),
+            SplitAdjustment.required_approvers.contains([current_user.id]),
+            _not_voted_filter(current_user.id),
+        )
+        .values(
+            approvals=func.coalesce(SplitAdjustment.approvals, literal([], JSONB)).op("||")(
+                literal(entry, JSONB)
+            ),
+            approved_user_ids=func.array_append(SplitAdjustment.approved_user_ids, current_user.id),
+            approvals_count=SplitAdjustment.approvals_count + 1,
+            # The last vote resolves the adjustment in the same statement
+            status=case((last_vote, "approved"), else_=SplitAdjustment.status),
+            resolved_at=case((last_vote, now), else_=SplitAdjustment.resolved_at),
+        )
+        .returning(
+            SplitAdjustment.deal_id,
+            SplitAdjustment.new_split,
+            SplitAdjustment.status,
+            SplitAdjustment.approvals_count,
+            func.jsonb_array_length(SplitAdjustment.required_approvers).label("required_count"),
+        )
+        .execution_options(synchronize_session=False)
     )
-    adjustment = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not adjustment:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Adjustment not found")
+    if row is None:
+        await db.rollback()
+        await _raise_vote_rejected(db, adjustment_id, current_user.id, "approve")
 
-    if adjustment.status != "pending":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Adjustment is already {adjustment.status}"
-        )
+    adjustment_status = row.status
+    all_approved = adjustment_status == "approved"
 
-    # Check if user is a required approver
-    if current_user.id not in adjustment.required_approvers:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not a required approver for this adjustment"
+    await db.commit()
+
+    if all_approved:
+        # Outcome is final once the last vote is committed - update the
+        # split recipients after the response has been sent
+        background_tasks.add_task(
+            _apply_split_adjustment_task, adjustment_id, row.deal_id, row.new_split
         )
 
-    # Check if already voted
-    existing_approval_ids = [a.get("user_id") for a in (adjustment.approvals or [])]
-    existing_rejection_ids = [r.get("user_id") for r in (adjustment.rejections or [])]
+    return _json_response(SplitAdjustmentApproveResponse.model_construct(
+        adjustment_id=adjustment_id,
+        status=adjustment_status,
+        all_approved=all_approved,
+        approvals_count=row.approvals_count,
+        required_count=row.required_count,
+    ))
 
-    if current_user.id in existing_approval_ids or current_user.id in existing_rejection_ids:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="You have already voted on this adjustment"
-        )
 
-    # Add rejection - any rejection immediately rejects the adjustment
-    rejections = list(adjustment.rejections or [])
-    rejections.append({
+@router.post(
+    "/adjustments/{adjustment_id}/reject",
+    response_model=SplitAdjustmentRejectResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def reject_split_adjustment(
+    adjustment_id: UUID,
+    rejection: SplitAdjustmentReject,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Reject a split adjustment request"""
+    now = utc_now()
+    entry = [{
         "user_id": current_user.id,
-        "rejected_at": datetime.utcnow().isoformat(),
+        "rejected_at": now.isoformat(),
         "reason": rejection.reason
-    })
-    adjustment.rejections = rejections
-    adjustment.status = "rejected"
-    adjustment.resolved_at = datetime.utcnow()
+    }]
+
+    # Any rejection immediately rejects the adjustment - single atomic UPDATE
+    result = await db.execute(
+        update(SplitAdjustment)
+        .where(
+            SplitAdjustment.id == adjustment_id,
+            SplitAdjustment.status == "pending",
+            SplitAdjustment.required_approvers.contains([current_user.id]),
+            _not_voted_filter(current_user.id),
+        )
+        .values(
+            rejections=func.coalesce(SplitAdjustment.rejections, literal([], JSONB)).op("||")(
+                literal(entry, JSONB)
+            ),
+            status="rejected",
+            resolved_at=now,
+        )
+        .returning(SplitAdjustment.id)
+        .execution_options(synchronize_session=False)
+    )
+
+    if result.one_or_none() is None:
+        await db.rollback()
+        await _raise_vote_rejected(db, adjustment_id, current_user.id, "reject")
 
     await db.commit()
 
-    return {
-        "adjustment_id": str(adjustment_id),
-        "status": "rejected",
-        "rejected_by": current_user.id,
-        "reason": rejection.reason
-    }
+    return _json_response(SplitAdjustmentRejectResponse.model_construct(
+        adjustment_id=adjustment_id,
+        status="rejected",
+        rejected_by=current_user.id,
+        reason=rejection.reason,
+    ))
 
 
 # ============================================
@@ -1439,6 +1509,12 @@ async def reject_split_adjustment(
 # ============================================
 
 
+async def _load_contract_template(template_type: TemplateType):
+    """Load the active contract template in a separate read-only session"""
+    async with async_session_maker() as template_db:
+        return await ContractGenerationService(template_db).get_template(template_type)
+
+
 @router.post("/{deal_id}/contracts/generate", status_code=status.HTTP_201_CREATED)
 async def generate_contract(
     deal_id: UUID,
@@ -1454,139 +1530,129 @@ async def generate_contract(
     - bank_split_client_agreement: Client consent
     - bank_split_agency_agreement: Agency split agreement
     """
-    from app.services.contract import ContractGenerationService
-    from app.models.document import TemplateType
-
-    service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
-
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    # Check access
-    is_participant = (
-        deal.created_by_user_id == current_user.id or
-        deal.agent_user_id == current_user.id
-    )
-    if not is_participant:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
-
     # Map contract type
-    try:
-        template_type = TemplateType(contract_type)
-    except ValueError:
+    template_type = _TEMPLATE_TYPES.get(contract_type)
+    if template_type is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid contract type: {contract_type}"
         )
 
+    # Deal access check and template lookup are independent - run them
+    # concurrently (template on its own session, one query per connection)
+    deal, template = await asyncio.gather(
+        fetch_deal_with_access(db, deal_id, current_user.id),
+        _load_contract_template(template_type),
+    )
+
     contract_service = ContractGenerationService(db)
     contract = await contract_service.generate_contract(
         deal=deal,
         template_type=template_type,
         agent_user=current_user,
+        template=template,
     )
 
     await db.commit()
 
-    return {
+    return _json_response({
         "id": str(contract.id),
         "contract_number": contract.contract_number,
         "contract_type": contract.contract_type,
         "status": contract.status,
-        "generated_at": contract.generated_at.isoformat(),
-        "expires_at": contract.expires_at.isoformat() if contract.expires_at else None,
+        "generated_at": contract.generated_at,
+        "expires_at": contract.expires_at,
         "required_signers": contract.required_signers,
-    }
+    }, status_code=status.HTTP_201_CREATED)
 
 
-@router.get("/{deal_id}/contracts")
+@router.get("/{deal_id}/contracts", response_model=ContractListResponse)
 async def list_deal_contracts(
     deal_id: UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """List all contracts for a deal"""
-    from app.services.contract import ContractGenerationService
+    response = await _list_response(
+        db,
+        ContractGenerationService.deal_contracts_for_participant_stmt(
+            deal_id, current_user.id, columns_only=True
+        ),
+        ContractListResponse,
+        columns_only=True,
+    )
 
-    service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
+    if response is None:
+        # Empty result: distinguish "no contracts" from 404/403
+        await fetch_deal_with_access(db, deal_id, current_user.id)
+        return ContractListResponse(items=[], total=0)
 
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
+    return response
 
-    # Check access
-    is_participant = (
-        deal.created_by_user_id == current_user.id or
-        deal.agent_user_id == current_user.id
-    )
-    if not is_participant:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
-    contract_service = ContractGenerationService(db)
-    contracts = await contract_service.get_deal_contracts(deal_id)
+_HTML_CHUNK_SIZE = 64 * 1024
 
-    return {
-        "items": [
-            {
-                "id": str(c.id),
-                "contract_number": c.contract_number,
-                "contract_type": c.contract_type,
-                "status": c.status,
-                "generated_at": c.generated_at.isoformat() if c.generated_at else None,
-                "signed_at": c.signed_at.isoformat() if c.signed_at else None,
-                "expires_at": c.expires_at.isoformat() if c.expires_at else None,
-                "required_signers": c.required_signers,
-            }
-            for c in contracts
-        ],
-        "total": len(contracts)
-    }
+
+def _iter_html_chunks(html: str):
+    """Yield UTF-8 encoded chunks of a rendered document"""
+    for start in range(0, len(html), _HTML_CHUNK_SIZE):
+        yield html[start:start + _HTML_CHUNK_SIZE].encode("utf-8")
 
 
-@router.get("/contracts/{contract_id}")
+@router.get("/contracts/{contract_id}", response_model=ContractResponse)
 async def get_contract(
     contract_id: UUID,
+    include_html: bool = Query(True, description="Embed html_content; use /contracts/{id}/html to stream it instead"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get contract details including HTML content"""
-    from app.services.contract import ContractGenerationService
-
+    """Get contract details, optionally including HTML content"""
     contract_service = ContractGenerationService(db)
-    contract = await contract_service.get_contract(contract_id)
+    # Contract + deal access check in one query
+    contract = await contract_service.get_contract_for_participant(contract_id, current_user.id)
 
     if not contract:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contract not found")
+        # Slow path only on failure: figure out 404 vs 403
+        contract = await contract_service.get_contract(contract_id)
+        if not contract:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contract not found")
+        await fetch_deal_with_access(db, contract.deal_id, current_user.id)
+
+    return _json_response(_construct_response(
+        ContractResponse,
+        contract,
+        html_content=contract.html_content if include_html else None,
+        commission_amount=float(contract.commission_amount) if contract.commission_amount else None,
+    ))
+
+
+@router.get("/contracts/{contract_id}/html")
+async def get_contract_html(
+    contract_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get rendered contract HTML.
 
-    # Check access through deal
-    service = BankSplitDealService(db)
-    deal = await service.get_deal(contract.deal_id)
+    Served as text/html in chunks, so large contracts are not JSON-escaped
+    and re-encoded inside the contract details response.
+    """
+    contract_service = ContractGenerationService(db)
+    # Loads only the html_content column, access check in the same query
+    html = await contract_service.get_contract_html_for_participant(contract_id, current_user.id)
 
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
+    if html is None:
+        # Slow path only on failure: 404 vs 403 vs no rendered HTML
+        contract = await contract_service.get_contract(contract_id)
+        if not contract:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contract not found")
+        await fetch_deal_with_access(db, contract.deal_id, current_user.id)
+        html = contract.html_content
+        if html is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contract HTML not available")
 
-    is_participant = (
-        deal.created_by_user_id == current_user.id or
-        deal.agent_user_id == current_user.id
-    )
-    if not is_participant:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
-
-    return {
-        "id": str(contract.id),
-        "contract_number": contract.contract_number,
-        "contract_type": contract.contract_type,
-        "status": contract.status,
-        "html_content": contract.html_content,
-        "document_hash": contract.document_hash,
-        "contract_data": contract.contract_data,
-        "commission_amount": float(contract.commission_amount) if contract.commission_amount else None,
-        "generated_at": contract.generated_at.isoformat() if contract.generated_at else None,
-        "signed_at": contract.signed_at.isoformat() if contract.signed_at else None,
-        "expires_at": contract.expires_at.isoformat() if contract.expires_at else None,
-        "required_signers": contract.required_signers,
-    }
+    return StreamingResponse(_iter_html_chunks(html), media_type="text/html; charset=utf-8")
 
 
 @router.post("/contracts/{contract_id}/sign", status_code=status.HTTP_200_OK)
@@ -1597,8 +1663,6 @@ async def sign_contract(
     db: AsyncSession = Depends(get_db),
 ):
     """Sign a contract"""
-    from app.services.contract import ContractGenerationService
-
     # Get client info
     client_ip = request.client.host if request.client else None
     user_agent = request.headers.get("user-agent")
@@ -1606,7 +1670,7 @@ async def sign_contract(
     contract_service = ContractGenerationService(db)
 
     try:
-        signature = await contract_service.sign_contract(
+        signature, contract = await contract_service.sign_contract(
             contract_id=contract_id,
             user=current_user,
             ip_address=client_ip,
@@ -1617,15 +1681,12 @@ async def sign_contract(
 
     await db.commit()
 
-    # Get updated contract status
-    contract = await contract_service.get_contract(contract_id)
-
-    return {
+    return _json_response({
         "message": "Contract signed successfully",
-        "signed_at": signature.signed_at.isoformat(),
+        "signed_at": signature.signed_at,
         "contract_status": contract.status,
         "all_signed": contract.status == "fully_signed",
-    }
+    })
 
 
 # ============================================
@@ -1633,9 +1694,18 @@ async def sign_contract(
 # ============================================
 
 
-@router.get("/{deal_id}/payment-info")
+_PAYMENT_STATUS = case(
+    (Deal.status.in_(("closed", "payout_ready", "payout_in_progress")), literal("paid")),
+    (Deal.status.in_(("cancelled", "refunded")), literal("cancelled")),
+    (Deal.expires_at < func.now(), literal("expired")),
+    else_=literal("pending"),
+)
+
+
+@router.get("/{deal_id}/payment-info", response_model=PaymentInfoResponse)
 async def get_payment_info(
     deal_id: UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -1643,41 +1713,40 @@ async def get_payment_info(
 
     This is a PUBLIC endpoint - no authentication required.
     Used by the public payment page to display payment information.
-    """
-    from app.schemas.bank_split import PaymentInfoResponse
-    from datetime import datetime
 
-    service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
-
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
+    The rendered body is cached for a few seconds and carries an ETag, so page
+    reloads hit Redis or get a 304 instead of querying the deal.
+    """
+    body = await payment_info_cache.get(deal_id)
+    if body is None:
+        # Only the columns the page needs, with the payment status mapped in SQL
+        stmt = select(
+            Deal.id.label("deal_id"),
+            func.coalesce(func.nullif(Deal.property_address, ""), "Адрес не указан").label("property_address"),
+            func.coalesce(Deal.commission_agent, 0).label("amount"),
+            Deal.payment_link_url.label("payment_url"),
+            Deal.payment_qr_payload.label("qr_code"),
+            Deal.expires_at,
+            _PAYMENT_STATUS.label("status"),
+            Deal.client_name,
+        ).where(Deal.id == deal_id, Deal.deleted_at.is_(None))
+        row = (await db.execute(stmt)).first()
+
+        if not row:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
+
+        body = _construct_response(PaymentInfoResponse, row).model_dump_json()
+        await payment_info_cache.set(deal_id, body)
+
+    headers = {
+        "ETag": f'W/"{hashlib.sha256(body.encode()).hexdigest()[:16]}"',
+        # The body carries the client name, so keep it out of shared caches
+        "Cache-Control": f"private, max-age={payment_info_cache.CLIENT_MAX_AGE_SECONDS}",
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    # Map deal status to payment status
-    if deal.status in ('closed', 'payout_ready', 'payout_in_progress'):
-        payment_status = 'paid'
-    elif deal.status in ('cancelled', 'refunded'):
-        payment_status = 'cancelled'
-    elif deal.expires_at:
-        # Handle timezone-aware/naive comparison
-        expires_at = deal.expires_at.replace(tzinfo=None) if deal.expires_at.tzinfo else deal.expires_at
-        if datetime.utcnow() > expires_at:
-            payment_status = 'expired'
-        else:
-            payment_status = 'pending'
-    else:
-        payment_status = 'pending'
-
-    return PaymentInfoResponse(
-        deal_id=deal.id,
-        property_address=deal.property_address or "Адрес не указан",
-        amount=deal.commission_agent or 0,
-        payment_url=deal.payment_link_url,
-        qr_code=deal.payment_qr_payload,
-        expires_at=deal.expires_at,
-        status=payment_status,
-        client_name=deal.client_name,
-    )
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 # ============================================
@@ -1707,28 +1776,29 @@ async def validate_inn(
     Returns:
         Validation result with detailed information
     """
-    from app.services.inn import INNValidationService
-
     service = INNValidationService(db)
     result = await service.validate_recipient_inn(inn=inn, role=role)
 
-    return {
+    return _json_response({
         "inn": result.inn,
         "is_valid": result.is_valid,
         "status": result.status.value,
         "inn_type": result.inn_type,
         "npd_status": result.npd_status.value if result.npd_status else None,
-        "npd_registration_date": result.npd_registration_date.isoformat() if result.npd_registration_date else None,
+        "npd_registration_date": result.npd_registration_date,
         "is_blacklisted": result.is_blacklisted,
         "errors": result.errors,
         "warnings": result.warnings,
-    }
+    })
 
 
 # ============================================
 # Webhook endpoint
 # ============================================
 
+# Stateless apart from the secret read from settings - shared per process
+_tbank_webhook_handler = TBankWebhookHandler()
+
 
 @router.post("/webhooks/tbank", response_model=WebhookResponse)
 async def tbank_webhook(
@@ -1745,14 +1815,9 @@ async def tbank_webhook(
     - Idempotent processing (duplicate webhooks are no-op)
     - Dead Letter Queue for failed events
     """
-    from datetime import datetime
-    from app.services.bank_split.webhook_service import (
-        verify_webhook_signature,
-        WebhookService,
-    )
-
     # Get raw body for signature verification
     body = await request.body()
+    request.state.body_hash = hashlib.sha256(body).hexdigest()
 
     # Verify signature from header
     signature = request.headers.get("X-TBank-Signature", "")
@@ -1776,7 +1841,8 @@ async def tbank_webhook(
 
     # Parse payload
     try:
-        payload_dict = await request.json()
+        # Decode the already-read body once instead of request.json()
+        payload_dict = orjson.loads(body)
         payload = TBankWebhookPayload(**payload_dict)
     except Exception as e:
         logger.error(f"Failed to parse webhook payload: {e}")
@@ -1785,23 +1851,67 @@ async def tbank_webhook(
             detail="Invalid webhook payload"
         )
 
-    # Initialize services
-    handler = TBankWebhookHandler()
     webhook_service = WebhookService(db)
 
     # Generate idempotency key from payload
-    # Use EventId if available, otherwise PaymentId + Status
+    # Use EventId if available, otherwise PaymentId + Status,
+    # falling back to the raw body hash when Status is missing
     idempotency_key = (
         payload_dict.get("EventId") or
-        f"{payload.PaymentId}:{payload_dict.get('Status', 'unknown')}"
+        f"{payload.PaymentId}:{payload_dict.get('Status') or request.state.body_hash}"
     )
 
-    # Check idempotency - if already processed, return success immediately
-    existing_event = await webhook_service.check_idempotency(idempotency_key)
-    if existing_event:
-        logger.info(f"Webhook already processed: {idempotency_key}")
-        return WebhookResponse(Success=True)
+    # Fast duplicate check in Redis - retries never reach Postgres
+    if not await webhook_idempotency_cache.claim(idempotency_key):
+        if await webhook_idempotency_cache.is_done(idempotency_key):
+            logger.info(f"Webhook already processed: {idempotency_key}")
+            return WebhookResponse(Success=True)
+        # Still in flight elsewhere - don't ack before its outcome is known
+        logger.info(f"Webhook is being processed: {idempotency_key}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Webhook is being processed"
+        )
 
+    processed = False
+    try:
+        # Durable check - covers keys that have expired from Redis
+        if await webhook_service.check_idempotency(idempotency_key):
+            logger.info(f"Webhook already processed: {idempotency_key}")
+            processed = True
+        else:
+            processed = await _process_tbank_webhook(
+                db, webhook_service, _tbank_webhook_handler, payload, payload_dict, idempotency_key, signature_valid
+            )
+    finally:
+        # Also runs on cancellation; a crashed worker's claim just expires
+        if processed:
+            await webhook_idempotency_cache.mark_done(idempotency_key)
+        else:
+            # Failed events are not deduplicated by the DB check either;
+            # let a bank retry be processed again
+            await webhook_idempotency_cache.release(idempotency_key)
+
+    # Always return success to prevent T-Bank retries
+    # (failed events are stored in DLQ for manual handling)
+    return WebhookResponse(Success=True)
+
+
+async def _process_tbank_webhook(
+    db: AsyncSession,
+    webhook_service: WebhookService,
+    handler: TBankWebhookHandler,
+    payload: TBankWebhookPayload,
+    payload_dict: dict,
+    idempotency_key: str,
+    signature_valid: bool,
+) -> bool:
+    """
+    Record a new T-Bank webhook event and apply it to its deal.
+
+    Returns:
+        True if the event was committed as processed
+    """
     # Parse event
     event = handler.parse_event(payload_dict)
 
@@ -1815,7 +1925,7 @@ async def tbank_webhook(
         idempotency_key=idempotency_key,
         status="pending",
         signature_valid=signature_valid,
-        received_at=datetime.utcnow(),
+        received_at=utc_now(),
     )
 
     deal_id = None
@@ -1825,7 +1935,9 @@ async def tbank_webhook(
         try:
             deal_id = UUID(payload.OrderId)
             service = BankSplitDealService(db)
-            deal = await service.get_deal(deal_id)
+            # Recipients feed handle_payment_received; milestones are never
+            # touched here, so skip their selectin query
+            deal = await service.get_deal(deal_id, load=("split_recipients",))
 
             if deal:
                 bank_event.deal_id = deal.id
@@ -1894,9 +2006,7 @@ async def tbank_webhook(
     db.add(bank_event)
     await db.commit()
 
-    # Always return success to prevent T-Bank retries
-    # (failed events are stored in DLQ for manual handling)
-    return WebhookResponse(Success=True)
+    return bank_event.status == "processed"
 
 
 # ============================================
@@ -1904,6 +2014,19 @@ async def tbank_webhook(
 # ============================================
 
 
+# T-Bank Checks status -> receipt status; anything else leaves the receipt as is
+_CHECKS_RECEIPT_STATUSES = MappingProxyType({
+    "done": FiscalReceiptStatus.CREATED,
+    "confirmed": FiscalReceiptStatus.CREATED,
+    "success": FiscalReceiptStatus.CREATED,
+    "fail": FiscalReceiptStatus.FAILED,
+    "failed": FiscalReceiptStatus.FAILED,
+    "error": FiscalReceiptStatus.FAILED,
+    "cancelled": FiscalReceiptStatus.CANCELLED,
+    "canceled": FiscalReceiptStatus.CANCELLED,
+})
+
+
 @router.post("/webhooks/tbank-checks", response_model=WebhookResponse)
 async def tbank_checks_webhook(
     request: Request,
@@ -1920,14 +2043,9 @@ async def tbank_checks_webhook(
     - Receipt failed to create
     - Receipt was cancelled
     """
-    from datetime import datetime
-    from uuid import UUID as PyUUID
-    from app.services.fiscalization import FiscalReceiptService
-    from app.models.fiscalization import FiscalReceipt, FiscalReceiptStatus
-
     # Parse payload
     try:
-        payload_dict = await request.json()
+        payload_dict = orjson.loads(await request.body())
     except Exception as e:
         logger.error(f"Failed to parse T-Bank Checks webhook payload: {e}")
         raise HTTPException(
@@ -1937,67 +2055,83 @@ async def tbank_checks_webhook(
 
     logger.info(f"Received T-Bank Checks webhook: {payload_dict}")
 
-    # Extract receipt info from payload
+    # Validate and normalize everything before touching the database
+    try:
+        payload = TBankChecksWebhookPayload.model_validate(payload_dict)
+    except ValidationError as e:
+        logger.warning(f"Malformed T-Bank Checks webhook payload: {e}")
+        return WebhookResponse(Success=True)
+
     # T-Bank Checks webhook format may vary, handle both formats
-    receipt_id = payload_dict.get("ReceiptId") or payload_dict.get("PaymentId")
-    receipt_status = payload_dict.get("Status", "").lower()
-    order_id = payload_dict.get("OrderId")
+    receipt_id = payload.ReceiptId or payload.PaymentId
+    receipt_status = (payload.Status or "").lower()
 
     if not receipt_id:
         logger.warning("T-Bank Checks webhook missing ReceiptId/PaymentId")
         return WebhookResponse(Success=True)
 
-    # Find the fiscal receipt by external_id
-    from sqlalchemy import select
-
-    stmt = select(FiscalReceipt).where(FiscalReceipt.external_id == receipt_id)
-    result = await db.execute(stmt)
-    fiscal_receipt = result.scalar_one_or_none()
+    new_status = _CHECKS_RECEIPT_STATUSES.get(receipt_status)
+    if new_status is None:
+        # Stale or unknown states never change a receipt
+        logger.info(f"Ignoring T-Bank Checks webhook with status: {receipt_status}")
+        return WebhookResponse(Success=True)
 
-    if not fiscal_receipt and order_id:
-        # Try finding by deal_id (order_id is our deal UUID)
+    updates = {"status": new_status.value}
+    if new_status == FiscalReceiptStatus.CREATED:
+        updates["confirmed_at"] = utc_now()
+        # Extract fiscal data if available
+        if {"FiscalNumber", "Fp"} & payload.model_fields_set:
+            updates["fiscal_data"] = {
+                "fiscal_number": payload.FiscalNumber,
+                "fiscal_sign": payload.Fp,
+                "fiscal_document": payload.Fd,
+                "fn_number": payload.FnNumber,
+            }
+        # Get receipt URL if available
+        if payload.ReceiptUrl:
+            updates["receipt_url"] = payload.ReceiptUrl
+    elif new_status == FiscalReceiptStatus.FAILED:
+        updates["error_code"] = payload.ErrorCode
+        updates["error_message"] = payload.Message or payload.ErrorMessage
+
+    # order_id is our deal UUID
+    deal_uuid = None
+    if payload.OrderId:
         try:
-            deal_uuid = PyUUID(order_id)
-            stmt = select(FiscalReceipt).where(
-                FiscalReceipt.deal_id == deal_uuid,
-                FiscalReceipt.status == FiscalReceiptStatus.PENDING.value,
-            ).order_by(FiscalReceipt.created_at.desc())
-            result = await db.execute(stmt)
-            fiscal_receipt = result.scalar_one_or_none()
+            deal_uuid = UUID(payload.OrderId)
         except ValueError:
             pass
 
+    # Find the fiscal receipt by external_id, waiting for a concurrent retry
+    # of the same webhook to finish with the row
+    fiscal_receipt = await db.scalar(
+        select(FiscalReceipt)
+        .where(FiscalReceipt.external_id == receipt_id)
+        .with_for_update()
+    )
+
+    # Fall back to the latest pending receipt of the deal only when no
+    # receipt carries this external_id at all
+    if fiscal_receipt is None and deal_uuid is not None:
+        fiscal_receipt = await db.scalar(
+            select(FiscalReceipt)
+            .where(
+                FiscalReceipt.deal_id == deal_uuid,
+                FiscalReceipt.status == FiscalReceiptStatus.PENDING.value,
+            )
+            .order_by(FiscalReceipt.created_at.desc())
+            .limit(1)
+            .with_for_update()
+        )
+
     if not fiscal_receipt:
         logger.warning(f"Fiscal receipt not found for external_id: {receipt_id}")
         return WebhookResponse(Success=True)
 
     # Update receipt status
     old_status = fiscal_receipt.status
-
-    if receipt_status in ("done", "confirmed", "success"):
-        fiscal_receipt.status = FiscalReceiptStatus.CREATED.value
-        fiscal_receipt.confirmed_at = datetime.utcnow()
-
-        # Extract fiscal data if available
-        if "FiscalNumber" in payload_dict or "Fp" in payload_dict:
-            fiscal_receipt.fiscal_data = {
-                "fiscal_number": payload_dict.get("FiscalNumber"),
-                "fiscal_sign": payload_dict.get("Fp"),
-                "fiscal_document": payload_dict.get("Fd"),
-                "fn_number": payload_dict.get("FnNumber"),
-            }
-
-        # Get receipt URL if available
-        if payload_dict.get("ReceiptUrl"):
-            fiscal_receipt.receipt_url = payload_dict["ReceiptUrl"]
-
-    elif receipt_status in ("fail", "failed", "error"):
-        fiscal_receipt.status = FiscalReceiptStatus.FAILED.value
-        fiscal_receipt.error_code = payload_dict.get("ErrorCode")
-        fiscal_receipt.error_message = payload_dict.get("Message") or payload_dict.get("ErrorMessage")
-
-    elif receipt_status in ("cancelled", "canceled"):
-        fiscal_receipt.status = FiscalReceiptStatus.CANCELLED.value
+    for field, value in updates.items():
+        setattr(fiscal_receipt, field, value)
 
     await db.commit()
 
@@ -2015,90 +2149,49 @@ async def tbank_checks_webhook(
 # ============================================
 
 
+def _milestone_response(milestone) -> MilestoneResponse:
+    """Build MilestoneResponse from an ORM row without re-validating DB values"""
+    return _construct_response(MilestoneResponse, milestone)
+
+
 @router.get("/{deal_id}/milestones")
 async def get_deal_milestones(
     deal_id: UUID,
-    current_user: User = Depends(get_current_user),
+    deal: DealAuthContext = Depends(require_deal_participant),
     db: AsyncSession = Depends(get_db),
+    milestone_service: MilestoneService = Depends(get_milestone_service),
 ):
     """
     Get all milestones for a deal.
 
     Returns list of payment milestones with their status and release information.
     """
-    from app.services.bank_split.milestone_service import MilestoneService
-    from app.schemas.bank_split import MilestoneResponse, MilestoneListResponse
-    from decimal import Decimal
-
-    # Check deal access
-    service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
-
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    is_participant = (
-        deal.created_by_user_id == current_user.id or
-        deal.agent_user_id == current_user.id
+    # Totals are summed by the database
+    totals = await milestone_service.get_totals(deal_id)
+    amounts = {
+        "total_amount": totals.total_amount,
+        "released_amount": totals.released_amount,
+        "pending_amount": totals.pending_amount,
+    }
+    response = await _list_response(
+        db,
+        MilestoneService.deal_milestones_stmt(deal_id),
+        MilestoneListResponse,
+        **amounts,
     )
-    if not is_participant:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
-
-    # Get milestones
-    milestone_service = MilestoneService(db)
-    milestones = await milestone_service.get_deal_milestones(deal_id)
-
-    # Calculate totals
-    total_amount = Decimal("0")
-    released_amount = Decimal("0")
-    pending_amount = Decimal("0")
-
-    items = []
-    for m in milestones:
-        total_amount += m.amount
-        if m.status == "released":
-            released_amount += m.amount
-        elif m.status != "cancelled":
-            pending_amount += m.amount
-
-        items.append(MilestoneResponse(
-            id=m.id,
-            deal_id=m.deal_id,
-            step_no=m.step_no,
-            name=m.name,
-            description=m.description,
-            amount=m.amount,
-            percent=m.percent,
-            currency=m.currency,
-            status=m.status,
-            release_trigger=m.release_trigger,
-            release_delay_hours=m.release_delay_hours,
-            release_date=m.release_date,
-            release_scheduled_at=m.release_scheduled_at,
-            paid_at=m.paid_at,
-            confirmed_at=m.confirmed_at,
-            released_at=m.released_at,
-            confirmed_by_user_id=m.confirmed_by_user_id,
-            external_step_id=m.external_step_id,
-            created_at=m.created_at,
-            updated_at=m.updated_at,
-        ))
+    if response is not None:
+        return response
 
-    return MilestoneListResponse(
-        items=items,
-        total=len(items),
-        total_amount=total_amount,
-        released_amount=released_amount,
-        pending_amount=pending_amount,
-    )
+    return _json_response(MilestoneListResponse(items=[], total=0, **amounts))
 
 
 @router.post("/{deal_id}/milestones", status_code=status.HTTP_201_CREATED)
 async def create_milestones(
     deal_id: UUID,
-    request: Request,
+    milestones_request: CreateMilestonesRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    milestone_service: MilestoneService = Depends(get_milestone_service),
 ):
     """
     Create milestones for a deal.
@@ -2119,21 +2212,14 @@ async def create_milestones(
     }
     ```
     """
-    from app.services.bank_split.milestone_service import MilestoneService, MilestoneConfig
-    from app.schemas.bank_split import CreateMilestonesRequest, MilestoneResponse
-    from app.models.bank_split import ReleaseTrigger
+    # Check deal access (deal row and milestone existence in one query)
+    found = await milestone_service.get_deal_with_milestone_flag(deal_id)
 
-    # Parse request
-    body = await request.json()
-    milestones_request = CreateMilestonesRequest(**body)
-
-    # Check deal access
-    service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
-
-    if not deal:
+    if not found:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
 
+    deal, has_milestones = found
+
     if deal.created_by_user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -2148,9 +2234,7 @@ async def create_milestones(
         )
 
     # Check if milestones already exist
-    milestone_service = MilestoneService(db)
-    existing = await milestone_service.get_deal_milestones(deal_id)
-    if existing:
+    if has_milestones:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Milestones already exist for this deal"
@@ -2174,36 +2258,18 @@ async def create_milestones(
             config=configs,
             total_amount=deal.commission_agent,
         )
+        # Response is built from RETURNING values, so only I/O follows
+        response = _json_response(
+            {
+                "message": f"Created {len(milestones)} milestones",
+                "milestones": [_milestone_response(m).model_dump(mode="json") for m in milestones],
+            },
+            status_code=status.HTTP_201_CREATED,
+        )
         await db.commit()
+        await milestone_summary_cache.invalidate(deal_id)
 
-        return {
-            "message": f"Created {len(milestones)} milestones",
-            "milestones": [
-                MilestoneResponse(
-                    id=m.id,
-                    deal_id=m.deal_id,
-                    step_no=m.step_no,
-                    name=m.name,
-                    description=m.description,
-                    amount=m.amount,
-                    percent=m.percent,
-                    currency=m.currency,
-                    status=m.status,
-                    release_trigger=m.release_trigger,
-                    release_delay_hours=m.release_delay_hours,
-                    release_date=m.release_date,
-                    release_scheduled_at=m.release_scheduled_at,
-                    paid_at=m.paid_at,
-                    confirmed_at=m.confirmed_at,
-                    released_at=m.released_at,
-                    confirmed_by_user_id=m.confirmed_by_user_id,
-                    external_step_id=m.external_step_id,
-                    created_at=m.created_at,
-                    updated_at=m.updated_at,
-                )
-                for m in milestones
-            ]
-        }
+        return response
 
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -2213,9 +2279,10 @@ async def create_milestones(
 async def release_milestone(
     deal_id: UUID,
     milestone_id: UUID,
-    request: Request,
+    release_request: MilestoneReleaseRequest = Body(default_factory=MilestoneReleaseRequest),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    milestone_service: MilestoneService = Depends(get_milestone_service),
 ):
     """
     Manually release a milestone.
@@ -2223,56 +2290,43 @@ async def release_milestone(
     For milestones with CONFIRMATION trigger, this releases the funds immediately.
     For other triggers, use force=true to release before scheduled time.
     """
-    from app.services.bank_split.milestone_service import MilestoneService
-    from app.schemas.bank_split import MilestoneReleaseRequest, MilestoneReleaseResponse
-
-    # Parse request
-    body = await request.json() if await request.body() else {}
-    release_request = MilestoneReleaseRequest(**body)
+    # Get deal and milestone (the join guarantees the milestone belongs to the deal)
+    found = await milestone_service.get_deal_milestone(deal_id, milestone_id)
 
-    # Check deal access
-    service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
+    if not found:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Milestone not found")
 
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
+    deal, milestone = found
 
     if deal.created_by_user_id != current_user.id and deal.agent_user_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
-    # Get milestone
-    milestone_service = MilestoneService(db)
-    milestone = await milestone_service.get_milestone(milestone_id)
-
-    if not milestone:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Milestone not found")
-
-    if milestone.deal_id != deal_id:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Milestone does not belong to this deal")
-
     # Process release
     result = await milestone_service.process_milestone_release(
         milestone_id=milestone_id,
         force=release_request.force,
     )
-    await db.commit()
-
-    return MilestoneReleaseResponse(
+    response = MilestoneReleaseResponse(
         milestone_id=milestone_id,
         success=result.success,
         released_amount=result.released_amount,
         error_message=result.error_message,
         new_status=result.milestone.status if result.milestone else "unknown",
     )
+    await db.commit()
+    await milestone_summary_cache.invalidate(deal_id)
+
+    return response
 
 
 @router.post("/{deal_id}/milestones/{milestone_id}/confirm")
 async def confirm_milestone(
     deal_id: UUID,
     milestone_id: UUID,
-    request: Request,
+    confirm_request: MilestoneConfirmRequest = Body(default_factory=MilestoneConfirmRequest),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    milestone_service: MilestoneService = Depends(get_milestone_service),
 ):
     """
     Confirm a milestone for release.
@@ -2280,19 +2334,13 @@ async def confirm_milestone(
     This is used for milestones with CONFIRMATION trigger.
     After confirmation, the milestone moves to HOLD status and is released immediately.
     """
-    from app.services.bank_split.milestone_service import MilestoneService
-    from app.schemas.bank_split import MilestoneConfirmRequest, MilestoneConfirmResponse
+    # Get deal and milestone (the join guarantees the milestone belongs to the deal)
+    found = await milestone_service.get_deal_milestone(deal_id, milestone_id)
 
-    # Parse request
-    body = await request.json() if await request.body() else {}
-    confirm_request = MilestoneConfirmRequest(**body)
-
-    # Check deal access
-    service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
+    if not found:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Milestone not found")
 
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
+    deal, milestone = found
 
     is_participant = (
         deal.created_by_user_id == current_user.id or
@@ -2301,31 +2349,23 @@ async def confirm_milestone(
     if not is_participant:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
-    # Get milestone
-    milestone_service = MilestoneService(db)
-    milestone = await milestone_service.get_milestone(milestone_id)
-
-    if not milestone:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Milestone not found")
-
-    if milestone.deal_id != deal_id:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Milestone does not belong to this deal")
-
     try:
         milestone = await milestone_service.confirm_milestone(
             milestone_id=milestone_id,
             user=current_user,
             notes=confirm_request.notes,
         )
-        await db.commit()
-
-        return MilestoneConfirmResponse(
+        response = MilestoneConfirmResponse(
             milestone_id=milestone_id,
             confirmed_at=milestone.confirmed_at,
             confirmed_by_user_id=milestone.confirmed_by_user_id,
             new_status=milestone.status,
             release_scheduled_at=milestone.release_scheduled_at,
         )
+        await db.commit()
+        await milestone_summary_cache.invalidate(deal_id)
+
+        return response
 
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -2334,50 +2374,23 @@ async def confirm_milestone(
 @router.get("/{deal_id}/milestones/summary")
 async def get_milestones_summary(
     deal_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    deal: DealAuthContext = Depends(require_deal_participant),
+    milestone_service: MilestoneService = Depends(get_milestone_service),
 ):
     """
     Get summary of milestones for a deal.
 
     Returns total amounts, released amounts, and milestone details.
     """
-    from app.services.bank_split.milestone_service import MilestoneService
-
-    # Check deal access
-    service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
-
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    is_participant = (
-        deal.created_by_user_id == current_user.id or
-        deal.agent_user_id == current_user.id
-    )
-    if not is_participant:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
-
-    milestone_service = MilestoneService(db)
     summary = await milestone_service.get_milestones_summary(deal_id)
 
     return summary
 
 
-@router.get("/milestones/configs")
-async def get_milestone_configs(
-    current_user: User = Depends(get_current_user),
-):
-    """
-    Get available predefined milestone configurations.
-
-    Returns list of available configs that can be used when creating milestones.
-    """
-    from app.services.bank_split.milestone_service import DEFAULT_MILESTONE_CONFIGS
-
-    configs = {}
-    for name, config_list in DEFAULT_MILESTONE_CONFIGS.items():
-        configs[name] = [
+# Predefined configs never change at runtime, so the payload is encoded once
+_MILESTONE_CONFIGS_JSON = orjson.dumps({
+    "configs": {
+        name: [
             {
                 "name": c.name,
                 "percent": float(c.percent),
@@ -2387,11 +2400,22 @@ async def get_milestone_configs(
             }
             for c in config_list
         ]
+        for name, config_list in DEFAULT_MILESTONE_CONFIGS.items()
+    },
+    "available": list(DEFAULT_MILESTONE_CONFIGS.keys()),
+})
 
-    return {
-        "configs": configs,
-        "available": list(DEFAULT_MILESTONE_CONFIGS.keys()),
-    }
+
+@router.get("/milestones/configs")
+async def get_milestone_configs(
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get available predefined milestone configurations.
+
+    Returns list of available configs that can be used when creating milestones.
+    """
+    return Response(content=_MILESTONE_CONFIGS_JSON, media_type="application/json")
 
 
 # ============================================
@@ -2399,10 +2423,37 @@ async def get_milestone_configs(
 # ============================================
 
 
+def _stored_passport_matches(deal: Deal, passport_data: ClientPassportUpdate) -> bool:
+    """
+    Check whether the deal already stores exactly this passport data.
+
+    Cheap comparisons (blind-index hash, plain columns) run first; the
+    remaining encrypted fields are decrypted only when those all match.
+    """
+    if not deal.client_passport_hash or deal.client_passport_hash != hash_passport(
+        passport_data.passport_series, passport_data.passport_number
+    ):
+        return False
+    if (
+        deal.client_passport_issued_date != passport_data.passport_issued_date
+        or deal.client_passport_issued_code != passport_data.passport_issued_code
+        or deal.client_birth_date != passport_data.birth_date
+    ):
+        return False
+    try:
+        return (
+            decrypt_passport_issued_by(deal.client_passport_issued_by_encrypted) == passport_data.passport_issued_by
+            and decrypt_name(deal.client_birth_place_encrypted) == passport_data.birth_place
+            and decrypt_name(deal.client_registration_address_encrypted) == passport_data.registration_address
+        )
+    except ValueError:
+        return False
+
+
 @router.put("/{deal_id}/client-passport", status_code=status.HTTP_200_OK)
 async def update_client_passport(
     deal_id: UUID,
-    request: Request,
+    passport_data: ClientPassportUpdate,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -2416,29 +2467,14 @@ async def update_client_passport(
 
     Required for contract generation.
     """
-    from app.schemas.bank_split import ClientPassportUpdate, ClientPassportResponse
-    from app.core.encryption import (
-        encrypt_passport,
-        encrypt_passport_issued_by,
-        encrypt_name,
-    )
-
-    # Parse request
-    body = await request.json()
-    passport_data = ClientPassportUpdate(**body)
-
     # Get deal
     service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
+    deal = await service.get_deal_for_user(deal_id, current_user.id, as_creator=True)
 
+    # Only deal creator can update passport
     if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    # Check access - only deal creator can update passport
-    if deal.created_by_user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only deal creator can update client passport"
+        await raise_deal_not_found_or_forbidden(
+            db, deal_id, "Only deal creator can update client passport"
         )
 
     # Check deal status - can't update passport after payment
@@ -2448,45 +2484,55 @@ async def update_client_passport(
             detail="Cannot update passport data after payment"
         )
 
-    # Encrypt passport data
-    series_enc, number_enc, passport_hash = encrypt_passport(
-        passport_data.passport_series,
-        passport_data.passport_number
-    )
-    issued_by_enc = encrypt_passport_issued_by(passport_data.passport_issued_by)
-    birth_place_enc = encrypt_name(passport_data.birth_place)
-    registration_enc = encrypt_name(passport_data.registration_address)
-
-    # Update deal
-    deal.client_passport_series_encrypted = series_enc
-    deal.client_passport_number_encrypted = number_enc
-    deal.client_passport_hash = passport_hash
-    deal.client_passport_issued_by_encrypted = issued_by_enc
-    deal.client_passport_issued_date = passport_data.passport_issued_date
-    deal.client_passport_issued_code = passport_data.passport_issued_code
-    deal.client_birth_date = passport_data.birth_date
-    deal.client_birth_place_encrypted = birth_place_enc
-    deal.client_registration_address_encrypted = registration_enc
-
-    await db.commit()
-
-    # Return masked response
+    # Masked response is built from the request, before any I/O
     series = passport_data.passport_series
     number = passport_data.passport_number
 
-    return ClientPassportResponse(
+    response = _json_response(ClientPassportResponse(
         has_passport_data=True,
         passport_series_masked=f"{series[:2]} {series[2:]}",
         passport_number_masked=f"{number[:3]} {number[3:]}",
         passport_issued_date=passport_data.passport_issued_date,
         passport_issued_code=passport_data.passport_issued_code,
         birth_date=passport_data.birth_date,
-    )
+    ))
+
+    # Re-saves of identical data skip encryption and the UPDATE
+    if not _stored_passport_matches(deal, passport_data):
+        # Encrypt passport data
+        series_enc, number_enc, passport_hash = encrypt_passport(
+            passport_data.passport_series,
+            passport_data.passport_number
+        )
+        issued_by_enc = encrypt_passport_issued_by(passport_data.passport_issued_by)
+        birth_place_enc = encrypt_name(passport_data.birth_place)
+        registration_enc = encrypt_name(passport_data.registration_address)
+
+        # Update deal
+        deal.client_passport_series_encrypted = series_enc
+        deal.client_passport_number_encrypted = number_enc
+        deal.client_passport_hash = passport_hash
+        deal.client_passport_issued_by_encrypted = issued_by_enc
+        deal.client_passport_issued_date = passport_data.passport_issued_date
+        deal.client_passport_issued_code = passport_data.passport_issued_code
+        deal.client_birth_date = passport_data.birth_date
+        deal.client_birth_place_encrypted = birth_place_enc
+        deal.client_registration_address_encrypted = registration_enc
+
+        await db.commit()
+
+    return response
+
+
+def _is_filled(column):
+    """SQL flag: column is neither NULL nor an empty string"""
+    return and_(column.is_not(None), column != "")
 
 
 @router.get("/{deal_id}/client-passport", response_model=dict)
 async def get_client_passport_status(
     deal_id: UUID,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -2495,24 +2541,29 @@ async def get_client_passport_status(
 
     Returns masked passport info (NOT decrypted data).
     Full decrypted data is only used internally for contract generation.
-    """
-    from app.schemas.bank_split import ClientPassportCheckResponse
-    from app.core.encryption import decrypt_passport_series, decrypt_passport_number
 
-    # Get deal
-    service = BankSplitDealService(db)
-    deal = await service.get_deal(deal_id)
-
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    # Check access
-    is_participant = (
-        deal.created_by_user_id == current_user.id or
-        deal.agent_user_id == current_user.id
+    Supports If-None-Match: polling clients get 304 without any decryption.
+    """
+    # Lean projection: only passport columns, with the ciphertexts that are
+    # not needed for masking reduced to "is filled" flags in SQL
+    stmt = select(
+        Deal.client_passport_series_encrypted,
+        Deal.client_passport_number_encrypted,
+        Deal.client_passport_hash,
+        _is_filled(Deal.client_passport_issued_by_encrypted).label("has_issued_by"),
+        Deal.client_passport_issued_date,
+        Deal.client_passport_issued_code,
+        Deal.client_birth_date,
+        _is_filled(Deal.client_birth_place_encrypted).label("has_birth_place"),
+        _is_filled(Deal.client_registration_address_encrypted).label("has_registration_address"),
+    ).where(
+        Deal.id == deal_id,
+        Deal.deleted_at.is_(None),
+        deal_participant_filter(current_user.id),
     )
-    if not is_participant:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+    deal = (await db.execute(stmt)).one_or_none()
+    if deal is None:
+        await raise_deal_not_found_or_forbidden(db, deal_id)
 
     # Check what fields are missing
     missing_fields = []
@@ -2520,7 +2571,7 @@ async def get_client_passport_status(
         missing_fields.append("passport_series")
     if not deal.client_passport_number_encrypted:
         missing_fields.append("passport_number")
-    if not deal.client_passport_issued_by_encrypted:
+    if not deal.has_issued_by:
         missing_fields.append("passport_issued_by")
     if not deal.client_passport_issued_date:
         missing_fields.append("passport_issued_date")
@@ -2528,15 +2579,27 @@ async def get_client_passport_status(
         missing_fields.append("passport_issued_code")
     if not deal.client_birth_date:
         missing_fields.append("birth_date")
-    if not deal.client_birth_place_encrypted:
+    if not deal.has_birth_place:
         missing_fields.append("birth_place")
-    if not deal.client_registration_address_encrypted:
+    if not deal.has_registration_address:
         missing_fields.append("registration_address")
 
     has_passport = len(missing_fields) == 0
 
+    # ETag over the passport hash and plain fields; the raw blind index is not exposed
+    etag_source = "|".join((
+        deal.client_passport_hash or "",
+        ",".join(missing_fields),
+        deal.client_passport_issued_date.isoformat() if deal.client_passport_issued_date else "",
+        deal.client_passport_issued_code or "",
+        deal.client_birth_date.isoformat() if deal.client_birth_date else "",
+    ))
+    etag = f'W/"{hashlib.sha256(etag_source.encode()).hexdigest()[:16]}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
     response = {
-        "deal_id": str(deal_id),
+        "deal_id": deal_id,
         "has_passport_data": has_passport,
         "missing_fields": missing_fields,
     }
@@ -2544,19 +2607,23 @@ async def get_client_passport_status(
     # Add masked data if available
     if deal.client_passport_series_encrypted and deal.client_passport_number_encrypted:
         # Decrypt for masking only
-        series = decrypt_passport_series(deal.client_passport_series_encrypted)
-        number = decrypt_passport_number(deal.client_passport_number_encrypted)
+        series, number = decrypt_passport(
+            deal.client_passport_series_encrypted,
+            deal.client_passport_number_encrypted,
+        )
         if series and number:
             response["passport_series_masked"] = f"{series[:2]} {series[2:]}"
             response["passport_number_masked"] = f"{number[:3]} {number[3:]}"
 
     if deal.client_passport_issued_date:
-        response["passport_issued_date"] = deal.client_passport_issued_date.isoformat()
+        response["passport_issued_date"] = deal.client_passport_issued_date
 
     if deal.client_passport_issued_code:
         response["passport_issued_code"] = deal.client_passport_issued_code
 
     if deal.client_birth_date:
-        response["birth_date"] = deal.client_birth_date.isoformat()
+        response["birth_date"] = deal.client_birth_date
 
-    return response
+    json_response = _json_response(response)
+    json_response.headers["ETag"] = etag
+    return json_response
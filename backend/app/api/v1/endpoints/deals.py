@@ -6,13 +6,15 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from pydantic import BaseModel, Field
+from sqlalchemy import BigInteger, cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, require_deal_access, require_deal_owner
+from app.api.deps import get_current_user, get_owned_deal, require_deal_access
+from app.api.v1.endpoints.sign import create_signing_token
 from app.core.config import settings
 from app.db.session import get_db
 from app.models.user import User
-from app.models.deal import DealStatus, PaymentType, AdvanceType
+from app.models.deal import Deal, DealParty, DealStatus, PaymentType, AdvanceType
 from app.schemas.deal import (
     Deal as DealSchema,
     DealUpdate,
@@ -22,6 +24,8 @@ from app.schemas.deal import (
 )
 from app.services.deal.service import DealService
 from app.services.deal.commission import commission_calculator
+from app.services.document.service import DocumentService
+from app.services.notification.service import NotificationService
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -113,6 +117,21 @@ async def calculate_commission(
         )
 
 
+# Only the columns DealSimpleResponse needs, labelled with its field names
+_DEAL_LIST_COLUMNS = (
+    Deal.id,
+    Deal.type,
+    Deal.status,
+    func.coalesce(Deal.property_address, "").label("address"),
+    cast(func.trunc(func.coalesce(Deal.price, 0)), BigInteger).label("price"),
+    cast(func.trunc(func.coalesce(Deal.commission_agent, 0)), BigInteger).label("commission_agent"),
+    Deal.client_name,
+    Deal.agent_user_id,
+    Deal.created_at,
+    Deal.updated_at,
+)
+
+
 @router.get("", response_model=DealListSimple)
 async def list_deals(
     status: Optional[DealStatus] = None,
@@ -123,25 +142,12 @@ async def list_deals(
 ):
     """List user's deals"""
     deal_service = DealService(db)
-    deals, total = await deal_service.list_deals(current_user, status=status, page=page, page_size=size)
-
-    # Convert to simplified response
-    items = []
-    for deal in deals:
-        items.append(
-            DealSimpleResponse(
-                id=deal.id,
-                type=deal.type,
-                status=deal.status,
-                address=deal.property_address or "",
-                price=int(deal.price or 0),
-                commission_agent=int(deal.commission_agent or 0),
-                client_name=deal.client_name,
-                agent_user_id=deal.agent_user_id,
-                created_at=deal.created_at,
-                updated_at=deal.updated_at,
-            )
-        )
+    rows, total = await deal_service.list_deals(
+        current_user, status=status, page=page, page_size=size, columns=_DEAL_LIST_COLUMNS
+    )
+
+    # Rows come straight from the DB, so skip re-validation
+    items = [DealSimpleResponse.model_construct(**row._mapping) for row in rows]
 
     return DealListSimple(items=items, total=total, page=page, size=size)
 
@@ -230,15 +236,9 @@ async def update_deal(
 
 
 @router.post("/{deal_id}/submit", response_model=DealSchema)
-async def submit_deal(deal_id: str, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+async def submit_deal(deal: Deal = Depends(get_owned_deal), db: AsyncSession = Depends(get_db)):
     """Submit deal for signatures"""
     deal_service = DealService(db)
-    deal = await deal_service.get_by_id(deal_id)
-
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    require_deal_owner(deal, current_user)
 
     try:
         deal = await deal_service.submit_for_signatures(deal)
@@ -248,15 +248,9 @@ async def submit_deal(deal_id: str, current_user: User = Depends(get_current_use
 
 
 @router.post("/{deal_id}/cancel", response_model=DealSchema)
-async def cancel_deal(deal_id: str, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+async def cancel_deal(deal: Deal = Depends(get_owned_deal), db: AsyncSession = Depends(get_db)):
     """Cancel deal"""
     deal_service = DealService(db)
-    deal = await deal_service.get_by_id(deal_id)
-
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    require_deal_owner(deal, current_user)
 
     try:
         deal = await deal_service.cancel(deal)
@@ -266,23 +260,8 @@ async def cancel_deal(deal_id: str, current_user: User = Depends(get_current_use
 
 
 @router.post("/{deal_id}/send-for-signing")
-async def send_deal_for_signing(
-    deal_id: str, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
-):
+async def send_deal_for_signing(deal: Deal = Depends(get_owned_deal), db: AsyncSession = Depends(get_db)):
     """Generate document and send signing link to client via SMS"""
-    from app.services.document.service import DocumentService
-    from app.services.notification.service import NotificationService
-    from app.api.v1.endpoints.sign import create_signing_token
-    from app.models.deal import DealParty
-    from sqlalchemy import select
-
-    deal_service = DealService(db)
-    deal = await deal_service.get_by_id(deal_id)
-
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-
-    require_deal_owner(deal, current_user)
 
     if deal.status != DealStatus.DRAFT:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Can only send draft deals for signing")
@@ -292,7 +271,7 @@ async def send_deal_for_signing(
     try:
         document = await doc_service.generate_contract(deal)
     except Exception as e:
-        logger.error(f"Failed to generate document for deal {deal_id}: {e}", exc_info=True)
+        logger.error(f"Failed to generate document for deal {deal.id}: {e}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to generate document. Please try again later.",
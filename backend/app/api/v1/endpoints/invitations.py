@@ -6,7 +6,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy import select
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
@@ -27,6 +27,7 @@ from app.schemas.invitation import (
     InvitationActionResponse,
 )
 from app.services.bank_split import BankSplitDealService
+from app.services.sms.provider import get_sms_provider
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -68,7 +69,6 @@ async def create_invitation(
 
     # Limit pending invitations per deal (prevent abuse)
     MAX_PENDING_INVITATIONS = 10
-    from sqlalchemy import func
     pending_count_result = await db.execute(
         select(func.count(DealInvitation.id)).where(
             DealInvitation.deal_id == deal_id,
@@ -97,8 +97,6 @@ async def create_invitation(
         )
 
     # Validate total split percent doesn't exceed 100%
-    from sqlalchemy import func
-    from sqlalchemy.sql import or_
     total_result = await db.execute(
         select(func.coalesce(func.sum(DealInvitation.split_percent), 0)).where(
             DealInvitation.deal_id == deal_id,
@@ -442,8 +440,6 @@ async def resend_invitation(
 
 async def _send_invitation_sms(invitation: DealInvitation, property_address: str) -> bool:
     """Send invitation SMS"""
-    from app.services.sms.provider import get_sms_provider
-
     invite_url = f"{settings.FRONTEND_URL}/invite/{invitation.token}"
 
     # Truncate address if too long
@@ -8,11 +8,14 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
 from app.core.config import settings
+from app.core.encryption import decrypt_inn
 from app.db.session import get_db
+from app.models.payment_profile import PaymentProfile
 from app.models.user import User
 from app.schemas.onboarding import (
     OnboardingStartRequest,
@@ -123,9 +126,6 @@ async def get_onboarding_status(
 
     # If no profile_id, find user's profile
     if not profile_id:
-        from sqlalchemy import select
-        from app.models.payment_profile import PaymentProfile
-
         stmt = select(PaymentProfile).where(
             PaymentProfile.user_id == current_user.id,
             PaymentProfile.is_active == True,
@@ -172,9 +172,6 @@ async def get_onboarding_status(
     except TBankOnboardingError as e:
         logger.warning(f"Failed to get T-Bank status: {e}")
         # Return cached status from profile
-        from sqlalchemy import select
-        from app.models.payment_profile import PaymentProfile
-
         stmt = select(PaymentProfile).where(PaymentProfile.id == profile_id)
         result = await db.execute(stmt)
         profile = result.scalar_one_or_none()
@@ -377,10 +374,6 @@ async def list_payment_profiles(
 
     Returns all payment profiles owned by the current user.
     """
-    from sqlalchemy import select
-    from app.models.payment_profile import PaymentProfile
-    from app.core.encryption import decrypt_inn
-
     stmt = select(PaymentProfile).where(
         PaymentProfile.user_id == current_user.id,
         PaymentProfile.is_active == True,
@@ -428,10 +421,6 @@ async def get_payment_profile(
     """
     Get payment profile details.
     """
-    from sqlalchemy import select
-    from app.models.payment_profile import PaymentProfile
-    from app.core.encryption import decrypt_inn
-
     stmt = select(PaymentProfile).where(PaymentProfile.id == profile_id)
     result = await db.execute(stmt)
     profile = result.scalar_one_or_none()
@@ -4,13 +4,14 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
-from sqlalchemy import select, or_
+from sqlalchemy import select, or_, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
 from app.db.session import get_db
+from app.models.organization import Organization, OrganizationMember
 from app.models.user import User
-from app.schemas.user import UserResponse
+from app.schemas.user import UserResponse, AgencyInfo
 
 router = APIRouter()
 
@@ -50,10 +51,6 @@ async def get_current_user_info(
     db: AsyncSession = Depends(get_db),
 ):
     """Get current user info with organization details"""
-    from sqlalchemy import text
-    from app.models.organization import Organization, OrganizationMember
-    from app.schemas.user import UserResponse, AgencyInfo
-
     # Build response with user data
     response_data = {
         "id": current_user.id,
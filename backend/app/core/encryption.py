@@ -131,6 +131,24 @@ def decrypt_inn(encrypted: str) -> str:
 # =============================================================================
 
 
+def _normalize_passport(series: str, number: str) -> Tuple[str, str]:
+    """Normalize passport series and number: only digits"""
+    series_norm = "".join(filter(str.isdigit, series)) if series else ""
+    number_norm = "".join(filter(str.isdigit, number)) if number else ""
+    return series_norm, number_norm
+
+
+def _passport_hash(series_norm: str, number_norm: str) -> str:
+    """Combined hash for duplicate detection (серия+номер)"""
+    combined = f"{series_norm}{number_norm}"
+    return _get_crypto().blind_index(combined, field="passport") if combined else ""
+
+
+def hash_passport(series: str, number: str) -> str:
+    """Compute passport hash without encrypting (matches encrypt_passport)"""
+    return _passport_hash(*_normalize_passport(series, number))
+
+
 def encrypt_passport(series: str, number: str) -> Tuple[str, str, str]:
     """Encrypt passport series and number, create combined hash for search
 
@@ -139,18 +157,12 @@ def encrypt_passport(series: str, number: str) -> Tuple[str, str, str]:
     """
     crypto = _get_crypto()
 
-    # Normalize: only digits
-    series_norm = "".join(filter(str.isdigit, series)) if series else ""
-    number_norm = "".join(filter(str.isdigit, number)) if number else ""
+    series_norm, number_norm = _normalize_passport(series, number)
 
     series_enc = crypto.encrypt(series_norm, field="passport_series") if series_norm else ""
     number_enc = crypto.encrypt(number_norm, field="passport_number") if number_norm else ""
 
-    # Combined hash for duplicate detection (серия+номер)
-    combined = f"{series_norm}{number_norm}"
-    combined_hash = crypto.blind_index(combined, field="passport") if combined else ""
-
-    return series_enc, number_enc, combined_hash
+    return series_enc, number_enc, _passport_hash(series_norm, number_norm)
 
 
 def decrypt_passport_series(encrypted: str) -> str:
@@ -167,6 +179,18 @@ def decrypt_passport_number(encrypted: str) -> str:
     return _get_crypto().decrypt(encrypted, field="passport_number")
 
 
+def decrypt_passport(series_encrypted: str, number_encrypted: str) -> Tuple[str, str]:
+    """Decrypt passport series and number together
+
+    Returns:
+        (series, number)
+    """
+    crypto = _get_crypto()
+    series = crypto.decrypt(series_encrypted, field="passport_series") if series_encrypted else ""
+    number = crypto.decrypt(number_encrypted, field="passport_number") if number_encrypted else ""
+    return series, number
+
+
 def encrypt_passport_issued_by(issued_by: str) -> str:
     """Encrypt passport issued by field"""
     if not issued_by:
@@ -25,6 +25,7 @@ async_engine = create_async_engine(
     max_overflow=20,  # Additional connections under load
     pool_timeout=30,  # Timeout waiting for connection from pool
     pool_recycle=1800,  # Recycle connections after 30 minutes (avoid stale connections)
+    query_cache_size=1200,  # Compiled-SQL cache entries (default 500 is outgrown by the API's statement shapes)
 )
 
 # Async session factory
@@ -5,7 +5,7 @@ from contextlib import asynccontextmanager
 from uuid import uuid4
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -16,7 +16,9 @@ from minio import Minio
 
 from app.core.config import settings
 from app.core.logging_config import setup_logging
-from app.db.session import async_engine
+from app.db.session import async_engine, AsyncSessionLocal
+from app.services.contract import ContractGenerationService
+from app.services.sms.provider import close_sms_provider
 from app.api.v1.router import api_router
 
 # Configure logging before app initialization
@@ -60,8 +62,10 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         response.headers["X-Frame-Options"] = "DENY"
         response.headers["X-XSS-Protection"] = "1; mode=block"
         response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
-        response.headers["Pragma"] = "no-cache"
+        # Endpoints that opt into client caching set their own Cache-Control
+        if "cache-control" not in response.headers:
+            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
+            response.headers["Pragma"] = "no-cache"
         return response
 
 
@@ -108,6 +112,14 @@ async def lifespan(app: FastAPI):
         logger.error(f"Redis connection failed: {e}")
         raise
 
+    # Precompile active contract templates so requests only render
+    try:
+        async with AsyncSessionLocal() as db:
+            count = await ContractGenerationService(db).warm_template_cache()
+        logger.info(f"Precompiled {count} contract templates")
+    except Exception as e:
+        logger.warning(f"Contract template precompilation skipped: {e}")
+
     logger.info("Application started successfully")
 
     yield  # Application runs here
@@ -115,6 +127,9 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application...")
 
+    # Close pooled SMS provider connections
+    await close_sms_provider()
+
     # Close database connections
     await async_engine.dispose()
     logger.info("Database connections closed")
@@ -133,6 +148,7 @@ app = FastAPI(
     openapi_url=_openapi_url,
     openapi_tags=tags_metadata,
     redirect_slashes=False,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS - restricted to actual methods and headers used
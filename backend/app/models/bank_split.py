@@ -207,9 +207,9 @@ class BankEvent(BaseModel):
     # Processing
     status = Column(String(20), default="pending", nullable=False, index=True)
     signature_valid = Column(Boolean, nullable=True)
-    processed_at = Column(DateTime, nullable=True)
+    processed_at = Column(DateTime(timezone=True), nullable=True)
     processing_error = Column(Text, nullable=True)
-    received_at = Column(DateTime, nullable=False)
+    received_at = Column(DateTime(timezone=True), nullable=False)
 
     # Relationships
     deal = relationship("Deal", back_populates="bank_events")
@@ -9,6 +9,9 @@ from sqlalchemy import (
     ForeignKey,
     Text,
     DateTime,
+    Index,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -133,6 +136,21 @@ class DealConsent(BaseModel):
     """User consent record for a deal"""
 
     __tablename__ = "deal_consents"
+    __table_args__ = (
+        # At most one active consent per user, deal and type (created in
+        # migration 007; give_consent inserts with ON CONFLICT DO NOTHING
+        # against this index)
+        Index(
+            "uq_deal_consents_active",
+            "deal_id",
+            "user_id",
+            "consent_type",
+            unique=True,
+            postgresql_where=text("revoked_at IS NULL"),
+        ),
+    )
+    # Fetch server-generated agreed_at via INSERT ... RETURNING (no refresh SELECT)
+    __mapper_args__ = {"eager_defaults": True}
 
     deal_id = Column(UUID(as_uuid=True), ForeignKey("lk_deals.id"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -142,7 +160,7 @@ class DealConsent(BaseModel):
     consent_version = Column(String(20), default="1.0", nullable=False)  # Version of the agreement
 
     # When and how consent was given
-    agreed_at = Column(DateTime, nullable=False)
+    agreed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # Set by DB on INSERT
     ip_address = Column(String(45), nullable=True)  # IPv4 or IPv6
     user_agent = Column(Text, nullable=True)
 
@@ -187,7 +187,7 @@ class Deal(BaseModel, SoftDeleteMixin):
     external_account_number = Column(String(50), nullable=True)  # Nominal account number
     payment_link_url = Column(String(500), nullable=True)  # SBP/card payment link
     payment_qr_payload = Column(Text, nullable=True)  # QR code data
-    expires_at = Column(DateTime, nullable=True)  # Payment link expiry
+    expires_at = Column(DateTime(timezone=True), nullable=True)  # Payment link expiry (UTC, tz-aware)
     hold_expires_at = Column(DateTime, nullable=True)  # Hold period expiry (for instant split) - legacy
     payer_email = Column(String(255), nullable=True)  # For receipt
     description = Column(Text, nullable=True)  # Deal description for bank
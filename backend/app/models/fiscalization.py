@@ -11,7 +11,9 @@ This module contains:
 from enum import Enum as PyEnum
 from typing import Optional
 
-from sqlalchemy import Column, String, Boolean, Integer, Text, UniqueConstraint, ForeignKey, DateTime, Numeric
+from sqlalchemy import (
+    Column, String, Boolean, Integer, Text, UniqueConstraint, ForeignKey, DateTime, Numeric, Index, text,
+)
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -57,6 +59,15 @@ class FiscalReceipt(BaseModel):
     """
 
     __tablename__ = "fiscal_receipts"
+    __table_args__ = (
+        # Checks webhook fallback: latest pending receipt of a deal
+        Index(
+            "ix_fiscal_receipts_pending_by_deal",
+            "deal_id",
+            text("created_at DESC"),
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
 
     # Link to deal
     deal_id = Column(UUID(as_uuid=True), ForeignKey("lk_deals.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -94,7 +105,7 @@ class FiscalReceipt(BaseModel):
 
     # Timestamps
     sent_at = Column(DateTime, nullable=True)  # When sent to T-Bank
-    confirmed_at = Column(DateTime, nullable=True)  # When confirmed by T-Bank
+    confirmed_at = Column(DateTime(timezone=True), nullable=True)  # When confirmed by T-Bank
 
     # Retry tracking
     retry_count = Column(Integer, default=0, nullable=False)
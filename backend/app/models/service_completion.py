@@ -8,6 +8,7 @@ from sqlalchemy import (
     Text,
     DateTime,
     Boolean,
+    UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
@@ -19,6 +20,10 @@ class ServiceCompletion(BaseModel):
     """Confirmation that service was completed satisfactorily"""
 
     __tablename__ = "service_completions"
+    __table_args__ = (
+        # One confirmation per user per deal (insert relies on ON CONFLICT)
+        UniqueConstraint('deal_id', 'confirmed_by_user_id', name='uq_service_completions_deal_user'),
+    )
 
     deal_id = Column(UUID(as_uuid=True), ForeignKey("lk_deals.id", ondelete="CASCADE"), nullable=False, index=True)
     confirmed_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
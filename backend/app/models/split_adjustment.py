@@ -9,8 +9,10 @@ from sqlalchemy import (
     ForeignKey,
     Text,
     DateTime,
+    Index,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship
 
 from app.db.base import BaseModel
@@ -23,6 +25,8 @@ class AdjustmentStatus(str, PyEnum):
     APPROVED = "approved"
     REJECTED = "rejected"
     EXPIRED = "expired"
+    # Approved, but updating the split recipients failed; needs re-applying
+    APPLY_FAILED = "apply_failed"
 
 
 class SplitAdjustment(BaseModel):
@@ -45,11 +49,26 @@ class SplitAdjustment(BaseModel):
     required_approvers = Column(JSONB, nullable=False)  # [user_id1, user_id2]
     approvals = Column(JSONB, default=list)  # [{"user_id": 123, "approved_at": "..."}]
     rejections = Column(JSONB, default=list)  # [{"user_id": 456, "rejected_at": "...", "reason": "..."}]
+    # Denormalized from approvals for O(1) vote checks in the atomic approve UPDATE
+    approved_user_ids = Column(ARRAY(Integer), default=list, server_default="{}", nullable=False)
+    approvals_count = Column(Integer, default=0, server_default="0", nullable=False)
 
     # Timestamps
-    expires_at = Column(DateTime, nullable=True)  # Auto-expire if not approved
-    resolved_at = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=True)  # Auto-expire if not approved
+    resolved_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
     deal = relationship("Deal", back_populates="split_adjustments")
     requested_by = relationship("User", foreign_keys=[requested_by_user_id])
+
+    __table_args__ = (
+        # Serves the per-deal list ordered by newest first
+        Index("ix_split_adjustments_deal_created", "deal_id", text("created_at DESC")),
+        # At most one pending adjustment per deal
+        Index(
+            "uq_split_adjustments_deal_pending",
+            "deal_id",
+            unique=True,
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from uuid import UUID
 from decimal import Decimal
 
@@ -369,8 +369,9 @@ class InvoiceListResponse(BaseModel):
     """List of invoices for a deal"""
     deal_id: UUID
     invoices: List[InvoiceListItem]
+    next_cursor: Optional[str] = None  # Pass as ?cursor= to get next page
 
-    # Summary
+    # Summary (over all invoices, not just the current page)
     total_commission: Decimal
     total_invoiced: Decimal
     total_paid: Decimal
@@ -442,6 +443,31 @@ class TBankWebhookPayload(BaseModel):
         extra = "allow"  # Allow additional fields
 
 
+class TBankChecksWebhookPayload(BaseModel):
+    """T-Bank Checks (fiscal receipts) webhook payload"""
+    ReceiptId: Optional[str] = None
+    PaymentId: Optional[str] = None
+    OrderId: Optional[str] = None
+    Status: Optional[str] = None
+    FiscalNumber: Optional[Any] = None
+    Fp: Optional[Any] = None
+    Fd: Optional[Any] = None
+    FnNumber: Optional[Any] = None
+    ReceiptUrl: Optional[str] = None
+    ErrorCode: Optional[str] = None
+    Message: Optional[str] = None
+    ErrorMessage: Optional[str] = None
+
+    class Config:
+        extra = "allow"  # Allow additional fields
+
+    @field_validator('ReceiptId', 'PaymentId', 'OrderId', 'ErrorCode', mode='before')
+    @classmethod
+    def numeric_id_to_str(cls, v):
+        """Bank sends some identifiers as numbers"""
+        return str(v) if isinstance(v, int) else v
+
+
 class WebhookResponse(BaseModel):
     """Webhook response"""
     Success: bool = True
@@ -481,6 +507,7 @@ class SendPaymentLinkResponse(BaseModel):
     method: str
     recipient: str  # Masked phone or email
     message: str
+    status: str = "sent"  # "queued" when delivery happens after the response
 
 
 # ============================================
@@ -574,3 +601,37 @@ class ClientPassportCheckResponse(BaseModel):
     deal_id: UUID
     has_passport_data: bool
     missing_fields: List[str]
+
+
+# ============================================
+# Contract schemas
+# ============================================
+
+
+class ContractListItem(BaseModel):
+    """Contract summary (without rendered HTML)"""
+    id: UUID
+    contract_number: str
+    contract_type: str
+    status: str
+    generated_at: Optional[datetime] = None
+    signed_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+    required_signers: List[Dict[str, Any]]
+
+    class Config:
+        from_attributes = True
+
+
+class ContractResponse(ContractListItem):
+    """Contract details, html_content only when requested"""
+    html_content: Optional[str] = None
+    document_hash: Optional[str] = None
+    contract_data: Optional[Dict[str, Any]] = None
+    commission_amount: Optional[float] = None
+
+
+class ContractListResponse(BaseModel):
+    """List of deal contracts"""
+    items: List[ContractListItem]
+    total: int
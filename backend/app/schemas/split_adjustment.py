@@ -1,7 +1,7 @@
 """Pydantic schemas for split adjustments"""
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from decimal import Decimal
 
@@ -91,8 +91,46 @@ class SplitAdjustmentReject(BaseModel):
     )
 
 
+class SplitAdjustmentApproveResponse(BaseModel):
+    """Result of an approval vote"""
+
+    adjustment_id: UUID
+    status: str
+    all_approved: bool
+    approvals_count: int
+    required_count: int
+
+
+class SplitAdjustmentRejectResponse(BaseModel):
+    """Result of a rejection vote"""
+
+    adjustment_id: UUID
+    status: str
+    rejected_by: int
+    reason: str
+
+
+class SplitAdjustmentListItem(BaseModel):
+    """Split adjustment as returned by the adjustments list endpoint"""
+
+    id: UUID
+    requested_by_user_id: int
+    old_split: Dict[str, float]
+    new_split: Dict[str, float]
+    reason: str
+    status: str
+    required_approvers: List[int]
+    approvals: Optional[List[Dict[str, Any]]] = None
+    rejections: Optional[List[Dict[str, Any]]] = None
+    expires_at: Optional[datetime] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class SplitAdjustmentListResponse(BaseModel):
     """List of split adjustments"""
 
-    items: List[SplitAdjustmentResponse]
+    items: List[SplitAdjustmentListItem]
     total: int
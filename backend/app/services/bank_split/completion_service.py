@@ -13,10 +13,11 @@ UC-3.2 Flow:
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Optional, Set
-from uuid import UUID
+from typing import List, Optional, Set, Tuple
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import exists, func, literal_column, select
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -152,6 +153,43 @@ class ServiceCompletionService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_completion_snapshot(self, deal_id: UUID) -> Tuple[List[dict], bool]:
+        """
+        Get a deal's confirmations and open-dispute flag in one round-trip.
+
+        Confirmations come back oldest first as plain dicts (user_id,
+        confirmed_at, notes, triggers_release, release_triggered_at)
+        aggregated by PostgreSQL, so no ServiceCompletion rows are hydrated.
+        Timestamps are ISO strings as rendered by PostgreSQL.
+
+        Returns:
+            Tuple of (confirmations, has_open_dispute)
+        """
+        confirmation = func.jsonb_build_object(
+            literal_column("'user_id'"), ServiceCompletion.confirmed_by_user_id,
+            literal_column("'confirmed_at'"), ServiceCompletion.confirmed_at,
+            literal_column("'notes'"), ServiceCompletion.notes,
+            literal_column("'triggers_release'"), ServiceCompletion.triggers_release,
+            literal_column("'release_triggered_at'"), ServiceCompletion.release_triggered_at,
+        )
+        confirmations = (
+            select(
+                func.jsonb_agg(
+                    aggregate_order_by(confirmation, ServiceCompletion.confirmed_at),
+                    type_=JSONB,
+                )
+            )
+            .where(ServiceCompletion.deal_id == deal_id)
+            .scalar_subquery()
+        )
+        open_dispute = exists().where(
+            Dispute.deal_id == deal_id,
+            Dispute.status == DisputeStatus.OPEN.value,
+        )
+        result = await self.db.execute(select(confirmations, open_dispute))
+        rows, has_open_dispute = result.one()
+        return rows or [], has_open_dispute
+
     async def confirm_service_completion(
         self,
         deal: Deal,
@@ -207,19 +245,12 @@ class ServiceCompletionService:
                 "Resolve the dispute before confirming service completion."
             )
 
-        # 4. Check if user already confirmed
-        existing = await self.db.execute(
-            select(ServiceCompletion).where(
-                ServiceCompletion.deal_id == deal.id,
-                ServiceCompletion.confirmed_by_user_id == user.id,
-            )
-        )
-        if existing.scalar_one_or_none():
-            raise ValueError("You have already confirmed completion for this deal")
-
-        # 5. Create confirmation
+        # 4. Record the confirmation and read the deal's confirmers in one
+        # round-trip. ON CONFLICT against uq_service_completions_deal_user
+        # replaces a separate "already confirmed?" select and is race-free.
         now = datetime.utcnow()
-        completion = ServiceCompletion(
+        values = dict(
+            id=uuid4(),
             deal_id=deal.id,
             confirmed_by_user_id=user.id,
             confirmed_at=now,
@@ -228,15 +259,35 @@ class ServiceCompletionService:
             client_ip=client_ip,
             client_user_agent=user_agent,
             triggers_release=trigger_release,
+            created_at=now,
+            updated_at=now,
         )
+        inserted = (
+            pg_insert(ServiceCompletion)
+            .values(**values)
+            .on_conflict_do_nothing(constraint="uq_service_completions_deal_user")
+            .returning(ServiceCompletion.id)
+            .cte("inserted")
+        )
+        result = await self.db.execute(
+            select(
+                select(inserted.c.id).scalar_subquery().label("completion_id"),
+                select(func.array_agg(ServiceCompletion.confirmed_by_user_id))
+                .where(ServiceCompletion.deal_id == deal.id)
+                .scalar_subquery()
+                .label("confirmed_ids"),
+            )
+        )
+        row = result.one()
+        if row.completion_id is None:
+            raise ValueError("You have already confirmed completion for this deal")
 
-        self.db.add(completion)
-        await self.db.flush()
+        completion = ServiceCompletion(**values)
 
-        # 6. Check if all required agents confirmed
+        # 5. Check if all required agents confirmed. The CTE's own insert is
+        # not visible to the statement's snapshot, so add the new confirmer.
         required = await self.get_required_confirmers(deal)
-        confirmations = await self.get_existing_confirmations(deal.id)
-        confirmed_user_ids = {c.confirmed_by_user_id for c in confirmations}
+        confirmed_user_ids = set(row.confirmed_ids or ()) | {user.id}
         all_confirmed = required.issubset(confirmed_user_ids)
 
         # UC-3.2: Initialize result fields
@@ -245,7 +296,7 @@ class ServiceCompletionService:
         awaiting_client_confirmation = False
         release_triggered = False
 
-        # 7. UC-3.2: When all agents confirmed → generate Act → AWAITING_CLIENT_CONFIRMATION
+        # 6. UC-3.2: When all agents confirmed → generate Act → AWAITING_CLIENT_CONFIRMATION
         if trigger_release and all_confirmed:
             act_document, signing_url = await self._initiate_client_confirmation(deal)
             awaiting_client_confirmation = True
@@ -11,14 +11,15 @@ Supports payment schemes:
 - postpayment_full: 100% after service
 """
 
+import base64
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -61,10 +62,13 @@ class DealInvoiceService:
         # Get total commission
         total_commission = deal.calculated_commission or Decimal("0")
 
-        # Get sum of all invoices (excluding cancelled)
+        # Sum of all invoices (excluding cancelled) and of paid invoices in one query
+        is_paid = DealInvoice.status == InvoiceStatus.PAID.value
         stmt = select(
             func.coalesce(func.sum(DealInvoice.amount), Decimal("0")).label("total_invoiced"),
-            func.count(DealInvoice.id).label("invoices_count")
+            func.count(DealInvoice.id).label("invoices_count"),
+            func.coalesce(func.sum(DealInvoice.paid_amount).filter(is_paid), Decimal("0")).label("total_paid"),
+            func.count(DealInvoice.id).filter(is_paid).label("paid_count"),
         ).where(
             DealInvoice.deal_id == deal.id,
             DealInvoice.status != InvoiceStatus.CANCELLED.value
@@ -73,19 +77,8 @@ class DealInvoiceService:
         row = result.one()
         total_invoiced = Decimal(str(row.total_invoiced))
         invoices_count = row.invoices_count
-
-        # Get sum of paid invoices
-        stmt_paid = select(
-            func.coalesce(func.sum(DealInvoice.paid_amount), Decimal("0")).label("total_paid"),
-            func.count(DealInvoice.id).label("paid_count")
-        ).where(
-            DealInvoice.deal_id == deal.id,
-            DealInvoice.status == InvoiceStatus.PAID.value
-        )
-        result_paid = await self.db.execute(stmt_paid)
-        row_paid = result_paid.one()
-        total_paid = Decimal(str(row_paid.total_paid))
-        paid_invoices_count = row_paid.paid_count
+        total_paid = Decimal(str(row.total_paid))
+        paid_invoices_count = row.paid_count
 
         # Calculate remaining
         remaining_amount = total_commission - total_invoiced
@@ -99,6 +92,32 @@ class DealInvoiceService:
             paid_invoices_count=paid_invoices_count,
         )
 
+    def summarize_invoices(self, deal: Deal, invoices: Iterable[DealInvoice]) -> InvoiceSummary:
+        """Build invoice summary from already loaded invoices (no DB query)"""
+        total_commission = deal.calculated_commission or Decimal("0")
+        total_invoiced = Decimal("0")
+        total_paid = Decimal("0")
+        invoices_count = 0
+        paid_invoices_count = 0
+
+        for invoice in invoices:
+            if invoice.status == InvoiceStatus.CANCELLED.value:
+                continue
+            total_invoiced += invoice.amount
+            invoices_count += 1
+            if invoice.status == InvoiceStatus.PAID.value:
+                total_paid += invoice.paid_amount or Decimal("0")
+                paid_invoices_count += 1
+
+        return InvoiceSummary(
+            total_commission=total_commission,
+            total_invoiced=total_invoiced,
+            total_paid=total_paid,
+            remaining_amount=max(Decimal("0"), total_commission - total_invoiced),
+            invoices_count=invoices_count,
+            paid_invoices_count=paid_invoices_count,
+        )
+
     async def create_invoice(
         self,
         deal: Deal,
@@ -107,6 +126,7 @@ class DealInvoiceService:
         description: Optional[str] = None,
         return_url: Optional[str] = None,
         milestone_id: Optional[UUID] = None,
+        existing_invoices: Optional[Iterable[DealInvoice]] = None,
     ) -> Tuple[DealInvoice, InvoiceSummary]:
         """
         Create a new invoice for specified amount.
@@ -118,6 +138,8 @@ class DealInvoiceService:
             description: Optional description (e.g., "Advance 30%")
             return_url: URL to redirect after payment
             milestone_id: Optional link to milestone
+            existing_invoices: Preloaded invoices of the deal (e.g. deal.invoices).
+                When given, summary and invoice number are computed without extra queries.
 
         Returns:
             Tuple of (created invoice, updated summary)
@@ -138,7 +160,11 @@ class DealInvoiceService:
             )
 
         # 2. Get current summary and validate amount
-        summary = await self.get_invoice_summary(deal)
+        if existing_invoices is not None:
+            existing_invoices = list(existing_invoices)
+            summary = self.summarize_invoices(deal, existing_invoices)
+        else:
+            summary = await self.get_invoice_summary(deal)
 
         if amount > summary.remaining_amount:
             raise ValueError(
@@ -149,7 +175,10 @@ class DealInvoiceService:
             )
 
         # 3. Generate invoice number
-        invoice_number = await self._generate_invoice_number(deal.id)
+        if existing_invoices is not None:
+            invoice_number = self._format_invoice_number(deal.id, len(existing_invoices))
+        else:
+            invoice_number = await self._generate_invoice_number(deal.id)
 
         # 4. Create invoice record
         invoice = DealInvoice(
@@ -186,7 +215,10 @@ class DealInvoiceService:
             await self.db.flush()
 
         # 7. Get updated summary
-        updated_summary = await self.get_invoice_summary(deal)
+        if existing_invoices is not None:
+            updated_summary = self.summarize_invoices(deal, [*existing_invoices, invoice])
+        else:
+            updated_summary = await self.get_invoice_summary(deal)
 
         logger.info(
             f"Created invoice {invoice.id} for deal {deal.id}, "
@@ -281,19 +313,72 @@ class DealInvoiceService:
         result = await self.db.execute(stmt)
         count = result.scalar() or 0
 
-        # Format: INV-{deal_short_id}-{sequence}
+        return self._format_invoice_number(deal_id, count)
+
+    @staticmethod
+    def _format_invoice_number(deal_id: UUID, existing_count: int) -> str:
+        """Format: INV-{deal_short_id}-{sequence}"""
         deal_short = str(deal_id)[:8].upper()
-        return f"INV-{deal_short}-{count + 1:03d}"
+        return f"INV-{deal_short}-{existing_count + 1:03d}"
 
-    async def get_deal_invoices(self, deal_id: UUID) -> List[DealInvoice]:
-        """Get all invoices for a deal"""
+    async def get_deal_invoices(
+        self,
+        deal_id: UUID,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[DealInvoice], Optional[str]]:
+        """
+        Get invoices for a deal, newest first.
+
+        Uses keyset pagination on (created_at, id) when limit is given.
+
+        Args:
+            deal_id: Deal ID
+            limit: Max invoices per page (None = all)
+            cursor: Opaque cursor from previous page (next_cursor)
+
+        Returns:
+            Tuple of (invoices, next_cursor). next_cursor is None on the last page.
+
+        Raises:
+            ValueError: If cursor is malformed
+        """
         stmt = (
             select(DealInvoice)
             .where(DealInvoice.deal_id == deal_id)
-            .order_by(DealInvoice.created_at.desc())
+            .order_by(DealInvoice.created_at.desc(), DealInvoice.id.desc())
         )
+        if cursor:
+            cursor_ts, cursor_id = self._decode_cursor(cursor)
+            stmt = stmt.where(tuple_(DealInvoice.created_at, DealInvoice.id) < tuple_(cursor_ts, cursor_id))
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)  # one extra row tells if there is a next page
+
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        invoices = list(result.scalars().all())
+
+        next_cursor = None
+        if limit is not None and len(invoices) > limit:
+            invoices = invoices[:limit]
+            next_cursor = self._encode_cursor(invoices[-1])
+
+        return invoices, next_cursor
+
+    @staticmethod
+    def _encode_cursor(invoice: DealInvoice) -> str:
+        """Encode (created_at, id) of the last invoice on a page"""
+        raw = f"{invoice.created_at.isoformat()}|{invoice.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+        """Decode cursor produced by _encode_cursor"""
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            ts, invoice_id = raw.split("|", 1)
+            return datetime.fromisoformat(ts), UUID(invoice_id)
+        except ValueError:
+            raise ValueError("Invalid pagination cursor")
 
     async def get_invoice(self, invoice_id: UUID) -> Optional[DealInvoice]:
         """Get invoice by ID"""
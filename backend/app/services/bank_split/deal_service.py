@@ -4,10 +4,10 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, inspect, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -26,6 +26,7 @@ from app.models.user import User
 from app.models.organization import Organization
 from app.services.bank_split.split_service import SplitService, SplitRecipientInput
 from app.services.bank_split.invoice_service import InvoiceService
+from app.services.bank_split.payment_info_cache import payment_info_cache
 from app.services.inn import INNValidationService, INNValidationLevel
 from app.integrations.tbank import get_tbank_deals_client, TBankError
 
@@ -224,18 +225,56 @@ class BankSplitDealService:
             recipients=recipients,
         )
 
-    async def get_deal(self, deal_id: UUID) -> Optional[Deal]:
-        """Get deal by ID with related data"""
-        stmt = (
+    async def get_deal(
+        self,
+        deal_id: UUID,
+        load: Sequence[str] = ("split_recipients", "milestones"),
+    ) -> Optional[Deal]:
+        """
+        Get deal by ID with related data.
+
+        Args:
+            deal_id: Deal ID
+            load: Deal relationship names to eager-load alongside the deal
+        """
+        result = await self.db.execute(self._deal_stmt(deal_id, load))
+        return result.scalar_one_or_none()
+
+    async def get_deal_for_user(
+        self,
+        deal_id: UUID,
+        user_id: int,
+        as_creator: bool = False,
+        load: Sequence[str] = ("split_recipients", "milestones"),
+    ) -> Optional[Deal]:
+        """
+        Get deal by ID only if the user may access it.
+
+        The access predicate is part of the WHERE clause, so rows the user
+        cannot see are never loaded. None means "missing or no access".
+
+        Args:
+            deal_id: Deal ID
+            user_id: Requesting user
+            as_creator: Require the deal creator (default: creator or agent)
+            load: Deal relationship names to eager-load alongside the deal
+        """
+        access = (
+            Deal.created_by_user_id == user_id
+            if as_creator
+            else or_(Deal.created_by_user_id == user_id, Deal.agent_user_id == user_id)
+        )
+        result = await self.db.execute(self._deal_stmt(deal_id, load).where(access))
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    def _deal_stmt(deal_id: UUID, load: Sequence[str]) -> Select:
+        """Live deal by ID with the requested relationships selectin-loaded"""
+        return (
             select(Deal)
             .where(Deal.id == deal_id, Deal.deleted_at.is_(None))
-            .options(
-                selectinload(Deal.split_recipients),
-                selectinload(Deal.milestones),
-            )
+            .options(*(selectinload(getattr(Deal, name)) for name in load))
         )
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
 
     async def submit_for_signing(self, deal: Deal) -> Deal:
         """
@@ -286,7 +325,7 @@ class BankSplitDealService:
         self._validate_transition(deal, "invoiced")
 
         # Get recipients
-        recipients = await self.split_service.get_deal_recipients(deal.id)
+        recipients = await self._get_deal_recipients(deal)
         if not recipients:
             raise ValueError("No split recipients found for deal")
 
@@ -304,6 +343,7 @@ class BankSplitDealService:
 
         deal.status = "invoiced"
         await self.db.flush()
+        payment_info_cache.invalidate_after_commit(self.db, deal.id)
 
         logger.info(f"Deal {deal.id} invoiced, payment link: {deal.payment_link_url}")
 
@@ -333,11 +373,12 @@ class BankSplitDealService:
         )
 
         # Update recipients status
-        recipients = await self.split_service.get_deal_recipients(deal.id)
+        recipients = await self._get_deal_recipients(deal)
         for r in recipients:
             r.payout_status = PayoutStatus.HOLD.value
 
         await self.db.flush()
+        payment_info_cache.invalidate_after_commit(self.db, deal.id)
 
         logger.info(f"Deal {deal.id} payment received, hold until {deal.hold_expires_at}")
         return deal
@@ -396,6 +437,7 @@ class BankSplitDealService:
         deal.act_signed_at = datetime.utcnow()
 
         await self.db.flush()
+        payment_info_cache.invalidate_after_commit(self.db, deal.id)
 
         logger.info(f"Deal {deal.id} act signed, ready for payout")
         return deal
@@ -421,6 +463,7 @@ class BankSplitDealService:
         # act_signed_at remains None - indicates auto-release
 
         await self.db.flush()
+        payment_info_cache.invalidate_after_commit(self.db, deal.id)
 
         logger.info(f"Deal {deal.id} auto-released after confirmation timeout")
         return deal
@@ -445,6 +488,7 @@ class BankSplitDealService:
 
         # Release in T-Bank
         deal = await self.invoice_service.release_deal(deal)
+        payment_info_cache.invalidate_after_commit(self.db, deal.id)
 
         logger.info(f"Deal {deal.id} released from hold")
         return deal
@@ -468,6 +512,7 @@ class BankSplitDealService:
             deal.status = "cancelled"
 
         await self.db.flush()
+        payment_info_cache.invalidate_after_commit(self.db, deal.id)
 
         logger.info(f"Deal {deal.id} cancelled: {reason}")
         return deal
@@ -616,6 +661,13 @@ class BankSplitDealService:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def _get_deal_recipients(self, deal: Deal) -> List[DealSplitRecipient]:
+        """Deal recipients, read from the relationship when get_deal eager-loaded it"""
+        state = inspect(deal, raiseerr=False)
+        if state is not None and "split_recipients" not in state.unloaded:
+            return sorted(deal.split_recipients, key=lambda r: r.created_at)
+        return await self.split_service.get_deal_recipients(deal.id)
+
     async def _get_user(self, user_id: int) -> Optional[User]:
         """Get user by ID"""
         stmt = select(User).where(User.id == user_id)
@@ -1,7 +1,7 @@
 """Invoice service for T-Bank integration"""
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from typing import List, Optional
 from uuid import UUID
@@ -10,8 +10,10 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.security import utc_now
 from app.models.deal import Deal
 from app.models.bank_split import DealSplitRecipient, BankEvent, PayoutStatus
+from app.services.bank_split.payment_info_cache import payment_info_cache
 from app.integrations.tbank import get_tbank_deals_client, TBankError
 from app.integrations.tbank.deals import TBankDeal, TBankDealSplit, DealStatus as TBankDealStatus
 
@@ -105,9 +107,12 @@ class InvoiceService:
             deal.external_account_number = tbank_deal.account_number
             deal.payment_link_url = tbank_deal.payment_url
             deal.payment_qr_payload = tbank_deal.qr_code
-            # Strip timezone for DB compatibility (TIMESTAMP WITHOUT TIME ZONE)
+            # lk_deals.expires_at is TIMESTAMP WITH TIME ZONE; treat naive values as UTC
             if tbank_deal.expires_at:
-                deal.expires_at = tbank_deal.expires_at.replace(tzinfo=None)
+                expires_at = tbank_deal.expires_at
+                if expires_at.tzinfo is None:
+                    expires_at = expires_at.replace(tzinfo=timezone.utc)
+                deal.expires_at = expires_at
             deal.external_provider = "tbank"
 
             await self.db.flush()
@@ -194,6 +199,8 @@ class InvoiceService:
                 )
 
             await self.db.flush()
+            if old_status != deal.status:
+                payment_info_cache.invalidate_after_commit(self.db, deal.id)
             return deal
 
         except TBankError as e:
@@ -218,10 +225,10 @@ class InvoiceService:
 
             deal.payment_link_url = new_url
             from datetime import timedelta
-            # Use timezone-naive datetime for DB compatibility
-            deal.expires_at = datetime.utcnow() + timedelta(minutes=60)
+            deal.expires_at = utc_now() + timedelta(minutes=60)
 
             await self.db.flush()
+            payment_info_cache.invalidate_after_commit(self.db, deal.id)
 
             logger.info(f"Regenerated payment link for deal {deal.id}")
             return new_url
@@ -355,7 +362,7 @@ class InvoiceService:
         payload: dict,
     ) -> BankEvent:
         """Log bank event"""
-        now = datetime.utcnow()
+        now = utc_now()
         event = BankEvent(
             deal_id=deal_id,
             provider="tbank",
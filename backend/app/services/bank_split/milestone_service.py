@@ -7,14 +7,17 @@ Manages deal payment milestones with different release triggers:
 - DATE: Release on specific date
 """
 
+import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, and_
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import Select, insert, select, and_, exists, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -51,6 +54,70 @@ class MilestoneReleaseResult:
     released_amount: Optional[Decimal] = None
 
 
+@dataclass
+class MilestoneTotals:
+    """Aggregated milestone amounts for a deal"""
+    total_amount: Decimal
+    released_amount: Decimal
+    pending_amount: Decimal
+
+
+class MilestoneSummaryCache:
+    """
+    Short-lived Redis cache for per-deal milestone summaries.
+
+    A deal page loads the summary right after the milestone list; caching it
+    for a few seconds saves the repeated scan. Endpoints that change
+    milestones invalidate the entry after commit; background transitions are
+    bounded by the TTL. Redis errors fall through to the database.
+    """
+
+    TTL_SECONDS = 30
+
+    def __init__(self):
+        self._redis: Optional[aioredis.Redis] = None
+
+    async def _get_redis(self) -> aioredis.Redis:
+        """Get Redis connection"""
+        if self._redis is None:
+            self._redis = aioredis.from_url(settings.REDIS_URL, encoding="utf-8", decode_responses=True)
+        return self._redis
+
+    def _make_key(self, deal_id: UUID) -> str:
+        """Create Redis key for a deal's milestone summary"""
+        return f"ms:{deal_id}"
+
+    async def get(self, deal_id: UUID) -> Optional[dict]:
+        """Get cached summary, None on miss"""
+        try:
+            redis = await self._get_redis()
+            cached = await redis.get(self._make_key(deal_id))
+        except RedisError as e:
+            logger.warning(f"Milestone summary cache unavailable: {e}")
+            return None
+        return json.loads(cached) if cached else None
+
+    async def set(self, deal_id: UUID, summary: dict) -> None:
+        """Store summary for TTL_SECONDS"""
+        try:
+            redis = await self._get_redis()
+            await redis.setex(self._make_key(deal_id), self.TTL_SECONDS, json.dumps(summary))
+        except RedisError as e:
+            logger.warning(f"Failed to cache milestone summary: {e}")
+
+    async def invalidate(self, deal_id: UUID) -> None:
+        """Drop cached summary after milestones change"""
+        try:
+            redis = await self._get_redis()
+            await redis.delete(self._make_key(deal_id))
+        except RedisError as e:
+            logger.warning(f"Failed to invalidate milestone summary: {e}")
+
+
+# Global instance
+milestone_summary_cache = MilestoneSummaryCache()
+
+
 class MilestoneService:
     """
     Service for managing deal payment milestones.
@@ -104,7 +171,7 @@ class MilestoneService:
                 raise ValueError(f"Deal not found: {deal_id}")
             total_amount = deal.commission_agent
 
-        milestones = []
+        rows = []
         for step_no, cfg in enumerate(config, start=1):
             # Calculate amount from percentage
             amount = (total_amount * cfg.percent / Decimal("100")).quantize(Decimal("0.01"))
@@ -117,30 +184,33 @@ class MilestoneService:
             elif cfg.trigger == ReleaseTrigger.DATE and cfg.release_date:
                 release_scheduled_at = cfg.release_date
 
-            milestone = DealMilestone(
-                deal_id=deal_id,
-                step_no=step_no,
-                name=cfg.name,
-                description=cfg.description,
-                amount=amount,
-                percent=cfg.percent,
-                currency="RUB",
-                trigger_type=cfg.trigger.value,  # Legacy field
-                trigger_config={
+            rows.append({
+                "deal_id": deal_id,
+                "step_no": step_no,
+                "name": cfg.name,
+                "description": cfg.description,
+                "amount": amount,
+                "percent": cfg.percent,
+                "currency": "RUB",
+                "trigger_type": cfg.trigger.value,  # Legacy field
+                "trigger_config": {
                     "trigger": cfg.trigger.value,
                     "delay_hours": cfg.release_delay_hours,
                     "date": cfg.release_date.isoformat() if cfg.release_date else None,
                 },
-                release_trigger=cfg.trigger.value,
-                release_delay_hours=cfg.release_delay_hours,
-                release_date=cfg.release_date,
-                release_scheduled_at=release_scheduled_at,
-                status=MilestoneStatus.PENDING.value,
-            )
-            self.db.add(milestone)
-            milestones.append(milestone)
+                "release_trigger": cfg.trigger.value,
+                "release_delay_hours": cfg.release_delay_hours,
+                "release_date": cfg.release_date,
+                "release_scheduled_at": release_scheduled_at,
+                "status": MilestoneStatus.PENDING.value,
+            })
 
-        await self.db.flush()
+        # Single multi-row INSERT ... RETURNING; rows land in the session as ORM objects
+        result = await self.db.scalars(
+            insert(DealMilestone).returning(DealMilestone, sort_by_parameter_order=True),
+            rows,
+        )
+        milestones = list(result.all())
 
         logger.info(
             f"Created {len(milestones)} milestones for deal {deal_id}, "
@@ -149,16 +219,82 @@ class MilestoneService:
 
         return milestones
 
-    async def get_deal_milestones(self, deal_id: UUID) -> List[DealMilestone]:
-        """Get all milestones for a deal ordered by step_no"""
-        stmt = (
+    @staticmethod
+    def deal_milestones_stmt(deal_id: UUID) -> Select:
+        """Query for all milestones of a deal ordered by step_no"""
+        return (
             select(DealMilestone)
             .where(DealMilestone.deal_id == deal_id)
             .order_by(DealMilestone.step_no)
         )
-        result = await self.db.execute(stmt)
+
+    async def get_deal_milestones(self, deal_id: UUID) -> List[DealMilestone]:
+        """Get all milestones for a deal ordered by step_no"""
+        result = await self.db.execute(self.deal_milestones_stmt(deal_id))
         return list(result.scalars().all())
 
+    async def get_totals(self, deal_id: UUID) -> MilestoneTotals:
+        """Sum milestone amounts by status in the database"""
+        amount = func.coalesce(func.sum(DealMilestone.amount), 0)
+        stmt = select(
+            amount,
+            func.coalesce(
+                func.sum(DealMilestone.amount).filter(
+                    DealMilestone.status == MilestoneStatus.RELEASED.value
+                ),
+                0,
+            ),
+            func.coalesce(
+                func.sum(DealMilestone.amount).filter(
+                    DealMilestone.status.notin_([
+                        MilestoneStatus.RELEASED.value,
+                        MilestoneStatus.CANCELLED.value,
+                    ])
+                ),
+                0,
+            ),
+        ).where(DealMilestone.deal_id == deal_id)
+        total, released, pending = (await self.db.execute(stmt)).one()
+        return MilestoneTotals(
+            total_amount=Decimal(total),
+            released_amount=Decimal(released),
+            pending_amount=Decimal(pending),
+        )
+
+    async def get_deal_with_milestone_flag(
+        self, deal_id: UUID
+    ) -> Optional[Tuple[Deal, bool]]:
+        """Get deal together with a has-milestones flag in a single query"""
+        stmt = select(
+            Deal,
+            exists().where(DealMilestone.deal_id == Deal.id).label("has_milestones"),
+        ).where(Deal.id == deal_id, Deal.deleted_at.is_(None))
+        row = (await self.db.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return row[0], bool(row[1])
+
+    async def get_deal_milestone(
+        self, deal_id: UUID, milestone_id: UUID
+    ) -> Optional[Tuple[Deal, DealMilestone]]:
+        """Get deal and one of its milestones in a single query.
+
+        The join enforces that the milestone belongs to the deal.
+        """
+        stmt = (
+            select(Deal, DealMilestone)
+            .join(DealMilestone, DealMilestone.deal_id == Deal.id)
+            .where(
+                Deal.id == deal_id,
+                Deal.deleted_at.is_(None),
+                DealMilestone.id == milestone_id,
+            )
+        )
+        row = (await self.db.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return row[0], row[1]
+
     async def get_milestone(self, milestone_id: UUID) -> Optional[DealMilestone]:
         """Get milestone by ID"""
         stmt = select(DealMilestone).where(DealMilestone.id == milestone_id)
@@ -479,7 +615,13 @@ class MilestoneService:
         - released_amount: Amount already released
         - pending_amount: Amount pending release
         - milestones: List of milestone summaries
+
+        Served from milestone_summary_cache when present.
         """
+        cached = await milestone_summary_cache.get(deal_id)
+        if cached is not None:
+            return cached
+
         milestones = await self.get_deal_milestones(deal_id)
 
         total_amount = Decimal("0")
@@ -508,7 +650,7 @@ class MilestoneService:
                 "paid_at": m.paid_at.isoformat() if m.paid_at else None,
             })
 
-        return {
+        summary = {
             "total_amount": float(total_amount),
             "released_amount": float(released_amount),
             "pending_amount": float(pending_amount),
@@ -516,6 +658,8 @@ class MilestoneService:
             "released_count": sum(1 for m in milestones if m.status == MilestoneStatus.RELEASED.value),
             "milestones": milestone_summaries,
         }
+        await milestone_summary_cache.set(deal_id, summary)
+        return summary
 
     async def _get_deal(self, deal_id: UUID) -> Optional[Deal]:
         """Get deal by ID"""
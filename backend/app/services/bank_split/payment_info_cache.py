@@ -0,0 +1,129 @@
+"""Redis cache for the public payment-info response"""
+
+import asyncio
+import logging
+from typing import Iterable, Optional
+from uuid import UUID
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PaymentInfoCache:
+    """
+    Short-lived Redis cache for the rendered public payment-info response.
+
+    The payment page is reloaded and polled by clients; the body only changes
+    when the deal's status or payment link changes. The services making those
+    changes invalidate the entry once their transaction commits; anything else
+    (e.g. link expiry) is bounded by the TTL. Redis errors fall through to the
+    database.
+    """
+
+    TTL_SECONDS = 30
+    # Browsers revalidate sooner so a paid/cancelled page updates quickly
+    CLIENT_MAX_AGE_SECONDS = 5
+
+    def __init__(self):
+        self._redis: Optional[aioredis.Redis] = None
+
+    async def _get_redis(self) -> aioredis.Redis:
+        """Get Redis connection"""
+        if self._redis is None:
+            self._redis = aioredis.from_url(settings.REDIS_URL, encoding="utf-8", decode_responses=True)
+        return self._redis
+
+    def _make_key(self, deal_id: UUID) -> str:
+        """Create Redis key for a deal's payment info"""
+        return f"pi:{deal_id}"
+
+    async def get(self, deal_id: UUID) -> Optional[str]:
+        """Get cached JSON body, None on miss"""
+        try:
+            redis = await self._get_redis()
+            return await redis.get(self._make_key(deal_id))
+        except RedisError as e:
+            logger.warning(f"Payment info cache unavailable: {e}")
+            return None
+
+    async def set(self, deal_id: UUID, body: str) -> None:
+        """Store JSON body for TTL_SECONDS"""
+        try:
+            redis = await self._get_redis()
+            await redis.setex(self._make_key(deal_id), self.TTL_SECONDS, body)
+        except RedisError as e:
+            logger.warning(f"Failed to cache payment info: {e}")
+
+    async def invalidate(self, *deal_ids: UUID) -> None:
+        """Drop cached payment info after the deals' payment state changes"""
+        if not deal_ids:
+            return
+        try:
+            redis = await self._get_redis()
+            await redis.delete(*(self._make_key(deal_id) for deal_id in deal_ids))
+        except RedisError as e:
+            logger.warning(f"Failed to invalidate payment info: {e}")
+
+    def invalidate_after_commit(self, db: AsyncSession, deal_id: UUID) -> None:
+        """
+        Drop cached payment info once db's transaction commits.
+
+        Invalidating before the commit would let a poll in between re-cache
+        the old state for the full TTL. Nothing is dropped on rollback.
+        """
+        db.sync_session.info.setdefault(_PENDING_KEY, set()).add(deal_id)
+
+
+# Global instance
+payment_info_cache = PaymentInfoCache()
+
+# Session.info key holding deal IDs to invalidate on commit
+_PENDING_KEY = "payment_info_invalidations"
+
+# Strong references to in-flight invalidation tasks
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _schedule_invalidation(deal_ids: Iterable[UUID]) -> None:
+    """Run the Redis delete on the session's event loop"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning("No running event loop, payment info left to expire")
+        return
+    task = loop.create_task(payment_info_cache.invalidate(*deal_ids))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def flush_pending_invalidations() -> None:
+    """
+    Wait for post-commit invalidations scheduled on the running loop.
+
+    Celery tasks drive their coroutine with run_until_complete, which stops
+    the loop as soon as the coroutine returns; they await this after their
+    commit so the deletes are not left pending on a stopped loop.
+    """
+    loop = asyncio.get_running_loop()
+    pending = [task for task in _background_tasks if task.get_loop() is loop]
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    deal_ids = session.info.pop(_PENDING_KEY, None)
+    if deal_ids:
+        _schedule_invalidation(deal_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -6,8 +6,9 @@ from decimal import Decimal, ROUND_DOWN
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import case, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.bank_split import (
     DealSplitRecipient,
@@ -17,6 +18,7 @@ from app.models.bank_split import (
     PayoutStatus,
 )
 from app.models.organization import Organization, OrganizationMember
+from app.models.split_adjustment import AdjustmentStatus, SplitAdjustment
 
 logger = logging.getLogger(__name__)
 
@@ -270,18 +272,24 @@ class SplitService:
         self,
         deal_id: UUID,
         new_split: dict,
+        recipients: Optional[List[DealSplitRecipient]] = None,
     ) -> List[DealSplitRecipient]:
         """
         Apply an approved split adjustment to deal recipients.
 
+        All changed rows are written with a single UPDATE ... CASE statement.
+        Does not commit - the caller owns the transaction.
+
         Args:
             deal_id: Deal ID
             new_split: Dict mapping user_id (as string) to new percentage
+            recipients: Deal recipients if already loaded by the caller
 
         Returns:
             Updated recipients
         """
-        recipients = await self.get_deal_recipients(deal_id)
+        if recipients is None:
+            recipients = await self.get_deal_recipients(deal_id)
 
         if not recipients:
             raise ValueError(f"No recipients found for deal {deal_id}")
@@ -290,27 +298,77 @@ class SplitService:
         # (all recipients share the same deal's total)
         total_amount = sum(r.calculated_amount for r in recipients)
 
-        # Update each recipient's split value and recalculate amount
+        # Compute new split values and amounts in memory
+        split_values = {}
+        amounts = {r.id: r.calculated_amount for r in recipients}
         for recipient in recipients:
             user_id_str = str(recipient.user_id)
             if user_id_str in new_split:
                 new_percent = Decimal(str(new_split[user_id_str]))
-                recipient.split_value = new_percent
-                recipient.split_percent = new_percent  # Legacy field
-                # Recalculate amount
-                recipient.calculated_amount = (
+                split_values[recipient.id] = new_percent
+                amounts[recipient.id] = (
                     total_amount * new_percent / Decimal("100")
                 ).quantize(Decimal("0.01"), rounding=ROUND_DOWN)
 
         # Handle rounding adjustment
-        total_calculated = sum(r.calculated_amount for r in recipients)
-        rounding_diff = total_amount - total_calculated
+        rounding_diff = total_amount - sum(amounts.values())
 
-        if rounding_diff > 0 and recipients:
+        if rounding_diff > 0:
             # Add rounding difference to first recipient
-            recipients[0].calculated_amount += rounding_diff
+            amounts[recipients[0].id] += rounding_diff
+
+        changed_amounts = {
+            r.id: amounts[r.id]
+            for r in recipients
+            if amounts[r.id] != r.calculated_amount
+        }
+        changed_ids = set(split_values) | set(changed_amounts)
+
+        if changed_ids:
+            values = {}
+            if split_values:
+                values["split_value"] = case(
+                    split_values,
+                    value=DealSplitRecipient.id,
+                    else_=DealSplitRecipient.split_value,
+                )
+            if changed_amounts:
+                values["calculated_amount"] = case(
+                    changed_amounts,
+                    value=DealSplitRecipient.id,
+                    else_=DealSplitRecipient.calculated_amount,
+                )
+            await self.db.execute(
+                update(DealSplitRecipient)
+                .where(DealSplitRecipient.id.in_(changed_ids))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
 
-        await self.db.flush()
+            # Keep loaded objects in sync without marking them dirty
+            for recipient in recipients:
+                if recipient.id in split_values:
+                    set_committed_value(recipient, "split_value", split_values[recipient.id])
+                if recipient.id in changed_amounts:
+                    set_committed_value(recipient, "calculated_amount", changed_amounts[recipient.id])
 
         logger.info(f"Applied split adjustment for deal {deal_id}: {new_split}")
         return recipients
+
+    async def mark_adjustment_apply_failed(self, adjustment_id: UUID, error: str) -> None:
+        """
+        Record that an approved adjustment could not be applied.
+
+        Moves it from approved to apply_failed so it can be found and
+        re-applied. Does not commit - the caller owns the transaction.
+        """
+        await self.db.execute(
+            update(SplitAdjustment)
+            .where(
+                SplitAdjustment.id == adjustment_id,
+                SplitAdjustment.status == AdjustmentStatus.APPROVED.value,
+            )
+            .values(status=AdjustmentStatus.APPLY_FAILED.value)
+            .execution_options(synchronize_session=False)
+        )
+        logger.error(f"Split adjustment {adjustment_id} approved but not applied: {error}")
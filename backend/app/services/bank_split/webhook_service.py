@@ -13,15 +13,21 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.security import utc_now
 from app.models.bank_split import BankEvent
 from app.models.webhook_dlq import WebhookDLQ
 
 logger = logging.getLogger(__name__)
 
+# Hex-encoded HMAC-SHA256 digest length
+_SIGNATURE_HEX_LENGTH = hashlib.sha256().digest_size * 2
+
 
 def verify_webhook_signature(payload: bytes, signature: str, secret: str) -> bool:
     """
@@ -43,48 +49,139 @@ def verify_webhook_signature(payload: bytes, signature: str, secret: str) -> boo
         logger.warning("No signature provided in webhook request")
         return False
 
-    expected = hmac.new(
-        secret.encode("utf-8"),
-        payload,
-        hashlib.sha256
-    ).hexdigest()
+    # Wrong-length signatures can never match - reject before hashing the body
+    if len(signature) != _SIGNATURE_HEX_LENGTH:
+        logger.warning("Malformed webhook signature (wrong length)")
+        return False
+
+    try:
+        provided = bytes.fromhex(signature)
+    except ValueError:
+        logger.warning("Malformed webhook signature (not hex)")
+        return False
+
+    # Compare raw digests: no hex encoding or case folding on the hot path
+    expected = hmac.digest(secret.encode("utf-8"), payload, hashlib.sha256)
 
-    is_valid = hmac.compare_digest(expected.lower(), signature.lower())
+    is_valid = hmac.compare_digest(expected, provided)
 
     if not is_valid:
         logger.warning(
-            f"Invalid webhook signature. Expected: {expected[:16]}..., Got: {signature[:16]}..."
+            f"Invalid webhook signature. Expected: {expected.hex()[:16]}..., Got: {signature[:16]}..."
         )
 
     return is_valid
 
 
+class WebhookIdempotencyCache:
+    """
+    Redis fast path for duplicate webhook detection.
+
+    SET NX claims an idempotency key before any Postgres work. The claim is a
+    short in-flight lock; only once the event is committed as processed is
+    the key marked done for TTL_SECONDS, so bank retries of a handled event
+    are answered without touching the database. A claim left by a cancelled
+    or crashed request expires after CLAIM_TTL_SECONDS. bank_events stays
+    the durable record; on Redis errors the claim succeeds and the DB check
+    decides.
+    """
+
+    TTL_SECONDS = 86400
+    CLAIM_TTL_SECONDS = 120
+
+    _CLAIMED = "claimed"
+    _DONE = "done"
+
+    def __init__(self):
+        self._redis: Optional[aioredis.Redis] = None
+
+    async def _get_redis(self) -> aioredis.Redis:
+        """Get Redis connection"""
+        if self._redis is None:
+            self._redis = aioredis.from_url(settings.REDIS_URL, encoding="utf-8", decode_responses=True)
+        return self._redis
+
+    def _make_key(self, idempotency_key: str) -> str:
+        """Create Redis key for webhook idempotency"""
+        return f"webhook:tbank:{idempotency_key}"
+
+    async def claim(self, idempotency_key: str) -> bool:
+        """
+        Claim a webhook for processing.
+
+        Returns:
+            False if the key is already claimed or done, True otherwise
+        """
+        try:
+            redis = await self._get_redis()
+            return bool(await redis.set(
+                self._make_key(idempotency_key), self._CLAIMED, nx=True, ex=self.CLAIM_TTL_SECONDS
+            ))
+        except RedisError as e:
+            logger.warning(f"Webhook idempotency cache unavailable, falling back to DB: {e}")
+            return True
+
+    async def is_done(self, idempotency_key: str) -> bool:
+        """Whether the webhook was already committed as processed"""
+        try:
+            redis = await self._get_redis()
+            return await redis.get(self._make_key(idempotency_key)) == self._DONE
+        except RedisError as e:
+            logger.warning(f"Webhook idempotency cache unavailable: {e}")
+            return False
+
+    async def mark_done(self, idempotency_key: str) -> None:
+        """Turn the claim into a long-lived done marker after the commit"""
+        try:
+            redis = await self._get_redis()
+            await redis.set(self._make_key(idempotency_key), self._DONE, ex=self.TTL_SECONDS)
+        except RedisError as e:
+            logger.warning(f"Failed to mark webhook idempotency key done: {e}")
+
+    async def release(self, idempotency_key: str) -> None:
+        """Release a claim so a retry of a failed webhook is processed again"""
+        try:
+            redis = await self._get_redis()
+            await redis.delete(self._make_key(idempotency_key))
+        except RedisError as e:
+            logger.warning(f"Failed to release webhook idempotency key: {e}")
+
+
+# Global instance
+webhook_idempotency_cache = WebhookIdempotencyCache()
+
+
 class WebhookService:
     """Service for processing T-Bank webhooks with idempotency and DLQ support."""
 
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def check_idempotency(self, idempotency_key: str) -> Optional[BankEvent]:
+    async def check_idempotency(self, idempotency_key: str) -> bool:
         """
         Check if webhook has already been processed.
 
+        Only an indexed EXISTS probe - the stored event (and its JSONB
+        payload) is never loaded.
+
         Args:
             idempotency_key: Unique key for the webhook event
 
         Returns:
-            Existing BankEvent if already processed, None otherwise
+            True if an event with this key was already processed
         """
         if not idempotency_key:
-            return None
+            return False
 
         result = await self.db.execute(
-            select(BankEvent).where(
-                BankEvent.idempotency_key == idempotency_key,
-                BankEvent.processed_at.isnot(None)
+            select(
+                exists().where(
+                    BankEvent.idempotency_key == idempotency_key,
+                    BankEvent.processed_at.isnot(None),
+                )
             )
         )
-        return result.scalar_one_or_none()
+        return result.scalar()
 
     async def mark_processed(self, event: BankEvent) -> None:
         """
@@ -93,7 +190,7 @@ class WebhookService:
         Args:
             event: BankEvent to mark as processed
         """
-        event.processed_at = datetime.utcnow()
+        event.processed_at = utc_now()
         event.status = "processed"
 
     async def save_to_dlq(
@@ -2,14 +2,16 @@
 
 import logging
 import hashlib
+import re
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Optional, Dict, Any, List
-from uuid import UUID
+from typing import Optional, Dict, Any, List, Tuple
+from uuid import UUID, uuid4
 import secrets
 
-from sqlalchemy import select
+from sqlalchemy import Select, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.models.contract import SignedContract, ContractSignature, ContractStatus
 from app.models.document import ContractTemplate, TemplateType, ContractLayer
@@ -18,6 +20,40 @@ from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
+# Columns of a contract list item (ContractListItem)
+_CONTRACT_LIST_COLUMNS = (
+    SignedContract.id,
+    SignedContract.contract_number,
+    SignedContract.contract_type,
+    SignedContract.status,
+    SignedContract.generated_at,
+    SignedContract.signed_at,
+    SignedContract.expires_at,
+    SignedContract.required_signers,
+)
+
+_PLACEHOLDER_RE = re.compile(r"\{\{([^{}]+)\}\}")
+_MAX_COMPILED_TEMPLATES = 256
+
+# (template id, updated_at) -> [literal, placeholder, literal, ...]
+_compiled_templates: Dict[Tuple[UUID, Optional[datetime]], List[str]] = {}
+
+
+def _compile_template(template: ContractTemplate) -> List[str]:
+    """Split a template body into literal/placeholder parts, cached per template revision"""
+    body: str = template.template_body
+    if template.id is None:
+        return _PLACEHOLDER_RE.split(body)
+
+    key: Tuple[UUID, Optional[datetime]] = (template.id, template.updated_at)
+    parts = _compiled_templates.get(key)
+    if parts is None:
+        if len(_compiled_templates) >= _MAX_COMPILED_TEMPLATES:
+            _compiled_templates.clear()
+        parts = _PLACEHOLDER_RE.split(body)
+        _compiled_templates[key] = parts
+    return parts
+
 
 class ContractGenerationService:
     """
@@ -106,15 +142,33 @@ class ContractGenerationService:
         """
         Render template HTML with provided data.
 
-        Uses simple string replacement for placeholders like {{variable_name}}
+        Placeholders like {{variable_name}} are substituted in a single pass
+        over the precompiled template; unknown placeholders are left as is.
         """
-        html = template.template_body
+        parts = _compile_template(template)
+        rendered = list(parts)
+
+        # Odd positions hold placeholder names
+        for i in range(1, len(parts), 2):
+            key = parts[i]
+            if key in data:
+                value = data[key]
+                rendered[i] = str(value) if value else ""
+            else:
+                rendered[i] = f"{{{{{key}}}}}"
+
+        return "".join(rendered)
+
+    async def warm_template_cache(self) -> int:
+        """Precompile all active templates (called at startup). Returns count."""
+        stmt = select(ContractTemplate).where(ContractTemplate.active.is_(True))
+        result = await self.db.execute(stmt)
+        templates = result.scalars().all()
 
-        for key, value in data.items():
-            placeholder = f"{{{{{key}}}}}"  # {{key}}
-            html = html.replace(placeholder, str(value) if value else "")
+        for template in templates:
+            _compile_template(template)
 
-        return html
+        return len(templates)
 
     def build_contract_data(
         self,
@@ -154,6 +208,7 @@ class ContractGenerationService:
         template_type: TemplateType,
         agent_user: User,
         additional_data: Optional[Dict[str, Any]] = None,
+        template: Optional[ContractTemplate] = None,
     ) -> SignedContract:
         """
         Generate a contract for a bank-split deal.
@@ -163,12 +218,14 @@ class ContractGenerationService:
             template_type: Type of contract template
             agent_user: Agent user
             additional_data: Additional data to include in contract
+            template: Active template if already loaded by the caller
 
         Returns:
             Created SignedContract
         """
         # Get template
-        template = await self.get_template(template_type)
+        if template is None:
+            template = await self.get_template(template_type)
 
         if not template:
             # Create a default template if none exists
@@ -188,8 +245,9 @@ class ContractGenerationService:
         # Determine required signers based on template type
         required_signers = self._determine_signers(deal, template_type)
 
-        # Create contract
+        # Create contract (id assigned up front so signatures go in the same flush)
         contract = SignedContract(
+            id=uuid4(),
             deal_id=deal.id,
             template_id=template.id,
             contract_number=self.generate_contract_number(),
@@ -208,7 +266,6 @@ class ContractGenerationService:
         )
 
         self.db.add(contract)
-        await self.db.flush()
 
         # Create signature records for each required signer
         for signer in required_signers:
@@ -353,7 +410,7 @@ class ContractGenerationService:
         user: User,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
-    ) -> ContractSignature:
+    ) -> Tuple[ContractSignature, SignedContract]:
         """
         Sign a contract.
 
@@ -364,10 +421,15 @@ class ContractGenerationService:
             user_agent: Client user agent
 
         Returns:
-            Updated signature record
+            Updated signature record and the contract with its new status
         """
-        # Get contract
-        stmt = select(SignedContract).where(SignedContract.id == contract_id)
+        # Get contract, locked until commit: required_signers is rewritten
+        # below, and concurrent signers would otherwise lose each other's update
+        stmt = (
+            select(SignedContract)
+            .where(SignedContract.id == contract_id)
+            .with_for_update()
+        )
         result = await self.db.execute(stmt)
         contract = result.scalar_one_or_none()
 
@@ -403,8 +465,9 @@ class ContractGenerationService:
         signature.user_agent = user_agent
         signature.otp_verified = True  # Assuming OTP was verified before this call
 
-        # Update required_signers in contract
-        signers = list(contract.required_signers)
+        # Update required_signers in contract (copy the dicts so the JSONB change is detected)
+        current_signers: List[Dict[str, Any]] = contract.required_signers
+        signers = [dict(s) for s in current_signers]
         for s in signers:
             if s["user_id"] == user.id:
                 s["signed_at"] = signature.signed_at.isoformat()
@@ -422,7 +485,7 @@ class ContractGenerationService:
         await self.db.flush()
 
         logger.info(f"User {user.id} signed contract {contract.contract_number}")
-        return signature
+        return signature, contract
 
     async def get_deal_contracts(self, deal_id: UUID) -> List[SignedContract]:
         """Get all contracts for a deal"""
@@ -433,6 +496,58 @@ class ContractGenerationService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    @staticmethod
+    def deal_contracts_for_participant_stmt(deal_id: UUID, user_id: int, columns_only: bool = False) -> Select:
+        """
+        Query for a deal's contracts (newest first), restricted to deal creator or agent.
+
+        columns_only selects just the contract list columns as plain rows,
+        skipping ORM hydration entirely.
+        """
+        if columns_only:
+            stmt = select(*_CONTRACT_LIST_COLUMNS)
+        else:
+            # List responses carry metadata only; rendered HTML is served separately
+            stmt = select(SignedContract).options(defer(SignedContract.html_content))
+        return (
+            stmt
+            .join(Deal, Deal.id == SignedContract.deal_id)
+            .where(
+                SignedContract.deal_id == deal_id,
+                Deal.deleted_at.is_(None),
+                or_(Deal.created_by_user_id == user_id, Deal.agent_user_id == user_id),
+            )
+            .order_by(SignedContract.created_at.desc())
+        )
+
+    async def get_contract_html_for_participant(self, contract_id: UUID, user_id: int) -> Optional[str]:
+        """Get only the rendered HTML of a contract, if user is creator or agent of its deal"""
+        stmt = (
+            select(SignedContract.html_content)
+            .join(Deal, Deal.id == SignedContract.deal_id)
+            .where(
+                SignedContract.id == contract_id,
+                Deal.deleted_at.is_(None),
+                or_(Deal.created_by_user_id == user_id, Deal.agent_user_id == user_id),
+            )
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_contract_for_participant(self, contract_id: UUID, user_id: int) -> Optional[SignedContract]:
+        """Get a contract by ID, only if user is creator or agent of its deal"""
+        stmt = (
+            select(SignedContract)
+            .join(Deal, Deal.id == SignedContract.deal_id)
+            .where(
+                SignedContract.id == contract_id,
+                Deal.deleted_at.is_(None),
+                or_(Deal.created_by_user_id == user_id, Deal.agent_user_id == user_id),
+            )
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def get_contract(self, contract_id: UUID) -> Optional[SignedContract]:
         """Get a contract by ID"""
         stmt = select(SignedContract).where(SignedContract.id == contract_id)
@@ -1,6 +1,6 @@
 """Deal service implementation"""
 
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from sqlalchemy import select, func
@@ -33,11 +33,18 @@ class DealService:
         self.db = db
         self.user_service = UserService(db)
 
-    async def get_by_id(self, deal_id: UUID, include_deleted: bool = False) -> Optional[Deal]:
-        """Get deal by ID"""
+    async def get_by_id(
+        self,
+        deal_id: UUID,
+        include_deleted: bool = False,
+        created_by_user_id: Optional[int] = None,
+    ) -> Optional[Deal]:
+        """Get deal by ID, optionally only if created by the given user"""
         stmt = select(Deal).where(Deal.id == deal_id).options(selectinload(Deal.parties), selectinload(Deal.terms))
         if not include_deleted:
             stmt = stmt.where(Deal.deleted_at.is_(None))
+        if created_by_user_id is not None:
+            stmt = stmt.where(Deal.created_by_user_id == created_by_user_id)
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -48,10 +55,16 @@ class DealService:
         page: int = 1,
         page_size: int = 20,
         include_deleted: bool = False,
-    ) -> Tuple[List[Deal], int]:
-        """List deals for user"""
+        columns: Optional[Sequence[Any]] = None,
+    ) -> Tuple[List[Any], int]:
+        """List deals for user
+
+        With ``columns`` only those columns are selected and plain rows are
+        returned instead of ``Deal`` instances (no relationship loading).
+        """
         # Base query: deals where user is creator or agent
-        stmt = select(Deal).where((Deal.created_by_user_id == user.id) | (Deal.agent_user_id == user.id))
+        stmt = select(*columns) if columns else select(Deal)
+        stmt = stmt.where((Deal.created_by_user_id == user.id) | (Deal.agent_user_id == user.id))
 
         # Exclude soft-deleted by default
         if not include_deleted:
@@ -65,13 +78,14 @@ class DealService:
         total_result = await self.db.execute(count_stmt)
         total = total_result.scalar()
 
-        # Paginate and eager-load relationships to avoid N+1
-        stmt = (
-            stmt.options(selectinload(Deal.parties), selectinload(Deal.terms))
-            .order_by(Deal.created_at.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-        )
+        stmt = stmt.order_by(Deal.created_at.desc()).offset((page - 1) * page_size).limit(page_size)
+
+        if columns:
+            result = await self.db.execute(stmt)
+            return list(result.all()), total
+
+        # Eager-load relationships to avoid N+1
+        stmt = stmt.options(selectinload(Deal.parties), selectinload(Deal.terms))
 
         result = await self.db.execute(stmt)
         deals = list(result.scalars().all())
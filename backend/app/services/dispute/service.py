@@ -21,6 +21,7 @@ from app.models.dispute import (
 )
 from app.models.user import User
 from app.integrations.tbank import get_tbank_deals_client, TBankError
+from app.services.bank_split.payment_info_cache import payment_info_cache
 
 logger = logging.getLogger(__name__)
 
@@ -533,6 +534,8 @@ class DisputeService:
             deal.status = DealStatus.REFUNDED.value
             logger.info(f"Deal {deal.id} marked as refunded (manual processing required)")
 
+        payment_info_cache.invalidate_after_commit(self.db, deal.id)
+
     async def _process_release(self, deal: Deal) -> None:
         """Process release to recipients"""
         # Only process via T-Bank for bank-split deals with external ID
@@ -551,3 +554,5 @@ class DisputeService:
             # Return to hold period or payout ready for manual processing
             deal.status = DealStatus.PAYOUT_READY.value
             logger.info(f"Deal {deal.id} marked as payout ready")
+
+        payment_info_cache.invalidate_after_commit(self.db, deal.id)
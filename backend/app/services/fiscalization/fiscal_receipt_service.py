@@ -19,6 +19,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.security import utc_now
 from app.models.bank_split import DealSplitRecipient, RecipientRole, LegalType
 from app.models.deal import Deal
 from app.models.fiscalization import FiscalReceipt, FiscalReceiptType, FiscalReceiptStatus
@@ -381,7 +382,7 @@ class FiscalReceiptService:
             fiscal_receipt.fiscal_data = response.fiscal_data
 
         if response.status == TBankChecksReceiptStatus.DONE:
-            fiscal_receipt.confirmed_at = datetime.utcnow()
+            fiscal_receipt.confirmed_at = utc_now()
 
         logger.info(
             f"Receipt {fiscal_receipt.id} sent to T-Bank with {len(items)} items, "
@@ -411,7 +412,7 @@ class FiscalReceiptService:
                 fiscal_receipt.fiscal_data = response.fiscal_data
 
             if response.status == TBankChecksReceiptStatus.DONE and not fiscal_receipt.confirmed_at:
-                fiscal_receipt.confirmed_at = datetime.utcnow()
+                fiscal_receipt.confirmed_at = utc_now()
 
             if response.error_code:
                 fiscal_receipt.error_code = response.error_code
@@ -494,7 +495,7 @@ class FiscalReceiptService:
             refund_receipt.sent_at = datetime.utcnow()
 
             if response.status == TBankChecksReceiptStatus.DONE:
-                refund_receipt.confirmed_at = datetime.utcnow()
+                refund_receipt.confirmed_at = utc_now()
                 refund_receipt.receipt_url = response.receipt_url
 
             # Mark original as cancelled
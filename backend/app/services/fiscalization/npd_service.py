@@ -19,7 +19,7 @@ Reminder Schedule:
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 from uuid import UUID
 
@@ -172,7 +172,7 @@ class NPDReceiptService:
         receipt.receipt_url = receipt_url
         receipt.npd_source = source.value
         receipt.npd_uploaded_at = now
-        receipt.confirmed_at = now
+        receipt.confirmed_at = now.replace(tzinfo=timezone.utc)
         receipt.next_reminder_at = None  # No more reminders needed
 
         await self.db.flush()
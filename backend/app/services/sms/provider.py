@@ -1,6 +1,10 @@
 """SMS provider interface and implementations"""
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Optional
+
+import httpx
 
 from app.core.config import settings
 
@@ -13,6 +17,9 @@ class SMSProvider(ABC):
         """Send SMS"""
         pass
 
+    async def close(self) -> None:
+        """Release provider resources (no-op by default)"""
+
 
 class MockSMSProvider(SMSProvider):
     """Mock SMS provider for development"""
@@ -31,11 +38,25 @@ class SMSRuProvider(SMSProvider):
         self.api_id = api_id
         self.test_mode = test_mode
         self.base_url = "https://sms.ru"
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared keep-alive HTTP client (one pool per provider)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close HTTP client"""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+            self._client = None
 
     async def send(self, phone: str, message: str) -> bool:
         """Send SMS via SMS.RU API"""
-        import httpx
-
         # Remove + from phone if present
         phone = phone.lstrip("+")
 
@@ -46,28 +67,28 @@ class SMSRuProvider(SMSProvider):
             return True
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/sms/send",
-                    data={
-                        "api_id": self.api_id,
-                        "to": phone,
-                        "msg": message,
-                        "json": 1,
-                    },
-                    timeout=10.0,
-                )
-
-                result = response.json()
-
-                if result.get("status") == "OK":
-                    print(f"[SMS.RU] Sent to {phone}, SMS ID: {result.get('sms', {}).get(phone, {}).get('sms_id')}")
-                    return True
-                else:
-                    error_code = result.get("status_code")
-                    error_text = result.get("status_text", "Unknown error")
-                    print(f"[SMS.RU Error] Code: {error_code}, Text: {error_text}")
-                    return False
+            client = self._get_client()
+            response = await client.post(
+                f"{self.base_url}/sms/send",
+                data={
+                    "api_id": self.api_id,
+                    "to": phone,
+                    "msg": message,
+                    "json": 1,
+                },
+                timeout=10.0,
+            )
+
+            result = response.json()
+
+            if result.get("status") == "OK":
+                print(f"[SMS.RU] Sent to {phone}, SMS ID: {result.get('sms', {}).get(phone, {}).get('sms_id')}")
+                return True
+            else:
+                error_code = result.get("status_code")
+                error_text = result.get("status_text", "Unknown error")
+                print(f"[SMS.RU Error] Code: {error_code}, Text: {error_text}")
+                return False
 
         except Exception as e:
             print(f"[SMS.RU Exception] {str(e)}")
@@ -75,17 +96,15 @@ class SMSRuProvider(SMSProvider):
 
     async def check_balance(self) -> float:
         """Check SMS.RU balance"""
-        import httpx
-
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{self.base_url}/my/balance", params={"api_id": self.api_id}, timeout=10.0)
-                result = response.json()
+            client = self._get_client()
+            response = await client.get(f"{self.base_url}/my/balance", params={"api_id": self.api_id}, timeout=10.0)
+            result = response.json()
 
-                if result.get("status") == "OK":
-                    balance = float(result.get("balance", 0))
-                    print(f"[SMS.RU] Balance: {balance} RUB")
-                    return balance
+            if result.get("status") == "OK":
+                balance = float(result.get("balance", 0))
+                print(f"[SMS.RU] Balance: {balance} RUB")
+                return balance
 
         except Exception as e:
             print(f"[SMS.RU Balance Check Exception] {str(e)}")
@@ -93,8 +112,9 @@ class SMSRuProvider(SMSProvider):
         return 0.0
 
 
+@lru_cache(maxsize=1)
 def get_sms_provider() -> SMSProvider:
-    """Get SMS provider based on settings"""
+    """Get SMS provider based on settings (singleton, shares its HTTP pool)"""
     if settings.SMS_PROVIDER == "mock":
         return MockSMSProvider()
     elif settings.SMS_PROVIDER == "sms_ru":
@@ -103,3 +123,13 @@ def get_sms_provider() -> SMSProvider:
         # Fallback to mock if provider unknown
         print(f"[Warning] Unknown SMS provider: {settings.SMS_PROVIDER}, using Mock")
         return MockSMSProvider()
+
+
+async def close_sms_provider() -> None:
+    """
+    Close SMS provider connections.
+
+    Should be called on application shutdown.
+    """
+    if get_sms_provider.cache_info().currsize:
+        await get_sms_provider().close()
@@ -23,6 +23,7 @@ def check_hold_expiry(self):
     import asyncio
     from app.db.session import async_session_maker
     from app.services.bank_split import BankSplitDealService
+    from app.services.bank_split.payment_info_cache import flush_pending_invalidations
 
     logger.info("Starting hold expiry check")
 
@@ -31,6 +32,7 @@ def check_hold_expiry(self):
             service = BankSplitDealService(db)
             released = await service.check_expired_holds()
             await db.commit()
+            await flush_pending_invalidations()
             return len(released)
 
     try:
@@ -178,6 +180,7 @@ def check_milestone_triggers(self):
     import asyncio
     from app.db.session import async_session_maker
     from app.services.bank_split.milestone_service import MilestoneService
+    from app.services.bank_split.payment_info_cache import flush_pending_invalidations
 
     logger.info("Starting milestone triggers check")
 
@@ -186,6 +189,7 @@ def check_milestone_triggers(self):
             service = MilestoneService(db)
             results = await service.check_milestone_triggers()
             await db.commit()
+            await flush_pending_invalidations()
             return results
 
     try:
@@ -396,10 +400,12 @@ def check_act_signature_timeout(self, deal_id: str):
 
             # Auto-release
             from app.services.bank_split.deal_service import BankSplitDealService
+            from app.services.bank_split.payment_info_cache import flush_pending_invalidations
 
             deal_service = BankSplitDealService(db)
             await deal_service.auto_release_confirmation(deal)
             await db.commit()
+            await flush_pending_invalidations()
 
             logger.info(f"Deal {deal_id} auto-released after confirmation timeout")
 
@@ -438,6 +444,7 @@ def check_expired_confirmations(self):
     import asyncio
     from app.db.session import async_session_maker
     from app.services.bank_split.deal_service import BankSplitDealService
+    from app.services.bank_split.payment_info_cache import flush_pending_invalidations
 
     logger.info("Starting periodic expired confirmations check")
 
@@ -446,6 +453,7 @@ def check_expired_confirmations(self):
             service = BankSplitDealService(db)
             released = await service.check_expired_confirmations()
             await db.commit()
+            await flush_pending_invalidations()
             return len(released)
 
     try:
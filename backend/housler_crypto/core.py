@@ -70,6 +70,7 @@ class HouslerCrypto:
         self._salt = salt.encode("utf-8")
         self._iterations = iterations
         self._key_cache: dict[str, bytes] = {}
+        self._aead_cache: dict[str, AESGCM] = {}
 
     def _derive_key(self, field: str) -> bytes:
         """
@@ -94,6 +95,19 @@ class HouslerCrypto:
         self._key_cache[field] = derived_key
         return derived_key
 
+    def _get_aead(self, field: str) -> AESGCM:
+        """
+        Get the AES-GCM cipher for a field.
+
+        The key schedule is set up once per field and the cipher reused;
+        AESGCM holds no per-message state, so sharing it is safe.
+        """
+        aesgcm = self._aead_cache.get(field)
+        if aesgcm is None:
+            aesgcm = AESGCM(self._derive_key(field))
+            self._aead_cache[field] = aesgcm
+        return aesgcm
+
     def encrypt(self, plaintext: str, field: str = "default") -> str:
         """
         Encrypt data using AES-256-GCM.
@@ -115,10 +129,9 @@ class HouslerCrypto:
         if plaintext.startswith(ENCRYPTED_PREFIX):
             return plaintext
 
-        key = self._derive_key(field)
         iv = os.urandom(IV_LENGTH)
 
-        aesgcm = AESGCM(key)
+        aesgcm = self._get_aead(field)
         ciphertext = aesgcm.encrypt(iv, plaintext.encode("utf-8"), None)
 
         # GCM appends tag to ciphertext, we need to separate
@@ -173,8 +186,7 @@ class HouslerCrypto:
             # AESGCM expects tag appended to ciphertext
             combined = encrypted_data + tag
 
-            key = self._derive_key(field)
-            aesgcm = AESGCM(key)
+            aesgcm = self._get_aead(field)
             plaintext = aesgcm.decrypt(iv, combined, None)
 
             return plaintext.decode("utf-8")
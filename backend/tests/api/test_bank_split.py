@@ -16,6 +16,8 @@ Tests cover:
 Run with: pytest tests/api/test_bank_split.py -v
 """
 
+import json
+
 import pytest
 from uuid import uuid4, UUID
 from decimal import Decimal
@@ -346,9 +348,10 @@ class TestGetDeal:
         """Test getting deal by non-owner/non-agent returns 403."""
         # User 2 tries to access deal created by user 1
         with patch("app.api.deps.get_current_user", return_value=mock_user_other):
+            # The access predicate is in SQL, so a non-participant gets no row
             with patch(
-                "app.services.bank_split.BankSplitDealService.get_deal",
-                return_value=mock_deal,
+                "app.services.bank_split.BankSplitDealService.get_deal_for_user",
+                return_value=None,
             ):
                 response = await client.get(f"/api/v1/bank-split/{mock_deal.id}")
 
@@ -918,6 +921,37 @@ class TestResponseFormat:
             data = response.json()
             assert "detail" in data
 
+    def test_json_response_matches_response_model_encoding(self, mock_deal):
+        """orjson fast path renders a deal exactly like response_model would"""
+        from fastapi.encoders import jsonable_encoder
+        from app.api.v1.endpoints.bank_split import (
+            _deal_response,
+            _json_response,
+            compute_platform_fee,
+        )
+        from app.schemas.bank_split import BankSplitDealResponse
+
+        recipient = MockRecipient(mock_deal.id)
+        fee_percent, fee_amount, total_payment = compute_platform_fee(mock_deal.commission_agent)
+        expected = jsonable_encoder(BankSplitDealResponse(
+            **{
+                name: getattr(mock_deal, name)
+                for name in BankSplitDealResponse.model_fields
+                if name not in (
+                    "platform_fee_percent", "platform_fee_amount",
+                    "total_client_payment", "recipients",
+                )
+            },
+            platform_fee_percent=fee_percent,
+            platform_fee_amount=fee_amount,
+            total_client_payment=total_payment,
+            recipients=[recipient.__dict__],
+        ))
+
+        response = _json_response(_deal_response(mock_deal, [recipient]), status_code=201)
+
+        assert response.status_code == 201
+        assert json.loads(response.body) == expected
 
 # =============================================================================
 # Test Deal Types
@@ -0,0 +1,92 @@
+"""Tests for rendering list endpoints from the request session"""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from app.api.v1.endpoints import bank_split
+from app.models.bank_split import DealMilestone
+from app.schemas.bank_split import ContractListResponse, MilestoneListResponse
+
+
+def _db(rows, columns_only=False):
+    """Request session stand-in whose execute() returns the given rows"""
+    result = MagicMock()
+    if columns_only:
+        result.all.return_value = rows
+    else:
+        result.scalars.return_value.all.return_value = rows
+    db = AsyncMock()
+    db.execute.return_value = result
+    return db
+
+
+def _contract_row():
+    return SimpleNamespace(
+        id=uuid4(),
+        contract_number="HD-1",
+        contract_type="bank_split_agent_agreement",
+        status="generated",
+        generated_at=datetime(2026, 1, 1, 12, 0),
+        signed_at=None,
+        expires_at=None,
+        required_signers=[{"user_id": 1}],
+    )
+
+
+class TestListResponse:
+    """Tests for _list_response"""
+
+    STMT = select(DealMilestone)
+
+    @pytest.mark.asyncio
+    async def test_no_rows_returns_none(self):
+        db = _db([])
+
+        assert await bank_split._list_response(db, self.STMT, ContractListResponse) is None
+
+    @pytest.mark.asyncio
+    async def test_renders_rows_on_request_session(self):
+        row = _contract_row()
+        db = _db([row], columns_only=True)
+
+        with patch.object(bank_split, "async_session_maker") as session_maker:
+            response = await bank_split._list_response(
+                db, self.STMT, ContractListResponse, columns_only=True
+            )
+
+        session_maker.assert_not_called()
+        db.execute.assert_awaited_once_with(self.STMT)
+        body = json.loads(response.body)
+        assert body["total"] == 1
+        assert body["items"][0]["id"] == str(row.id)
+        assert body["items"][0]["generated_at"] == "2026-01-01T12:00:00"
+
+    @pytest.mark.asyncio
+    async def test_extra_keys_render_like_response_model(self):
+        now = datetime(2026, 1, 1)
+        milestone = SimpleNamespace(
+            id=uuid4(), deal_id=uuid4(), step_no=1, name="Advance", description=None,
+            amount=Decimal("100.00"), percent=Decimal("30"), currency="RUB", status="pending",
+            release_trigger="immediate", release_delay_hours=None, release_date=None,
+            release_scheduled_at=None, paid_at=None, confirmed_at=None, released_at=None,
+            confirmed_by_user_id=None, external_step_id=None, created_at=now, updated_at=now,
+        )
+        db = _db([milestone])
+
+        response = await bank_split._list_response(
+            db, self.STMT, MilestoneListResponse,
+            total_amount=Decimal("100.00"),
+            released_amount=Decimal("0"),
+            pending_amount=Decimal("100.00"),
+        )
+
+        body = json.loads(response.body)
+        assert body["total_amount"] == "100.00"
+        assert body["items"][0]["amount"] == "100.00"
@@ -0,0 +1,65 @@
+"""Tests for recording payment link SMS delivery in audit_logs"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.api.v1.endpoints import bank_split
+from app.models.document import AuditLog
+
+
+class TestSendPaymentLinkSms:
+    """Tests for the _send_payment_link_sms background task"""
+
+    def setup_method(self):
+        self.deal_id = uuid4()
+        self.db = MagicMock()
+        self.db.commit = AsyncMock()
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=self.db)
+        context.__aexit__ = AsyncMock(return_value=False)
+        self.session_maker = MagicMock(return_value=context)
+
+    async def _send(self, provider):
+        with patch.object(bank_split, "get_sms_provider", return_value=provider), \
+                patch.object(bank_split, "async_session_maker", self.session_maker):
+            await bank_split._send_payment_link_sms(self.deal_id, 7, "+79991234567", "link")
+
+    def _recorded(self) -> AuditLog:
+        self.db.commit.assert_awaited_once()
+        (entry,), _ = self.db.add.call_args
+        assert isinstance(entry, AuditLog)
+        assert entry.entity_type == "deal"
+        assert entry.entity_id == self.deal_id
+        assert entry.actor_user_id == 7
+        return entry
+
+    @pytest.mark.asyncio
+    async def test_failed_send_writes_failure_row(self):
+        provider = MagicMock()
+        provider.send = AsyncMock(return_value=False)
+
+        await self._send(provider)
+
+        assert self._recorded().action == "sms_payment_link_failed"
+
+    @pytest.mark.asyncio
+    async def test_provider_error_writes_failure_row(self):
+        provider = MagicMock()
+        provider.send = AsyncMock(side_effect=RuntimeError("timeout"))
+
+        await self._send(provider)
+
+        assert self._recorded().action == "sms_payment_link_failed"
+
+    @pytest.mark.asyncio
+    async def test_successful_send_writes_sent_row(self):
+        provider = MagicMock()
+        provider.send = AsyncMock(return_value=True)
+
+        await self._send(provider)
+
+        entry = self._recorded()
+        assert entry.action == "sms_payment_link_sent"
+        assert "+79991234567" not in str(entry.meta)
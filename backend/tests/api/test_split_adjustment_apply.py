@@ -0,0 +1,60 @@
+"""Tests for applying an approved split adjustment after the response"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.api.v1.endpoints import bank_split
+
+
+def _session_maker(*sessions):
+    """async_session_maker stand-in handing out the given sessions in order"""
+    contexts = []
+    for session in sessions:
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=session)
+        context.__aexit__ = AsyncMock(return_value=False)
+        contexts.append(context)
+    return MagicMock(side_effect=contexts)
+
+
+class TestApplySplitAdjustmentTask:
+    """Tests for _apply_split_adjustment_task"""
+
+    def setup_method(self):
+        self.adjustment_id = uuid4()
+        self.deal_id = uuid4()
+        self.new_split = {"1": 50, "2": 50}
+
+    @pytest.mark.asyncio
+    async def test_success_commits_without_marking(self):
+        db = AsyncMock()
+        service = MagicMock()
+        service.apply_split_adjustment = AsyncMock()
+        service.mark_adjustment_apply_failed = AsyncMock()
+
+        with patch.object(bank_split, "async_session_maker", _session_maker(db)), \
+                patch.object(bank_split, "SplitService", return_value=service):
+            await bank_split._apply_split_adjustment_task(self.adjustment_id, self.deal_id, self.new_split)
+
+        service.apply_split_adjustment.assert_awaited_once_with(self.deal_id, self.new_split)
+        service.mark_adjustment_apply_failed.assert_not_awaited()
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failure_marks_adjustment_apply_failed(self):
+        apply_db, mark_db = AsyncMock(), AsyncMock()
+        service = MagicMock()
+        service.apply_split_adjustment = AsyncMock(side_effect=ValueError("No recipients found"))
+        service.mark_adjustment_apply_failed = AsyncMock()
+
+        with patch.object(bank_split, "async_session_maker", _session_maker(apply_db, mark_db)), \
+                patch.object(bank_split, "SplitService", return_value=service):
+            await bank_split._apply_split_adjustment_task(self.adjustment_id, self.deal_id, self.new_split)
+
+        apply_db.commit.assert_not_awaited()
+        service.mark_adjustment_apply_failed.assert_awaited_once_with(
+            self.adjustment_id, "No recipients found"
+        )
+        mark_db.commit.assert_awaited_once()
@@ -156,6 +156,45 @@ class TestCheckOpenDisputes:
         assert dispute is not None
 
 
+class TestCompletionSnapshot:
+    """Tests for get_completion_snapshot"""
+
+    @pytest.fixture
+    def mock_db(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def service(self, mock_db):
+        return ServiceCompletionService(mock_db)
+
+    @pytest.mark.asyncio
+    async def test_no_confirmations(self, service, mock_db):
+        """NULL jsonb_agg (no rows) becomes an empty list"""
+        mock_result = MagicMock()
+        mock_result.one.return_value = (None, False)
+        mock_db.execute.return_value = mock_result
+
+        confirmations, has_open_dispute = await service.get_completion_snapshot(uuid4())
+
+        assert confirmations == []
+        assert has_open_dispute is False
+        mock_db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_confirmations_and_dispute(self, service, mock_db):
+        """Aggregated rows and the dispute flag come from one statement"""
+        rows = [{"user_id": 1, "confirmed_at": "2026-10-17T12:00:00.5", "notes": None,
+                 "triggers_release": True, "release_triggered_at": None}]
+        mock_result = MagicMock()
+        mock_result.one.return_value = (rows, True)
+        mock_db.execute.return_value = mock_result
+
+        confirmations, has_open_dispute = await service.get_completion_snapshot(uuid4())
+
+        assert confirmations == rows
+        assert has_open_dispute is True
+
+
 class TestConfirmServiceCompletion:
     """Tests for the main confirmation flow"""
 
@@ -220,8 +259,7 @@ class TestConfirmServiceCompletion:
     async def test_cannot_confirm_twice(self, service, mock_user, mock_deal, mock_db):
         """Cannot confirm if user already confirmed"""
         # First call - check for dispute (return None)
-        # Second call - check for existing confirmation (return existing)
-        mock_existing = MagicMock()
+        # Second call - insert CTE (conflict, no row returned)
         call_count = [0]
 
         async def execute_side_effect(*args, **kwargs):
@@ -231,8 +269,8 @@ class TestConfirmServiceCompletion:
             if call_count[0] == 1:
                 result.scalar_one_or_none.return_value = None
             else:
-                # Second call is existing confirmation check - return existing
-                result.scalar_one_or_none.return_value = mock_existing
+                # Second call is the insert - ON CONFLICT returned no row
+                result.one.return_value = MagicMock(completion_id=None, confirmed_ids=[1])
             return result
 
         mock_db.execute.side_effect = execute_side_effect
@@ -242,6 +280,32 @@ class TestConfirmServiceCompletion:
 
         assert "already confirmed" in str(exc_info.value).lower()
 
+    @pytest.mark.asyncio
+    async def test_new_confirmation_counts_toward_all_confirmed(self, service, mock_user, mock_deal, mock_db):
+        """The inserted row is not in the statement snapshot, so the confirmer is added"""
+        mock_deal.coagent_user_id = None
+        call_count = [0]
+
+        async def execute_side_effect(*args, **kwargs):
+            result = MagicMock()
+            call_count[0] += 1
+            if call_count[0] == 1:
+                result.scalar_one_or_none.return_value = None
+            else:
+                result.one.return_value = MagicMock(completion_id=uuid4(), confirmed_ids=None)
+            return result
+
+        mock_db.execute.side_effect = execute_side_effect
+
+        result = await service.confirm_service_completion(
+            mock_deal, mock_user, trigger_release=False
+        )
+
+        assert result.all_confirmed is True
+        assert result.confirmations_count == 1
+        assert result.completion.confirmed_by_user_id == mock_user.id
+        assert call_count[0] == 2
+
 
 class TestRequiredConfirmers:
     """Tests for get_required_confirmers"""
@@ -0,0 +1,88 @@
+"""Tests for DealInvoiceService"""
+
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.models.bank_split import DealInvoice, InvoiceStatus
+from app.services.bank_split.deal_invoice_service import DealInvoiceService
+
+
+def _make_invoice(amount: str, status: str, paid_amount: str = None) -> DealInvoice:
+    invoice = MagicMock(spec=DealInvoice)
+    invoice.amount = Decimal(amount)
+    invoice.status = status
+    invoice.paid_amount = Decimal(paid_amount) if paid_amount else None
+    return invoice
+
+
+class TestSummarizeInvoices:
+    """Tests for in-memory invoice summary (no DB required)"""
+
+    def setup_method(self):
+        self.service = DealInvoiceService.__new__(DealInvoiceService)
+        self.deal = MagicMock()
+        self.deal.calculated_commission = Decimal("100000.00")
+
+    def test_empty_invoices(self):
+        """No invoices - full commission remains"""
+        summary = self.service.summarize_invoices(self.deal, [])
+
+        assert summary.total_invoiced == Decimal("0")
+        assert summary.total_paid == Decimal("0")
+        assert summary.remaining_amount == Decimal("100000.00")
+        assert summary.invoices_count == 0
+
+    def test_cancelled_invoices_are_ignored(self):
+        """Cancelled invoices do not count towards invoiced amount"""
+        invoices = [
+            _make_invoice("30000", InvoiceStatus.PAID.value, paid_amount="30000"),
+            _make_invoice("20000", InvoiceStatus.PENDING.value),
+            _make_invoice("50000", InvoiceStatus.CANCELLED.value),
+        ]
+
+        summary = self.service.summarize_invoices(self.deal, invoices)
+
+        assert summary.total_invoiced == Decimal("50000")
+        assert summary.total_paid == Decimal("30000")
+        assert summary.remaining_amount == Decimal("50000.00")
+        assert summary.invoices_count == 2
+        assert summary.paid_invoices_count == 1
+
+    def test_remaining_never_negative(self):
+        """Over-invoiced deal reports zero remaining"""
+        invoices = [_make_invoice("150000", InvoiceStatus.PENDING.value)]
+
+        summary = self.service.summarize_invoices(self.deal, invoices)
+
+        assert summary.remaining_amount == Decimal("0")
+
+
+class TestInvoiceNumber:
+    """Tests for invoice number formatting"""
+
+    def test_format_invoice_number(self):
+        deal_id = uuid4()
+
+        number = DealInvoiceService._format_invoice_number(deal_id, 2)
+
+        assert number == f"INV-{str(deal_id)[:8].upper()}-003"
+
+
+class TestPaginationCursor:
+    """Tests for keyset pagination cursor encoding"""
+
+    def test_cursor_round_trip(self):
+        invoice = MagicMock(spec=DealInvoice)
+        invoice.created_at = datetime(2026, 1, 25, 10, 30, 15, 123456)
+        invoice.id = uuid4()
+
+        cursor = DealInvoiceService._encode_cursor(invoice)
+
+        assert DealInvoiceService._decode_cursor(cursor) == (invoice.created_at, invoice.id)
+
+    def test_invalid_cursor(self):
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            DealInvoiceService._decode_cursor("not-a-cursor")
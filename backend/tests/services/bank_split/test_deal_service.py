@@ -250,6 +250,28 @@ class TestBankSplitDealServiceMocked:
         recipient.payout_status = PayoutStatus.PENDING.value
         return recipient
 
+    @pytest.mark.asyncio
+    async def test_get_deal_for_user_filters_in_sql(self):
+        """Проверка доступа участника (создатель или агент) идёт в WHERE"""
+        self.mock_db.execute.return_value = MagicMock()
+
+        await self.service.get_deal_for_user(uuid4(), 7)
+
+        sql = str(self.mock_db.execute.call_args[0][0].whereclause)
+        assert "lk_deals.created_by_user_id" in sql
+        assert "lk_deals.agent_user_id" in sql
+
+    @pytest.mark.asyncio
+    async def test_get_deal_for_user_as_creator(self):
+        """as_creator=True: только создатель сделки"""
+        self.mock_db.execute.return_value = MagicMock()
+
+        await self.service.get_deal_for_user(uuid4(), 7, as_creator=True, load=())
+
+        sql = str(self.mock_db.execute.call_args[0][0].whereclause)
+        assert "lk_deals.created_by_user_id" in sql
+        assert "lk_deals.agent_user_id" not in sql
+
     @pytest.mark.asyncio
     async def test_create_deal_solo_agent(self):
         """Создание сделки соло-агентом (100% комиссии)"""
@@ -384,6 +406,21 @@ class TestBankSplitDealServiceMocked:
         assert deal.status == "invoiced"
         self.service.invoice_service.create_invoice.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_deal_recipients_from_eager_load(self):
+        """Загруженные через selectinload получатели берутся без повторного запроса"""
+        now = datetime.utcnow()
+        later = DealSplitRecipient(role="agent", created_at=now + timedelta(seconds=1))
+        earlier = DealSplitRecipient(role="agency", created_at=now)
+        deal = Deal(id=uuid4())
+        deal.split_recipients = [later, earlier]
+        self.service.split_service.get_deal_recipients = AsyncMock()
+
+        recipients = await self.service._get_deal_recipients(deal)
+
+        assert recipients == [earlier, later]
+        self.service.split_service.get_deal_recipients.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_create_invoice_no_recipients(self):
         """Ошибка создания счёта без получателей"""
@@ -0,0 +1,53 @@
+"""Tests for the milestone summary cache"""
+
+import json
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import RedisError
+
+from app.services.bank_split.milestone_service import MilestoneSummaryCache
+
+
+class TestMilestoneSummaryCache:
+    """Tests for the short-lived Redis summary cache"""
+
+    def setup_method(self):
+        self.cache = MilestoneSummaryCache()
+        self.cache._redis = AsyncMock()
+        self.deal_id = uuid4()
+
+    @pytest.mark.asyncio
+    async def test_hit_returns_decoded_summary(self):
+        summary = {"total_amount": 100.0, "milestones": []}
+        self.cache._redis.get.return_value = json.dumps(summary)
+
+        assert await self.cache.get(self.deal_id) == summary
+        self.cache._redis.get.assert_awaited_once_with(f"ms:{self.deal_id}")
+
+    @pytest.mark.asyncio
+    async def test_miss_returns_none(self):
+        self.cache._redis.get.return_value = None
+
+        assert await self.cache.get(self.deal_id) is None
+
+    @pytest.mark.asyncio
+    async def test_set_uses_ttl(self):
+        await self.cache.set(self.deal_id, {"milestones": []})
+
+        self.cache._redis.setex.assert_awaited_once_with(
+            f"ms:{self.deal_id}", MilestoneSummaryCache.TTL_SECONDS, '{"milestones": []}'
+        )
+
+    @pytest.mark.asyncio
+    async def test_redis_error_is_a_miss(self):
+        self.cache._redis.get.side_effect = RedisError("down")
+
+        assert await self.cache.get(self.deal_id) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_deletes_key(self):
+        await self.cache.invalidate(self.deal_id)
+
+        self.cache._redis.delete.assert_awaited_once_with(f"ms:{self.deal_id}")
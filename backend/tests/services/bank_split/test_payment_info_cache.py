@@ -0,0 +1,94 @@
+"""Tests for the public payment-info cache"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import RedisError
+
+from app.services.bank_split.payment_info_cache import (
+    PaymentInfoCache,
+    _discard_rolled_back,
+    _invalidate_committed,
+    flush_pending_invalidations,
+    payment_info_cache,
+)
+
+
+class TestPaymentInfoCache:
+    """Tests for the short-lived Redis payment-info cache"""
+
+    def setup_method(self):
+        self.cache = PaymentInfoCache()
+        self.cache._redis = AsyncMock()
+        self.deal_id = uuid4()
+
+    @pytest.mark.asyncio
+    async def test_hit_returns_body(self):
+        self.cache._redis.get.return_value = '{"status":"pending"}'
+
+        assert await self.cache.get(self.deal_id) == '{"status":"pending"}'
+        self.cache._redis.get.assert_awaited_once_with(f"pi:{self.deal_id}")
+
+    @pytest.mark.asyncio
+    async def test_set_uses_ttl(self):
+        await self.cache.set(self.deal_id, "{}")
+
+        self.cache._redis.setex.assert_awaited_once_with(
+            f"pi:{self.deal_id}", PaymentInfoCache.TTL_SECONDS, "{}"
+        )
+
+    @pytest.mark.asyncio
+    async def test_redis_error_is_a_miss(self):
+        self.cache._redis.get.side_effect = RedisError("down")
+
+        assert await self.cache.get(self.deal_id) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_deletes_key(self):
+        await self.cache.invalidate(self.deal_id)
+
+        self.cache._redis.delete.assert_awaited_once_with(f"pi:{self.deal_id}")
+
+
+class TestInvalidateAfterCommit:
+    """Tests for deferring invalidation until the session commits"""
+
+    def setup_method(self):
+        self.db = MagicMock()
+        self.db.sync_session.info = {}
+        self.deal_id = uuid4()
+
+    @pytest.mark.asyncio
+    async def test_commit_deletes_queued_keys(self):
+        payment_info_cache.invalidate_after_commit(self.db, self.deal_id)
+
+        with patch.object(payment_info_cache, "_redis", AsyncMock()) as redis:
+            redis.delete.assert_not_called()
+            _invalidate_committed(self.db.sync_session)
+            await asyncio.sleep(0)
+
+            redis.delete.assert_awaited_once_with(f"pi:{self.deal_id}")
+        assert self.db.sync_session.info == {}
+
+    @pytest.mark.asyncio
+    async def test_rollback_discards_queued_keys(self):
+        payment_info_cache.invalidate_after_commit(self.db, self.deal_id)
+
+        with patch.object(payment_info_cache, "_redis", AsyncMock()) as redis:
+            _discard_rolled_back(self.db.sync_session)
+            _invalidate_committed(self.db.sync_session)
+            await asyncio.sleep(0)
+
+            redis.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_flush_waits_for_scheduled_deletes(self):
+        payment_info_cache.invalidate_after_commit(self.db, self.deal_id)
+
+        with patch.object(payment_info_cache, "_redis", AsyncMock()) as redis:
+            _invalidate_committed(self.db.sync_session)
+            await flush_pending_invalidations()
+
+            redis.delete.assert_awaited_once_with(f"pi:{self.deal_id}")
@@ -2,12 +2,14 @@
 
 import pytest
 from decimal import Decimal
+from unittest.mock import AsyncMock
+from uuid import uuid4
 
 from app.services.bank_split.split_service import (
     SplitService,
     SplitRecipientInput,
 )
-from app.models.bank_split import RecipientRole, SplitType
+from app.models.bank_split import DealSplitRecipient, RecipientRole, SplitType
 
 
 class TestSplitCalculation:
@@ -217,3 +219,69 @@ class TestSplitCalculation:
         assert results[1].calculated_amount == Decimal("80000.00")
         assert results[2].calculated_amount == Decimal("10000.00")
         assert sum(r.calculated_amount for r in results) == total
+
+
+class TestApplySplitAdjustment:
+    """Tests for applying an approved split adjustment"""
+
+    def _recipient(self, user_id: int, split_value: str, amount: str) -> DealSplitRecipient:
+        return DealSplitRecipient(
+            id=uuid4(),
+            user_id=user_id,
+            split_value=Decimal(split_value),
+            calculated_amount=Decimal(amount),
+        )
+
+    @pytest.mark.asyncio
+    async def test_single_update_with_preloaded_recipients(self):
+        """Preloaded recipients are updated with one statement and no reload"""
+        service = SplitService.__new__(SplitService)
+        service.db = AsyncMock()
+        recipients = [
+            self._recipient(1, "60", "60000.00"),
+            self._recipient(2, "40", "40000.00"),
+        ]
+
+        result = await service.apply_split_adjustment(
+            uuid4(), {"1": 50, "2": 50}, recipients=recipients
+        )
+
+        service.db.execute.assert_awaited_once()
+        assert result[0].split_value == Decimal("50")
+        assert result[0].calculated_amount == Decimal("50000.00")
+        assert result[1].calculated_amount == Decimal("50000.00")
+
+    @pytest.mark.asyncio
+    async def test_rounding_goes_to_first_recipient(self):
+        """Rounding remainder is added to the first recipient"""
+        service = SplitService.__new__(SplitService)
+        service.db = AsyncMock()
+        recipients = [
+            self._recipient(1, "50", "50.00"),
+            self._recipient(2, "50", "50.01"),
+        ]
+
+        result = await service.apply_split_adjustment(
+            uuid4(), {"1": 33.33, "2": 66.67}, recipients=recipients
+        )
+
+        assert sum(r.calculated_amount for r in result) == Decimal("100.01")
+        assert result[1].calculated_amount == Decimal("66.67")
+
+
+class TestMarkAdjustmentApplyFailed:
+    """Tests for recording an adjustment that could not be applied"""
+
+    @pytest.mark.asyncio
+    async def test_moves_approved_adjustment_to_apply_failed(self):
+        db = AsyncMock()
+        service = SplitService(db)
+
+        await service.mark_adjustment_apply_failed(uuid4(), "No recipients found")
+
+        stmt = db.execute.await_args.args[0]
+        compiled = stmt.compile()
+        assert "split_adjustments" in str(compiled)
+        assert "apply_failed" in compiled.params.values()
+        assert "approved" in compiled.params.values()
+        db.commit.assert_not_awaited()
@@ -0,0 +1,92 @@
+"""Tests for T-Bank webhook signature verification and idempotency cache"""
+
+import hashlib
+import hmac
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import RedisError
+
+from app.services.bank_split.webhook_service import (
+    WebhookIdempotencyCache,
+    verify_webhook_signature,
+)
+
+
+SECRET = "webhook-secret"
+BODY = b'{"PaymentId": "123", "Status": "CONFIRMED"}'
+
+
+def _sign(body: bytes) -> str:
+    return hmac.new(SECRET.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+class TestVerifyWebhookSignature:
+    """Tests for verify_webhook_signature (no DB required)"""
+
+    def test_valid_signature(self):
+        assert verify_webhook_signature(BODY, _sign(BODY), SECRET) is True
+
+    def test_uppercase_hex_signature(self):
+        assert verify_webhook_signature(BODY, _sign(BODY).upper(), SECRET) is True
+
+    def test_tampered_body(self):
+        assert verify_webhook_signature(BODY + b" ", _sign(BODY), SECRET) is False
+
+    def test_malformed_signature(self):
+        assert verify_webhook_signature(BODY, "not-hex", SECRET) is False
+
+    def test_truncated_signature(self):
+        assert verify_webhook_signature(BODY, _sign(BODY)[:-2], SECRET) is False
+
+    def test_missing_secret_fails_closed(self):
+        assert verify_webhook_signature(BODY, _sign(BODY), "") is False
+
+
+class TestWebhookIdempotencyCache:
+    """Tests for the Redis SET NX duplicate check"""
+
+    def setup_method(self):
+        self.cache = WebhookIdempotencyCache()
+        self.cache._redis = AsyncMock()
+
+    @pytest.mark.asyncio
+    async def test_first_delivery_is_claimed(self):
+        self.cache._redis.set.return_value = True
+
+        assert await self.cache.claim("evt-1") is True
+        self.cache._redis.set.assert_awaited_once_with(
+            "webhook:tbank:evt-1", "claimed", nx=True, ex=WebhookIdempotencyCache.CLAIM_TTL_SECONDS
+        )
+
+    @pytest.mark.asyncio
+    async def test_duplicate_delivery_is_rejected(self):
+        self.cache._redis.set.return_value = None
+
+        assert await self.cache.claim("evt-1") is False
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_to_db(self):
+        self.cache._redis.set.side_effect = RedisError("down")
+
+        assert await self.cache.claim("evt-1") is True
+
+    @pytest.mark.asyncio
+    async def test_mark_done_keeps_key_for_full_ttl(self):
+        await self.cache.mark_done("evt-1")
+
+        self.cache._redis.set.assert_awaited_once_with(
+            "webhook:tbank:evt-1", "done", ex=WebhookIdempotencyCache.TTL_SECONDS
+        )
+
+    @pytest.mark.asyncio
+    async def test_in_flight_claim_is_not_done(self):
+        self.cache._redis.get.return_value = "claimed"
+
+        assert await self.cache.is_done("evt-1") is False
+
+    @pytest.mark.asyncio
+    async def test_done_marker_is_done(self):
+        self.cache._redis.get.return_value = "done"
+
+        assert await self.cache.is_done("evt-1") is True
@@ -0,0 +1 @@
+"""Contract service tests"""
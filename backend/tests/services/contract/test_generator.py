@@ -0,0 +1,71 @@
+"""Tests for ContractGenerationService template rendering"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.models.document import ContractTemplate
+from app.services.contract.generator import ContractGenerationService, _compiled_templates
+
+
+def _make_template(body: str) -> ContractTemplate:
+    template = MagicMock(spec=ContractTemplate)
+    template.id = uuid4()
+    template.updated_at = datetime(2026, 1, 25, 10, 0, 0)
+    template.template_body = body
+    return template
+
+
+class TestRenderTemplate:
+    """Tests for placeholder substitution (no DB required)"""
+
+    def setup_method(self):
+        self.service = ContractGenerationService.__new__(ContractGenerationService)
+
+    def test_substitutes_placeholders(self):
+        template = _make_template("<p>{{agent_name}} / {{client_name}}</p>")
+
+        html = self.service.render_template(template, {"agent_name": "Иванов", "client_name": "Петров"})
+
+        assert html == "<p>Иванов / Петров</p>"
+
+    def test_unknown_placeholder_kept_and_empty_value_blank(self):
+        template = _make_template("{{a}}|{{b}}|{{missing}}")
+
+        html = self.service.render_template(template, {"a": None, "b": 0})
+
+        assert html == "||{{missing}}"
+
+    def test_values_are_not_re_substituted(self):
+        template = _make_template("{{a}} {{b}}")
+
+        html = self.service.render_template(template, {"a": "{{b}}", "b": "x"})
+
+        assert html == "{{b}} x"
+
+    def test_compiled_once_per_revision(self):
+        template = _make_template("{{a}}")
+
+        self.service.render_template(template, {"a": "1"})
+        self.service.render_template(template, {"a": "2"})
+
+        assert (template.id, template.updated_at) in _compiled_templates
+
+
+class TestDealContractsStmt:
+    """Tests for the participant-scoped contract list query"""
+
+    def test_columns_only_projects_list_columns(self):
+        stmt = ContractGenerationService.deal_contracts_for_participant_stmt(
+            uuid4(), 1, columns_only=True
+        )
+
+        assert [c.name for c in stmt.selected_columns] == [
+            "id", "contract_number", "contract_type", "status",
+            "generated_at", "signed_at", "expires_at", "required_signers",
+        ]
+
+    def test_default_loads_contract_entities(self):
+        stmt = ContractGenerationService.deal_contracts_for_participant_stmt(uuid4(), 1)
+
+        assert stmt.column_descriptions[0]["entity"].__name__ == "SignedContract"
@@ -209,6 +209,7 @@ export interface SendPaymentLinkResponse {
   method: string;
   recipient: string;
   message: string;
+  status?: 'sent' | 'queued';
 }
 
 export async function sendPaymentLink(